@@ -4,17 +4,28 @@ import plotly.express as px
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent dir to path to import src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.data_collection import GitHubFetcher
-from src.llm_analysis import OllamaAnalyzer
+from src.fetch_jobs import get_job_manager
+from src.llm_analysis import OLLAMA_KEEP_ALIVE, get_analyzer, preload_model
 from src.traditional_ds import TraditionalAnalyzer
+from src.bulk_analysis import get_runner
+from src.downsampling import line_figure
+from src.report_bundle import load_bundle
+from src.tracing import get_tracer
+from src.snapshot_store import SnapshotStore, format_age
+from src.snapshot_history import get_history
+from src.team_analysis import TeamAnalyzer
+from src.contribution_calendar import get_calendar, heatmap_figure
+from src.repo_forecasting import MIN_ACTIVE_PERIODS, MIN_COMMITS, RepoForecaster
 
 st.set_page_config(page_title="AI-GitHub Dashboard", layout="wide")
 
 # --- Localization Setup ---
+@st.cache_data
 def load_translations(lang_code):
     """Loads the JSON translation file for the specified language code, falling back to English for missing keys."""
     # Load English first as base
@@ -73,6 +84,149 @@ def t(key, **kwargs):
 
 # --- End Localization Setup ---
 
+# --- Cached Data Layer ---
+# Streamlit re-runs this script on every interaction. The analyzer and everything derived
+# from it are cached per snapshot path and signature, so a new fetch (new mtime/size) misses the cache.
+# Snapshots are stored per user; the legacy single file is still read for users fetched before that.
+LEGACY_DATA_PATH = "data/raw_data.json"
+snapshot_store = SnapshotStore()
+
+def resolve_data_path(username):
+    path = snapshot_store.path_for(username)
+    if not os.path.exists(path) and os.path.exists(LEGACY_DATA_PATH):
+        return LEGACY_DATA_PATH
+    return path
+
+# Bundles written by generate_reports.py; used instead of recomputing when they match the snapshot
+REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
+
+def traced_cache(name):
+    """Counts lookups of a cached function; the function body counts its own misses."""
+    def wrap(cached_fn):
+        def lookup(*args):
+            get_tracer().incr("dashboard_cache_lookups_total", fn=name)
+            return cached_fn(*args)
+        lookup.clear = cached_fn.clear
+        return lookup
+    return wrap
+
+def cache_miss(name):
+    get_tracer().incr("dashboard_cache_misses_total", fn=name)
+
+def snapshot_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+@traced_cache("analyzer")
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_analyzer(data_path, signature):
+    cache_miss("analyzer")
+    analyzer = TraditionalAnalyzer(data_path=data_path)
+    if not analyzer.load_data():
+        return None
+    return analyzer
+
+@traced_cache("bundle")
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_bundle(data_path, signature):
+    cache_miss("bundle")
+    login = load_analyzer(data_path, signature).profile_data.get("login", "")
+    if not login:
+        return None
+    return load_bundle(os.path.join(REPORTS_DIR, login.lower()), snapshot_path=data_path)
+
+@traced_cache("basic_stats")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_basic_stats(data_path, signature):
+    cache_miss("basic_stats")
+    bundle = cached_bundle(data_path, signature)
+    if bundle:
+        return bundle["manifest"]["stats"]
+    return load_analyzer(data_path, signature).get_basic_stats()
+
+@traced_cache("user_stats")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_user_stats(data_path, signature):
+    cache_miss("user_stats")
+    bundle = cached_bundle(data_path, signature)
+    if bundle:
+        return bundle["manifest"]["user_stats"]
+    return load_analyzer(data_path, signature).get_user_stats()
+
+@traced_cache("timeline_events")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_timeline_events(data_path, signature):
+    cache_miss("timeline_events")
+    bundle = cached_bundle(data_path, signature)
+    if bundle:
+        return bundle["manifest"]["timeline"]
+    return load_analyzer(data_path, signature).get_timeline_events()
+
+@traced_cache("health_table")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_health_table(data_path, signature):
+    cache_miss("health_table")
+    bundle = cached_bundle(data_path, signature)
+    if bundle:
+        return bundle["health"]
+    return load_analyzer(data_path, signature).get_repo_health_table()
+
+@traced_cache("languages_over_time")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_languages_over_time(data_path, signature):
+    cache_miss("languages_over_time")
+    return load_analyzer(data_path, signature).get_languages_over_time()
+
+@traced_cache("repo_forecasts")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_repo_forecasts(data_path, signature):
+    cache_miss("repo_forecasts")
+    return load_analyzer(data_path, signature).forecast_by_repo()
+
+@traced_cache("hourly_counts")
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_hourly_counts(data_path, signature):
+    cache_miss("hourly_counts")
+    hours = load_analyzer(data_path, signature).commits_df['date'].dt.hour
+    return hours.value_counts().reindex(range(24), fill_value=0)
+
+# History snapshots never change once recorded, so this cache is not cleared on fetch
+@traced_cache("history_diff")
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_history_diff(username, old_id, new_id):
+    cache_miss("history_diff")
+    old, new = TraditionalAnalyzer(), TraditionalAnalyzer()
+    if not (old.load_history(username, old_id) and new.load_history(username, new_id)):
+        return None
+    return TraditionalAnalyzer.diff_snapshots(old, new)
+
+# Keyed by every snapshot's (path, signature), so any re-fetch recomputes the team table
+@traced_cache("team_table")
+@st.cache_data(max_entries=2, show_spinner=False)
+def cached_team_table(snapshot_keys):
+    cache_miss("team_table")
+    return TeamAnalyzer([path for path, _ in snapshot_keys]).compute()
+
+@st.cache_resource
+def persona_executor():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="persona")
+
+def clear_snapshot_caches():
+    for cached in (load_analyzer, cached_bundle, cached_basic_stats, cached_user_stats, cached_timeline_events, cached_health_table, cached_hourly_counts,
+                   cached_languages_over_time, cached_repo_forecasts):
+        cached.clear()
+
+# --- End Cached Data Layer ---
+
+# Optional continuous export of timings for scraping (Prometheus textfile collector) or log shipping
+TRACE_EXPORT_DIR = os.getenv("TRACE_EXPORT_DIR")
+if TRACE_EXPORT_DIR:
+    get_tracer().export_prometheus(os.path.join(TRACE_EXPORT_DIR, "dashboard.prom"))
+    get_tracer().export_jsonl(os.path.join(TRACE_EXPORT_DIR, "spans.jsonl"))
+
 
 st.title(t("main_title"))
 
@@ -80,6 +234,13 @@ st.title(t("main_title"))
 st.sidebar.header(t("sidebar_header"))
 username = st.sidebar.text_input(t("username_label"), value=os.getenv("GITHUB_USERNAME", ""))
 token = st.sidebar.text_input(t("token_label"), value=os.getenv("GITHUB_TOKEN", ""), type="password")
+username = username.strip()
+data_path = None
+if username:
+    try:
+        data_path = resolve_data_path(username)
+    except ValueError:
+        st.sidebar.error(f"'{username}' is not a valid GitHub username.")
 
 st.sidebar.caption("ℹ️ **Note:** Using a token ensures 100% accurate data and prevents missing repositories due to rate limits.")
 
@@ -94,33 +255,80 @@ with st.sidebar.expander("❓ How to get a GitHub Token?"):
     7. Copy the token and paste it here!
     """)
 
-if st.sidebar.button(t("fetch_data_button")):
+st.sidebar.header("🤖 Ollama")
+ollama_model = st.sidebar.selectbox(t("select_model_label"), ["llama3.1", "mistral"])
+KEEP_ALIVE_OPTIONS = ["5m", "30m", "1h", "-1"]
+if OLLAMA_KEEP_ALIVE not in KEEP_ALIVE_OPTIONS:
+    KEEP_ALIVE_OPTIONS.insert(0, OLLAMA_KEEP_ALIVE)
+keep_alive = st.sidebar.selectbox(
+    "Keep model loaded for",
+    options=KEEP_ALIVE_OPTIONS,
+    index=KEEP_ALIVE_OPTIONS.index(OLLAMA_KEEP_ALIVE),
+    format_func=lambda x: "Forever" if x == "-1" else x
+)
+# Warm the selected model in the background so the first LLM request does not pay the load time
+preload_model(ollama_model, keep_alive=keep_alive)
+
+timing = get_analyzer(ollama_model, keep_alive=keep_alive).get_timing_report()
+if timing["last_load_seconds"] is not None or timing["calls"]:
+    st.sidebar.caption(
+        f"Model load: {timing['last_load_seconds'] or 0:.2f}s · "
+        f"Inference: {timing['avg_inference_seconds']:.2f}s avg over {timing['calls']} calls"
+    )
+
+fetch_jobs = get_job_manager()
+
+if st.sidebar.button(t("fetch_data_button"), disabled=data_path is None):
     if not token:
         st.sidebar.warning("⚠️ No token provided. Rate limit is 60 requests/hour. You may encounter errors.")
-    
-    progress_bar = st.sidebar.progress(0)
-    status_text = st.sidebar.empty()
-
-    def update_progress(count, total, current_repo):
-        progress = count / total
-        progress_bar.progress(progress)
-        status_text.text(f"Fetching {count}/{total}: {current_repo}")
-
-    with st.spinner(t("fetching_spinner")):
-        fetcher = GitHubFetcher(username=username, token=token)
-        data = fetcher.fetch_all_data(progress_callback=update_progress)
-        
-        # Clear progress bar on completion
-        progress_bar.empty()
-        status_text.empty()
-
-        if data:
-            fetcher.save_data(data)
-            st.sidebar.success(t("fetch_success"))
-        else:
-            st.sidebar.error(t("fetch_error") + " (Check terminal for details, likely rate limit)")
-
-if not username:
+    # Runs in a background thread; the previous snapshot stays browsable until the new one is swapped in
+    job = fetch_jobs.start(username, token=token, filename=snapshot_store.path_for(username))
+    st.session_state["fetch_job_id"] = job.job_id
+
+fetch_job = fetch_jobs.get(st.session_state.get("fetch_job_id"))
+
+@st.fragment(run_every=1 if fetch_job is not None and fetch_job.is_active() else None)
+def fetch_status():
+    job = fetch_jobs.get(st.session_state.get("fetch_job_id"))
+    if job is None:
+        return
+    state = job.state
+    if state["status"] in ("queued", "running"):
+        label = f"Fetching {state['count']}/{state['total']}: {state['current_repo']}" if state["total"] else t("fetching_spinner")
+        st.progress(state["fraction"], text=label)
+        activity = state["activity"]
+        if activity and activity["total_commits"]:
+            st.caption(f"So far: {activity['total_commits']} commits · longest streak {activity['longest_streak']} days · "
+                       f"{activity['chronotype']} · mostly {activity['top_language']}")
+        st.caption(f"Job `{state['job_id']}`")
+        if st.button("Cancel fetch"):
+            job.cancel()
+        return
+
+    # Report the outcome once, then reload the whole page if a new snapshot landed
+    del st.session_state["fetch_job_id"]
+    if state["status"] == "finished":
+        clear_snapshot_caches()
+        st.session_state["fetch_message"] = ("success", t("fetch_success"))
+    elif state["status"] == "cancelled":
+        st.session_state["fetch_message"] = ("info", "Fetch cancelled. Keeping the previous snapshot.")
+    else:
+        st.session_state["fetch_message"] = ("error", t("fetch_error") + f" ({state['error']})")
+    st.rerun(scope="app")
+
+with st.sidebar:
+    fetch_status()
+    if "fetch_message" in st.session_state:
+        kind, message = st.session_state.pop("fetch_message")
+        getattr(st, kind)(message)
+
+stored_snapshots = snapshot_store.index()
+if stored_snapshots:
+    with st.sidebar.expander(f"📚 Stored snapshots ({len(stored_snapshots)})"):
+        for entry in stored_snapshots:
+            st.caption(f"**{entry['username']}** · {format_age(entry['age_seconds'])} old · {entry['size'] / 1024:.0f} KB")
+
+if not data_path:
     st.info(t("enter_username_info"))
     if not token:
         st.info("💡 **Tip:** Add a GitHub Token in the sidebar to increase your rate limit from 60 to 5000 requests/hour.")
@@ -128,8 +336,9 @@ if not username:
 
 try:
     # Load Data
-    analyzer = TraditionalAnalyzer()
-    data_loaded = analyzer.load_data()
+    signature = snapshot_signature(data_path)
+    analyzer = load_analyzer(data_path, signature) if signature else None
+    data_loaded = analyzer is not None
     
     # Check if data corresponds to the current user
     if data_loaded:
@@ -143,7 +352,7 @@ try:
         st.warning(t("no_data_warning"))
         st.stop()
 
-    stats = analyzer.get_basic_stats()
+    stats = cached_basic_stats(data_path, signature)
 
     # Overview Section
     st.header(t("overview_header"))
@@ -153,349 +362,561 @@ try:
     c3.metric(t("metric_commits_tracked"), stats.get("total_commits_tracked", 0))
 
     # Tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    # on_change="rerun" makes tab.open tell us which tab is selected, so only that tab's content is computed
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
         t("tab_repos"), 
         t("tab_languages"), 
         t("tab_llm"), 
         t("tab_forecasting"), 
         t("tab_model_comparison"),
-        "🎉 GitHub Replay"
-    ])
+        "🎉 GitHub Replay",
+        "⏱️ Performance",
+        "👥 Team"
+    ], key="main_tabs", on_change="rerun")
 
     with tab1:
-        st.subheader(t("subheader_clustering"))
+        if tab1.open:
+            st.subheader(t("subheader_clustering"))
         
-        # --- Repo Health & Tech Stack ---
-        if analyzer.repos_df is not None and not analyzer.repos_df.empty:
-            st.markdown("### 🏆 Repository Health & Tech Stack")
-            
-            # Use columns for a grid layout of repo cards
-            # We'll show top 10 most recent or starred to avoid clutter, or a list
-            # Let's show a list of cards
+            # --- Repo Health & Tech Stack ---
+            if analyzer.repos_df is not None and not analyzer.repos_df.empty:
+                st.markdown("### 🏆 Repository Health & Tech Stack")
             
-            # Need to get the full objects to pass to helper functions
-            # Since repos_df has 'files' now (we updated load_data), we can construct it
-            repos = analyzer.repos_df.to_dict('records')
-            
-            for repo in repos:
-                 # Reconstruct repo_data structure expected by functions
-                 # Structure: {"details": {"files": [...]}}
-                 repo_data_struct = {"details": {"files": repo.get("files", [])}}
-                 
-                 health = analyzer.calculate_health_score(repo_data_struct)
-                 stack = analyzer.detect_tech_stack(repo_data_struct)
-                 
-                 # Grade Color
-                 grade_color = "#2ea043" if health['grade'] == 'A' else "#e3b341" if health['grade'] == 'B' else "#da3633"
-                 
-                 with st.container():
-                     c1, c2, c3 = st.columns([2, 1, 1])
-                     with c1:
-                         st.markdown(f"**{repo['name']}**")
-                         st.caption(f"{repo.get('description', '')}")
-                     with c2:
-                         st.markdown(f"Health: <span style='color:{grade_color}; font-weight:bold; border:1px solid {grade_color}; padding:2px 6px; border-radius:4px;'>{health['grade']}</span>", unsafe_allow_html=True)
-                         if health['missing']:
-                             st.caption(f"Missing: {', '.join(health['missing'][:2])}")
-                     with c3:
-                         if stack:
-                            st.write(" ".join([f"`{s}`" for s in stack]))
-                         else:
-                            st.caption("No stack detected")
-                     st.divider()
-
-        else:
-            st.info(t("clustering_info_no_data"))
+                health_table = cached_health_table(data_path, signature)
+
+                f1, f2, f3 = st.columns(3)
+                grade_filter = f1.multiselect("Grade", ["A", "B", "C", "D"])
+                stack_filter = f2.multiselect("Stack", sorted({s for stack in health_table["stack"] for s in stack}))
+                language_filter = f3.multiselect("Language", sorted(health_table["language"].unique()))
+
+                o1, o2, o3 = st.columns(3)
+                sort_labels = {"name": "Name", "grade": "Grade", "stars": "Stars", "language": "Language"}
+                sort_by = o1.selectbox("Sort by", list(sort_labels.keys()), format_func=lambda x: sort_labels[x])
+                descending = o2.toggle("Descending", value=False)
+                view_mode = o3.radio("View", ["Cards", "Compact table"], horizontal=True)
+
+                if view_mode == "Compact table":
+                    # One dataframe element for every matching repo
+                    filtered, total = analyzer.query_repo_health(
+                        health_table, grade_filter, stack_filter, language_filter, sort_by, not descending, page=1, page_size=len(health_table)
+                    )
+                    st.caption(f"{total} repositories")
+                    st.dataframe(
+                        filtered.assign(missing=filtered["missing"].str.join(", "), stack=filtered["stack"].str.join(", ")),
+                        hide_index=True
+                    )
+                else:
+                    page_size = 20
+                    _, total = analyzer.query_repo_health(health_table, grade_filter, stack_filter, language_filter, page_size=len(health_table))
+                    n_pages = max(1, -(-total // page_size))
+                    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+                    page_rows, total = analyzer.query_repo_health(
+                        health_table, grade_filter, stack_filter, language_filter, sort_by, not descending, page=page, page_size=page_size
+                    )
+                    st.caption(f"Showing {len(page_rows)} of {total} repositories")
+
+                    for repo in page_rows.to_dict('records'):
+                         # Grade Color
+                         grade_color = "#2ea043" if repo['grade'] == 'A' else "#e3b341" if repo['grade'] == 'B' else "#da3633"
+
+                         with st.container():
+                             c1, c2, c3 = st.columns([2, 1, 1])
+                             with c1:
+                                 st.markdown(f"**{repo['name']}**")
+                                 st.caption(f"{repo.get('description', '')}")
+                             with c2:
+                                 st.markdown(f"Health: <span style='color:{grade_color}; font-weight:bold; border:1px solid {grade_color}; padding:2px 6px; border-radius:4px;'>{repo['grade']}</span>", unsafe_allow_html=True)
+                                 if repo['missing']:
+                                     st.caption(f"Missing: {', '.join(repo['missing'][:2])}")
+                             with c3:
+                                 if repo['stack']:
+                                    st.write(" ".join([f"`{s}`" for s in repo['stack']]))
+                                 else:
+                                    st.caption("No stack detected")
+                             st.divider()
+
+                # --- Changes over time ---
+                history_entries = get_history().list(username)
+                if len(history_entries) >= 2:
+                    with st.expander(f"🕰️ Changes over time ({len(history_entries)} snapshots)"):
+                        snapshot_ids = [e["id"] for e in history_entries]
+                        h1, h2 = st.columns(2)
+                        old_id = h1.selectbox("From", snapshot_ids, index=len(snapshot_ids) - 2)
+                        new_id = h2.selectbox("To", snapshot_ids, index=len(snapshot_ids) - 1)
+                        diff = cached_history_diff(username, old_id, new_id)
+                        if diff is not None:
+                            counts = diff["status"].value_counts()
+                            st.caption(" · ".join(f"{counts.get(s, 0)} {s}" for s in ("added", "removed", "changed", "unchanged")))
+                            st.dataframe(diff[diff["status"] != "unchanged"], hide_index=True)
+
+            else:
+                st.info(t("clustering_info_no_data"))
 
     with tab2:
-        st.subheader(t("subheader_language"))
-        langs = stats.get("top_languages", {})
-        if langs:
-            fig = px.pie(values=list(langs.values()), names=list(langs.keys()), title=t("language_pie_title"))
-            st.plotly_chart(fig)
-        else:
-            st.info(t("language_info_no_data"))
+        if tab2.open:
+            st.subheader(t("subheader_language"))
+            measure = st.radio("Count by", ["Repositories", "Bytes of code"], horizontal=True)
+            # Bytes cover every language in every repo, not just each repo's primary language
+            langs = stats.get("top_languages", {}) if measure == "Repositories" else stats.get("language_bytes", {})
+            if langs:
+                fig = px.pie(values=list(langs.values()), names=list(langs.keys()), title=t("language_pie_title"))
+                st.plotly_chart(fig)
+
+                if measure == "Bytes of code":
+                    over_time = cached_languages_over_time(data_path, signature)
+                    if not over_time.empty:
+                        top = list(langs)[:8]
+                        fig = px.area(over_time[[c for c in top if c in over_time]], title="Code by language, by repo creation year",
+                                      labels={"index": "Year", "value": "Bytes", "variable": "Language"})
+                        st.plotly_chart(fig)
+            else:
+                st.info(t("language_info_no_data"))
 
     with tab3:
-        st.subheader(t("subheader_llm"))
-        ollama_model = st.selectbox(t("select_model_label"), ["llama3.1", "mistral"])
-        llm = OllamaAnalyzer(model_name=ollama_model)
-
-        if st.button(t("analyze_sentiment_button")):
-            if analyzer.commits_df is not None and not analyzer.commits_df.empty:
-                sample_commit = analyzer.commits_df.iloc[0]['message']
-                st.write(f"**Sample Commit:** {sample_commit}")
-                with st.spinner(t("sentiment_spinner")):
-                    sentiment = llm.analyze_sentiment(sample_commit)
-                    st.write(f"**Sentiment:** {sentiment}")
-            else:
-                st.info(t("no_commits_info"))
+        if tab3.open:
+            st.subheader(t("subheader_llm"))
+            use_fast_path = st.checkbox("⚡ Try fast local classifiers before the LLM", value=True)
+            llm = get_analyzer(ollama_model, use_fast_path=use_fast_path, keep_alive=keep_alive)
+
+            if st.button(t("analyze_sentiment_button")):
+                if analyzer.commits_df is not None and not analyzer.commits_df.empty:
+                    sample_commit = analyzer.commits_df.iloc[0]['message']
+                    st.write(f"**Sample Commit:** {sample_commit}")
+                    with st.spinner(t("sentiment_spinner")):
+                        sentiment = llm.analyze_sentiment(sample_commit)
+                        st.write(f"**Sentiment:** {sentiment}")
+                else:
+                    st.info(t("no_commits_info"))
 
-        st.markdown(t("skill_extraction_header"))
-        if analyzer.repos_df is not None and not analyzer.repos_df.empty:
-            repo_names = analyzer.repos_df['name'].tolist()
-            selected_repo = st.selectbox(t("select_repo_label"), repo_names, key="skill_repo")
+            st.markdown(t("skill_extraction_header"))
+            if analyzer.repos_df is not None and not analyzer.repos_df.empty:
+                repo_names = analyzer.repos_df['name'].tolist()
+                selected_repo = st.selectbox(t("select_repo_label"), repo_names, key="skill_repo")
             
-            if st.button(t("extract_skills_button")):
-                repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
-                readme_text = repo_data.get('readme_content', "")
+                if st.button(t("extract_skills_button")):
+                    repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
+                    readme_text = repo_data.get('readme_content', "")
                 
-                if readme_text:
-                    with st.spinner(t("extracting_spinner", repo=selected_repo)):
-                        skills = llm.extract_skills(readme_text)
-                        if skills and skills.startswith("Error:"):
-                            st.error(skills)
-                        elif skills:
-                            st.success(t("skills_extracted_success"))
-                            st.markdown(f"### 🛠️ Detected Skills\n{skills}")
-                        else:
-                            st.warning(t("skills_extraction_failed"))
+                    if readme_text:
+                        with st.spinner(t("extracting_spinner", repo=selected_repo)):
+                            skills = llm.extract_skills(readme_text)
+                            if skills and skills.startswith("Error:"):
+                                st.error(skills)
+                            elif skills:
+                                st.success(t("skills_extracted_success"))
+                                st.markdown(f"### 🛠️ Detected Skills\n{skills}")
+                            else:
+                                st.warning(t("skills_extraction_failed"))
 
-                else:
-                    st.warning(t("no_readme_warning"))
+                    else:
+                        st.warning(t("no_readme_warning"))
             
-            st.divider()
-            st.subheader("🧠 AI README Improver")
-            st.markdown("Select a repository above to analyze its README for improvements.")
+                st.divider()
+                st.subheader("🧠 AI README Improver")
+                st.markdown("Select a repository above to analyze its README for improvements.")
             
-            if st.button("🚀 Improve My README"):
-                repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
-                readme_text = repo_data.get('readme_content', "")
-                if readme_text:
-                    with st.spinner(f"Analyzing README for {selected_repo}..."):
-                        tips = llm.analyze_readme_quality(readme_text)
-                        if tips.startswith("Error:"):
-                             st.error(tips)
-                        else:
-                             st.markdown("### 📝 Improvement Checklist")
-                             st.markdown(tips)
-                else:
-                    st.warning("No README found to improve.")
+                if st.button("🚀 Improve My README"):
+                    repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
+                    readme_text = repo_data.get('readme_content', "")
+                    if readme_text:
+                        with st.spinner(f"Analyzing README for {selected_repo}..."):
+                            tips = llm.analyze_readme_quality(readme_text)
+                            if tips.startswith("Error:"):
+                                 st.error(tips)
+                            else:
+                                 st.markdown("### 📝 Improvement Checklist")
+                                 st.markdown(tips)
+                    else:
+                        st.warning("No README found to improve.")
+
+                st.divider()
+                st.subheader("📦 Bulk Analysis")
+                st.markdown("Classify topics, extract skills and review READMEs for every repository in the background. Unchanged READMEs are skipped.")
+                runner = get_runner(llm, snapshot_path=analyzer.data_path)
+                b1, b2 = st.columns(2)
+                if b1.button("Analyze all repositories", disabled=runner.is_running()):
+                    runner.start(analyzer.repos_df)
+                if b2.button("Cancel", disabled=not runner.is_running()):
+                    runner.cancel()
+
+                # Poll only while a job is running
+                @st.fragment(run_every=2 if runner.is_running() else None)
+                def bulk_progress():
+                    progress = runner.get_progress()
+                    if progress["status"] == "running":
+                        st.progress(progress["fraction"], text=f"{progress['done'] + progress['skipped']}/{progress['total']} repositories · {progress['current'] or ''}")
+                    elif progress["status"] in ("finished", "cancelled"):
+                        st.caption(f"Bulk run {progress['status']}: {progress['done']} analyzed, {progress['skipped']} unchanged, {progress['failed']} failed")
+                    bulk_results = runner.get_results()
+                    if bulk_results:
+                        st.dataframe(pd.DataFrame.from_dict(bulk_results, orient="index"))
+
+                bulk_progress()
 
-        else:
-            st.info(t("clustering_info_no_data"))
+            else:
+                st.info(t("clustering_info_no_data"))
 
-    with tab4:
-        st.subheader(t("subheader_forecasting"))
-        if st.button(t("generate_forecast_button")):
-            with st.spinner(t("forecasting_spinner")):
-                try:
-                    forecast = analyzer.forecast_activity()
-                    if forecast is not None:
-                        fig = px.line(forecast, x='ds', y='yhat', title=t("forecast_title"))
-                        # Add confidence intervals
-                        fig.add_scatter(x=forecast['ds'], y=forecast['yhat_lower'], mode='lines', line=dict(width=0), showlegend=False)
-                        fig.add_scatter(x=forecast['ds'], y=forecast['yhat_upper'], fill='tonexty', mode='lines', line=dict(width=0), showlegend=False)
-                        st.plotly_chart(fig)
-                    else:
-                        st.warning(t("forecast_warning_not_enough"))
-                except Exception as e:
-                    st.error(t("forecast_error", error=str(e)))
+            tier_report = llm.get_tier_report()
+            if tier_report:
+                with st.expander("⚡ Fast path usage"):
+                    st.dataframe(pd.DataFrame(tier_report).T)
 
-    with tab5:
-        st.subheader(t("subheader_comparison"))
-        prompt = st.text_area(t("test_prompt_label"), "Summarize the coding style based on these commits...")
-        if st.button(t("compare_button")):
-            with st.spinner(t("comparison_spinner")):
-                results = llm.compare_models(prompt)
-                for model_name, metrics in results.items():
-                    st.write(f"### {model_name}")
-                    if "error" in metrics:
-                        st.error(metrics["error"])
-                    else:
-                        st.write(f"**Time:** {metrics['time']:.2f}s")
-                        st.write(f"**Response:** {metrics['response']}")
-                        st.divider()
+            token_report = llm.get_token_report()
+            if token_report:
+                with st.expander("🔢 Tokens per task"):
+                    st.caption("Output is capped per task (num_predict); \"truncated\" counts answers that hit the cap.")
+                    st.dataframe(pd.DataFrame(token_report).T)
 
-    with tab6:
-        st.header("🎵 GitHub Replay 2025")
-        
-        user_stats = analyzer.get_user_stats()
-        
-        # Generator Title logic
-        if "user_title" not in st.session_state:
-            with st.spinner("Generating your AI Developer Persona..."):
-                llm_replay = OllamaAnalyzer(model_name=ollama_model if 'ollama_model' in locals() else "llama3.1")
-                st.session_state["user_title"] = llm_replay.generate_user_title(user_stats)
-
-        # --- Custom CSS for Cards ---
-        st.markdown("""
-        <style>
-        .replay-card {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-            margin-bottom: 20px;
-        }
-        .metric-value {
-            font-size: 2em;
-            font-weight: bold;
-            color: #58a6ff;
-        }
-        .metric-label {
-            color: #8b949e;
-            font-size: 1em;
-        }
-        .persona-title {
-            font-size: 2.5em;
-            background: -webkit-linear-gradient(45deg, #FF0080, #7928CA);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            font-weight: bold;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # --- Persona Section ---
-        st.markdown(f"""
-        <div class="replay-card">
-            <div class="metric-label">Your AI Developer Persona</div>
-            <div class="persona-title">{st.session_state['user_title']}</div>
-            <div style="margin-top: 10px; font-size: 1.2em;">{user_stats.get('chronotype', 'Day Walker')}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # --- Metrics Grid ---
-        c1, c2, c3, c4 = st.columns(4)
-        with c1:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('total_commits', 0)}</div>
-                <div class="metric-label">Total Commits</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c2:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('longest_streak', 0)} Days</div>
-                <div class="metric-label">Longest Streak</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c3:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('top_language', 'Unknown')}</div>
-                <div class="metric-label">Top Language</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c4:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('most_active_month', 'Unknown')[:3]}</div>
-                <div class="metric-label">Peak Month</div>
-            </div>
-            """, unsafe_allow_html=True)
+    with tab4:
+        if tab4.open:
+            st.subheader(t("subheader_forecasting"))
+            bundle = cached_bundle(data_path, signature)
+            precomputed = bundle["forecast"] if bundle and not bundle["forecast"].empty else None
+            if precomputed is not None or st.button(t("generate_forecast_button")):
+                with st.spinner(t("forecasting_spinner")):
+                    try:
+                        forecast = precomputed if precomputed is not None else analyzer.forecast_activity()
+                        if forecast is not None:
+                            # Downsampled server-side with confidence band; switches to WebGL for long histories
+                            fig = line_figure(forecast, 'ds', 'yhat', title=t("forecast_title"), band=('yhat_lower', 'yhat_upper'))
+                            st.plotly_chart(fig)
+                        else:
+                            st.warning(t("forecast_warning_not_enough"))
+                    except Exception as e:
+                        st.error(t("forecast_error", error=str(e)))
 
-        st.divider()
+            st.divider()
+            st.subheader("📦 Per-repository forecasts")
+            st.caption(f"Weekly commits per repository, 12 weeks ahead. Repositories with fewer than {MIN_COMMITS} commits "
+                       f"or commits in fewer than {MIN_ACTIVE_PERIODS} different weeks are skipped.")
+            if st.toggle("Forecast each repository"):
+                with st.spinner(t("forecasting_spinner")):
+                    repo_forecasts = cached_repo_forecasts(data_path, signature)
+                if repo_forecasts.empty:
+                    st.warning("No repository has enough commit history for its own forecast.")
+                else:
+                    outlook = RepoForecaster.outlook(repo_forecasts)
+                    st.markdown("**Going quiet**: largest expected drop in weekly commits")
+                    st.dataframe(outlook.head(10))
+                    selected_repos = st.multiselect("Repositories", sorted(repo_forecasts["repo_name"].unique()),
+                                                    default=outlook["repo_name"].head(3).tolist())
+                    selected = repo_forecasts[repo_forecasts["repo_name"].isin(selected_repos)]
+                    colors = dict(zip(selected_repos, px.colors.qualitative.Plotly * len(selected_repos)))
+                    fig = px.line(selected, x="ds", y="yhat", color="repo_name", color_discrete_map=colors,
+                                  labels={"ds": "week", "yhat": "commits"})
+                    fig.add_traces(px.scatter(selected.dropna(subset=["y"]), x="ds", y="y", color="repo_name",
+                                              color_discrete_map=colors).update_traces(showlegend=False, marker_size=4).data)
+                    st.plotly_chart(fig)
 
-        # --- Visualizations ---
-        col_viz1, col_viz2 = st.columns(2)
-        
-        with col_viz1:
-             st.subheader("🕑 Daily Activity Pattern")
-             if analyzer.commits_df is not None and not analyzer.commits_df.empty:
-                 hourly_counts = analyzer.commits_df['date'].dt.hour.value_counts().sort_index()
-                 st.bar_chart(hourly_counts)
-             else:
-                 st.info("No commit data available.")
-
-        with col_viz2:
-            st.subheader("💻 Top Languages")
-            langs = user_stats.get("top_languages", {}) # Note: get_user_stats currently doesn't return full dict, need to fix or use analyzer.get_basic_stats
-            # Actually get_basic_stats has it.
-            basic_stats = analyzer.get_basic_stats()
-            top_langs = basic_stats.get("top_languages", {})
-            if top_langs:
-                st.bar_chart(pd.Series(top_langs).head(5))
-            else:
-                st.info("No language data.")
-        
-        if st.button("Generate Replay"):
-             st.balloons()
+    with tab5:
+        if tab5.open:
+            st.subheader(t("subheader_comparison"))
+            prompt = st.text_area(t("test_prompt_label"), "Summarize the coding style based on these commits...")
+            if st.button(t("compare_button")):
+                with st.spinner(t("comparison_spinner")):
+                    results = get_analyzer(ollama_model, keep_alive=keep_alive).compare_models(prompt)
+                    for model_name, metrics in results.items():
+                        st.write(f"### {model_name}")
+                        if "error" in metrics:
+                            st.error(metrics["error"])
+                        else:
+                            st.write(f"**Time:** {metrics['time']:.2f}s (model load {metrics.get('load_time', 0):.2f}s)")
+                            st.write(f"**Response:** {metrics['response']}")
+                            st.divider()
 
-        st.divider()
-        st.subheader("🚀 My GitHub Journey")
+    with tab6:
+        if tab6.open:
+            st.header("🎵 GitHub Replay 2025")
         
-        timeline_events = analyzer.get_timeline_events()
+            user_stats = cached_user_stats(data_path, signature)
         
-        if timeline_events:
-            # Custom HTML for Timeline
-            timeline_html = """
+            # Generator Title logic: runs in the background so the rest of the tab renders immediately
+            bundle = cached_bundle(data_path, signature)
+            if "user_title" not in st.session_state and bundle and bundle["manifest"].get("persona"):
+                st.session_state["user_title"] = bundle["manifest"]["persona"]
+            if "user_title" not in st.session_state and "user_title_future" not in st.session_state:
+                llm_replay = get_analyzer(ollama_model, keep_alive=keep_alive)
+                st.session_state["user_title_future"] = persona_executor().submit(llm_replay.generate_user_title, user_stats)
+
+            # --- Custom CSS for Cards ---
+            st.markdown("""
             <style>
-            .timeline {
-                position: relative;
-                max-width: 1200px;
-                margin: 0 auto;
-            }
-            .timeline::after {
-                content: '';
-                position: absolute;
-                width: 6px;
-                background-color: #30363d;
-                top: 0;
-                bottom: 0;
-                left: 31px;
-                margin-left: -3px;
-            }
-            .container {
-                padding: 10px 40px;
-                position: relative;
-                background-color: inherit;
-                width: 100%;
-            }
-            .container::after {
-                content: '';
-                position: absolute;
-                width: 25px;
-                height: 25px;
-                right: -17px;
-                background-color: #58a6ff;
-                border: 4px solid #0d1117;
-                top: 15px;
-                border-radius: 50%;
-                z-index: 1;
-                left: 18px;
-            }
-            .content {
-                padding: 20px 30px;
-                background-color: #161b22;
-                position: relative;
-                border-radius: 6px;
+            .replay-card {
+                background-color: #0d1117;
                 border: 1px solid #30363d;
+                border-radius: 10px;
+                padding: 20px;
+                text-align: center;
+                margin-bottom: 20px;
             }
-            .date {
-                font-size: 0.85em;
+            .metric-value {
+                font-size: 2em;
+                font-weight: bold;
+                color: #58a6ff;
+            }
+            .metric-label {
                 color: #8b949e;
-                margin-bottom: 5px;
+                font-size: 1em;
             }
-            .title {
-                font-size: 1.1em;
+            .persona-title {
+                font-size: 2.5em;
+                background: -webkit-linear-gradient(45deg, #FF0080, #7928CA);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
                 font-weight: bold;
-                color: #c9d1d9;
             }
             </style>
-            <div class="timeline">
-            """
-            
-            for event in timeline_events:
-                timeline_html += f"""
-                <div class="container">
-                    <div class="content">
-                        <div class="date">{event['date']}</div>
-                        <div class="title">{event['icon']} {event['title']}</div>
-                    </div>
+            """, unsafe_allow_html=True)
+
+            # --- Persona Section ---
+            persona_pending = "user_title" not in st.session_state
+
+            @st.fragment(run_every=1 if persona_pending else None)
+            def persona_card():
+                future = st.session_state.get("user_title_future")
+                if future is not None and future.done():
+                    st.session_state["user_title"] = future.result()
+                    del st.session_state["user_title_future"]
+                    if persona_pending:
+                        # A full rerun redefines the fragment without the polling timer
+                        st.rerun(scope="app")
+                title = st.session_state.get("user_title", "✨ Summoning your persona...")
+                st.markdown(f"""
+                <div class="replay-card">
+                    <div class="metric-label">Your AI Developer Persona</div>
+                    <div class="persona-title">{title}</div>
+                    <div style="margin-top: 10px; font-size: 1.2em;">{user_stats.get('chronotype', 'Day Walker')}</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            persona_card()
+
+            # --- Metrics Grid ---
+            c1, c2, c3, c4 = st.columns(4)
+            with c1:
+                st.markdown(f"""
+                <div class="replay-card">
+                    <div class="metric-value">{user_stats.get('total_commits', 0)}</div>
+                    <div class="metric-label">Total Commits</div>
+                </div>
+                """, unsafe_allow_html=True)
+            with c2:
+                st.markdown(f"""
+                <div class="replay-card">
+                    <div class="metric-value">{user_stats.get('longest_streak', 0)} Days</div>
+                    <div class="metric-label">Longest Streak</div>
+                </div>
+                """, unsafe_allow_html=True)
+            with c3:
+                st.markdown(f"""
+                <div class="replay-card">
+                    <div class="metric-value">{user_stats.get('top_language', 'Unknown')}</div>
+                    <div class="metric-label">Top Language</div>
                 </div>
+                """, unsafe_allow_html=True)
+            with c4:
+                st.markdown(f"""
+                <div class="replay-card">
+                    <div class="metric-value">{user_stats.get('most_active_month', 'Unknown')[:3]}</div>
+                    <div class="metric-label">Peak Month</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.divider()
+
+            # --- Visualizations ---
+            col_viz1, col_viz2 = st.columns(2)
+        
+            with col_viz1:
+                 st.subheader("🕑 Daily Activity Pattern")
+                 if analyzer.commits_df is not None and not analyzer.commits_df.empty:
+                     # Always 24 bins regardless of history length
+                     st.bar_chart(cached_hourly_counts(data_path, signature))
+                 else:
+                     st.info("No commit data available.")
+
+            with col_viz2:
+                st.subheader("💻 Top Languages")
+                # get_user_stats only has the single top language; the full counts are in the overview stats
+                top_langs = stats.get("top_languages", {})
+                if top_langs:
+                    st.bar_chart(pd.Series(top_langs).head(5))
+                else:
+                    st.info("No language data.")
+        
+            st.subheader("📅 Contribution Calendar")
+            if analyzer.commits_df is not None and not analyzer.commits_df.empty:
+                # Shared per user across sessions; a re-fetch only bins the commits it has not seen
+                calendar = get_calendar((data_path, analyzer.profile_data.get("login", "")), analyzer.commits_df, signature)
+                busiest, busiest_count = calendar.busiest_day()
+                k1, k2, k3 = st.columns(3)
+                k1.metric("Active Days", calendar.active_days())
+                k2.metric("Current Streak", f"{calendar.current_streak(as_of=pd.Timestamp.now(tz='UTC'))} Days")
+                k3.metric("Busiest Day", f"{busiest:%b %d, %Y}", f"{busiest_count} commits", delta_color="off")
+                years = calendar.years()
+                shown = st.slider("Years shown", 1, len(years), min(3, len(years))) if len(years) > 1 else 1
+                fig = heatmap_figure(calendar, years[-shown:])
+                st.plotly_chart(fig)
+            else:
+                st.info("No commit data available.")
+
+            if st.button("Generate Replay"):
+                 st.balloons()
+
+            st.divider()
+            st.subheader("🚀 My GitHub Journey")
+        
+            timeline_events = cached_timeline_events(data_path, signature)
+        
+            if timeline_events:
+                # Custom HTML for Timeline
+                timeline_html = """
+                <style>
+                .timeline {
+                    position: relative;
+                    max-width: 1200px;
+                    margin: 0 auto;
+                }
+                .timeline::after {
+                    content: '';
+                    position: absolute;
+                    width: 6px;
+                    background-color: #30363d;
+                    top: 0;
+                    bottom: 0;
+                    left: 31px;
+                    margin-left: -3px;
+                }
+                .container {
+                    padding: 10px 40px;
+                    position: relative;
+                    background-color: inherit;
+                    width: 100%;
+                }
+                .container::after {
+                    content: '';
+                    position: absolute;
+                    width: 25px;
+                    height: 25px;
+                    right: -17px;
+                    background-color: #58a6ff;
+                    border: 4px solid #0d1117;
+                    top: 15px;
+                    border-radius: 50%;
+                    z-index: 1;
+                    left: 18px;
+                }
+                .content {
+                    padding: 20px 30px;
+                    background-color: #161b22;
+                    position: relative;
+                    border-radius: 6px;
+                    border: 1px solid #30363d;
+                }
+                .date {
+                    font-size: 0.85em;
+                    color: #8b949e;
+                    margin-bottom: 5px;
+                }
+                .title {
+                    font-size: 1.1em;
+                    font-weight: bold;
+                    color: #c9d1d9;
+                }
+                </style>
+                <div class="timeline">
                 """
             
-            timeline_html += "</div>"
-            st.markdown(timeline_html, unsafe_allow_html=True)
-        else:
-            st.info("No timeline events found.")
+                for event in timeline_events:
+                    timeline_html += f"""
+                    <div class="container">
+                        <div class="content">
+                            <div class="date">{event['date']}</div>
+                            <div class="title">{event['icon']} {event['title']}</div>
+                        </div>
+                    </div>
+                    """
+            
+                timeline_html += "</div>"
+                st.markdown(timeline_html, unsafe_allow_html=True)
+            else:
+                st.info("No timeline events found.")
+
+    with tab7:
+        if tab7.open:
+            st.subheader("⏱️ Performance")
+            st.caption("Stage timings and counters collected in this server process since it started.")
+            tracer = get_tracer()
+            span_summary = pd.DataFrame(tracer.summary())
+            if not span_summary.empty:
+                st.dataframe(span_summary, hide_index=True)
+            else:
+                st.info("No timings recorded yet.")
+
+            counters = tracer.counters()
+            if counters:
+                counter_df = pd.DataFrame(counters)
+                counter_df["labels"] = counter_df["labels"].map(lambda l: ", ".join(f"{k}={v}" for k, v in l.items()))
+                st.dataframe(counter_df, hide_index=True)
+
+                lookups = {c["labels"]["fn"]: c["value"] for c in counters if c["name"] == "dashboard_cache_lookups_total"}
+                misses = {c["labels"]["fn"]: c["value"] for c in counters if c["name"] == "dashboard_cache_misses_total"}
+                if lookups:
+                    st.markdown("**Dashboard cache hit rate**")
+                    st.dataframe(pd.DataFrame([
+                        {"cache": fn, "lookups": n, "hits": n - misses.get(fn, 0), "hit_rate": 1 - misses.get(fn, 0) / n}
+                        for fn, n in sorted(lookups.items())
+                    ]), hide_index=True)
+
+            d1, d2 = st.columns(2)
+            d1.download_button("Download Prometheus metrics", tracer.to_prometheus(), file_name="dashboard.prom", mime="text/plain")
+            d2.download_button(
+                "Download spans (JSON lines)",
+                "".join(json.dumps(span, default=str) + "\n" for span in tracer.spans()),
+                file_name="spans.jsonl",
+                mime="application/x-ndjson"
+            )
+
+    with tab8:
+        if tab8.open:
+            st.subheader("👥 Team Comparison")
+            team_snapshots = snapshot_store.index()
+            st.caption(f"Compares every stored snapshot ({len(team_snapshots)} users), analysed in parallel across CPU cores.")
+            if len(team_snapshots) < 2:
+                st.info("Fetch data for at least two users to compare them.")
+            else:
+                snapshot_keys = tuple((e["path"], snapshot_signature(e["path"])) for e in team_snapshots)
+                with st.spinner(f"Analysing {len(snapshot_keys)} snapshots..."):
+                    team = cached_team_table(snapshot_keys)
+
+                metric_labels = {"longest_streak": "Longest streak (days)", "total_commits": "Commits", "stars": "Stars",
+                                 "health_score": "Average repo health (0-4)", "repos": "Repositories"}
+                l1, l2 = st.columns([1, 3])
+                metric = l1.selectbox("Leaderboard", list(metric_labels), format_func=lambda m: metric_labels[m])
+                top_n = l1.slider("Show top", min_value=5, max_value=50, value=10, step=5)
+                leaders = TeamAnalyzer.leaderboard(team, metric, n=top_n)
+                fig = px.bar(leaders, x=metric, y="login", orientation="h", labels={metric: metric_labels[metric]})
+                fig.update_yaxes(autorange="reversed")
+                l2.plotly_chart(fig)
+
+                d1, d2 = st.columns(2)
+                chronotypes = TeamAnalyzer.distribution(team, "chronotype")
+                d1.plotly_chart(px.pie(chronotypes, values="users", names="chronotype", title="Chronotypes"))
+                grades = TeamAnalyzer.grade_distribution(team)
+                d2.plotly_chart(px.bar(x=grades.index, y=grades.values, labels={"x": "Grade", "y": "Repositories"}, title="Repository health grades"))
+
+                team_measure = st.radio("Language mix by", ["Repositories", "Bytes of code"], horizontal=True)
+                if team_measure == "Repositories":
+                    team_langs = TeamAnalyzer.language_mix(team).groupby("language")["repos"].sum().nlargest(15)
+                else:
+                    team_langs = TeamAnalyzer.language_bytes(team).totals().head(15)
+                st.plotly_chart(px.bar(x=team_langs.index, y=team_langs.values, labels={"x": "Language", "y": team_measure}, title="Team language mix"))
+
+                st.dataframe(team.drop(columns=["languages", "language_bytes", "snapshot_path"]), hide_index=True)
+                st.download_button("Download comparison (CSV)", team.drop(columns=["languages", "language_bytes"]).to_csv(index=False),
+                                   file_name="team_comparison.csv", mime="text/csv")
 
 except Exception as e:
     st.error(t("error_occurred", error=str(e)))
     import traceback
     st.text(traceback.format_exc())
-
@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+from src.synthetic_data import write_snapshot
+from src.traditional_ds import TraditionalAnalyzer
+
+# Snapshot sizes; "large" is roughly a big organisation account
+SCALES = {
+    "small": {"n_repos": 100, "n_commits": 5_000, "readme_chars": 2_000},
+    "medium": {"n_repos": 1_000, "n_commits": 100_000, "readme_chars": 5_000},
+    "large": {"n_repos": 10_000, "n_commits": 1_000_000, "readme_chars": 20_000}
+}
+# load_data parses the JSON snapshot; load_columnar memory-maps the Arrow tables written by a previous load
+STAGES = ("load_data", "load_columnar", "get_basic_stats", "get_user_stats", "perform_clustering", "get_timeline_events", "forecast_activity")
+# Metrics compared against a baseline; both are "lower is better"
+COMPARED_METRICS = ("median_s", "peak_mb")
+
+
+def snapshot_for_scale(scale, data_dir="data/bench", seed=0):
+    """Generates the snapshot for a scale once and reuses it on later runs."""
+    params = SCALES[scale]
+    path = os.path.join(data_dir, f"{scale}-seed{seed}.json")
+    if not os.path.exists(path):
+        print(f"Generating {scale} snapshot ({params['n_repos']} repos, {params['n_commits']} commits)...")
+        write_snapshot(path, seed=seed, **params)
+    return path
+
+
+LOAD_STAGES = ("load_data", "load_columnar")
+
+
+def _stage_call(analyzer, stage):
+    if stage == "perform_clustering":
+        return lambda: analyzer.perform_clustering(n_clusters=3)
+    if stage == "load_columnar":
+        return analyzer.load_data
+    return getattr(analyzer, stage)
+
+
+def _fresh(path, stage):
+    return TraditionalAnalyzer(data_path=path, columnar_cache=stage == "load_columnar")
+
+
+def _loaded(path):
+    analyzer = TraditionalAnalyzer(data_path=path)
+    if not analyzer.load_data():
+        raise FileNotFoundError(path)
+    return analyzer
+
+
+def measure_stage(path, stage, repeat=3):
+    """Times a stage ``repeat`` times, then runs it once more under tracemalloc for the memory peak.
+
+    Timing runs are kept separate because tracemalloc slows allocation-heavy code several times over.
+    """
+    durations = []
+    # Also writes the Arrow tables that load_columnar and the analysis stages read
+    analyzer = _loaded(path)
+    for _ in range(repeat):
+        target = _fresh(path, stage) if stage in LOAD_STAGES else analyzer
+        fn = _stage_call(target, stage)
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+
+    target = _fresh(path, stage) if stage in LOAD_STAGES else analyzer
+    fn = _stage_call(target, stage)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_s": statistics.median(durations),
+        "min_s": min(durations),
+        "max_s": max(durations),
+        "peak_mb": peak / 1e6,
+        "runs": repeat
+    }
+
+
+def run_analysis_benchmark(scales=("small", "medium"), stages=STAGES, repeat=3, data_dir="data/bench", seed=0):
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scales": {}
+    }
+    for scale in scales:
+        path = snapshot_for_scale(scale, data_dir, seed)
+        scale_result = {"params": SCALES[scale], "file_mb": os.path.getsize(path) / 1e6, "stages": {}}
+        for stage in stages:
+            print(f"[{scale}] {stage}...")
+            try:
+                scale_result["stages"][stage] = measure_stage(path, stage, repeat)
+            except Exception as e:
+                print(f"[{scale}] {stage} failed: {e}")
+                scale_result["stages"][stage] = {"error": str(e)}
+        results["scales"][scale] = scale_result
+    return results
+
+
+def print_results(results):
+    print(f"\n{'Scale':<8} {'Stage':<22} {'Median (s)':>11} {'Peak (MB)':>10}")
+    print("-" * 54)
+    for scale, scale_result in results["scales"].items():
+        for stage, m in scale_result["stages"].items():
+            if "error" in m:
+                print(f"{scale:<8} {stage:<22} {'error':>11}")
+            else:
+                print(f"{scale:<8} {stage:<22} {m['median_s']:>11.3f} {m['peak_mb']:>10.1f}")
+
+
+def compare_results(current, baseline, threshold=0.10):
+    """Returns a list of regression descriptions for scale/stage pairs present in both runs."""
+    regressions = []
+    for scale, scale_result in current["scales"].items():
+        base_stages = baseline.get("scales", {}).get(scale, {}).get("stages", {})
+        for stage, metrics in scale_result["stages"].items():
+            base = base_stages.get(stage, {})
+            for metric in COMPARED_METRICS:
+                new_value = metrics.get(metric)
+                old_value = base.get(metric)
+                if new_value is None or not old_value:
+                    continue
+                change = (new_value - old_value) / old_value
+                if change > threshold:
+                    regressions.append(f"{scale} {stage} {metric}: {old_value:.3f} -> {new_value:.3f} ({change:+.1%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TraditionalAnalyzer on synthetic snapshots.")
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=list(SCALES), help="Snapshot sizes to run")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES), help="Analysis stages to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage")
+    parser.add_argument("--data-dir", default="data/bench", help="Where generated snapshots are cached")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated data")
+    parser.add_argument("--output", default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative increase that counts as a regression")
+    args = parser.parse_args()
+
+    results = run_analysis_benchmark(scales=args.scales, stages=args.stages, repeat=args.repeat,
+                                     data_dir=args.data_dir, seed=args.seed)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+        if regressions:
+            print("\n--- Regressions ---")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
@@ -0,0 +1,27 @@
+import argparse
+import glob
+import os
+import time
+from src.report_bundle import generate_reports
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute dashboard reports for one or many snapshot files.")
+    parser.add_argument("snapshots", nargs="+", help="Snapshot JSON files or glob patterns (e.g. 'data/*.json')")
+    parser.add_argument("--out", default="reports", help="Output directory; one bundle per user is written to <out>/<login>/")
+    parser.add_argument("--model", default=None, help="Ollama model for the AI persona (omit to skip LLM calls)")
+    parser.add_argument("--no-forecast", action="store_true", help="Skip the Prophet forecast")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    args = parser.parse_args()
+
+    paths = sorted({p for pattern in args.snapshots for p in glob.glob(pattern)})
+    # Bulk results and temp files share the directory with snapshots
+    paths = [p for p in paths if not p.endswith((".analysis.json", ".tmp"))]
+    if not paths:
+        parser.error("No snapshot files matched.")
+
+    start = time.time()
+    results = generate_reports(paths, out_dir=args.out, model=args.model, forecast=not args.no_forecast, max_workers=args.workers)
+    failed = [p for p, r in results.items() if isinstance(r, Exception)]
+    print(f"\n{len(paths) - len(failed)}/{len(paths)} reports generated in {time.time() - start:.1f}s")
+    if failed:
+        raise SystemExit(1)
@@ -0,0 +1,81 @@
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+import requests
+from src.webhook_receiver import GITHUB_WEBHOOK_SECRET, sign
+
+
+def load_deliveries(path):
+    """Recorded deliveries from a JSONL file (one {"event", "payload"} object per line, as written by --record)."""
+    deliveries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                deliveries.append(json.loads(line))
+    return deliveries
+
+
+def sample_deliveries(owner, repo, default_branch="main"):
+    """A push that touches the README, a star and a metadata edit for ``owner/repo``, for trying the receiver without GitHub."""
+    now = datetime.now(timezone.utc)
+    repository = {
+        "name": repo, "full_name": f"{owner}/{repo}", "owner": {"login": owner, "name": owner},
+        "default_branch": default_branch, "stargazers_count": 1, "watchers_count": 1,
+        "description": f"{repo} (edited from a replayed webhook)", "updated_at": now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    }
+    commit = {
+        "id": uuid.uuid4().hex + uuid.uuid4().hex[:8], "message": "Update README from webhook replay",
+        "timestamp": now.isoformat(timespec="seconds"), "author": {"name": owner, "email": f"{owner}@users.noreply.github.com"},
+        "added": [], "removed": [], "modified": ["README.md"], "distinct": True
+    }
+    return [
+        {"event": "push", "payload": {"ref": f"refs/heads/{default_branch}", "commits": [commit],
+                                      "repository": dict(repository, pushed_at=int(now.timestamp()))}},
+        {"event": "star", "payload": {"action": "created", "repository": repository}},
+        {"event": "repository", "payload": {"action": "edited", "repository": repository}}
+    ]
+
+
+def replay(deliveries, url, secret=None, delay=0.0):
+    """Posts each delivery with GitHub's headers (signed when ``secret`` is set). Returns (status, response JSON) per delivery."""
+    results = []
+    for delivery in deliveries:
+        body = json.dumps(delivery["payload"]).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "X-GitHub-Event": delivery["event"],
+            "X-GitHub-Delivery": delivery.get("delivery") or str(uuid.uuid4())
+        }
+        if secret:
+            headers["X-Hub-Signature-256"] = sign(body, secret)
+        response = requests.post(url, data=body, headers=headers)
+        try:
+            answer = response.json()
+        except ValueError:
+            answer = {"error": response.text}
+        results.append((response.status_code, answer))
+        print(f"{delivery['event']:<10} -> {response.status_code} {answer.get('changes') or answer.get('status') or answer.get('error')}")
+        if delay:
+            time.sleep(delay)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Post recorded (or sample) GitHub webhook deliveries to the receiver.")
+    parser.add_argument("deliveries", nargs="?", default=None, help="JSONL file recorded with `python -m src.webhook_receiver --record`")
+    parser.add_argument("--url", default="http://127.0.0.1:8765/", help="Webhook receiver URL")
+    parser.add_argument("--sample", default=None, metavar="OWNER/REPO", help="Send generated sample events for this repository instead")
+    parser.add_argument("--secret", default=GITHUB_WEBHOOK_SECRET, help="Sign deliveries with this secret (defaults to GITHUB_WEBHOOK_SECRET)")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait between deliveries")
+    args = parser.parse_args()
+
+    if args.sample:
+        owner, _, repo = args.sample.partition("/")
+        deliveries = sample_deliveries(owner, repo)
+    elif args.deliveries:
+        deliveries = load_deliveries(args.deliveries)
+    else:
+        parser.error("pass a deliveries file or --sample OWNER/REPO")
+    replay(deliveries, args.url, secret=args.secret, delay=args.delay)
@@ -1,54 +1,227 @@
 import time
+import json
 import argparse
-from src.llm_analysis import OllamaAnalyzer
+import sys
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.llm_analysis import OllamaAnalyzer, OLLAMA_HOST
 
-def run_benchmark(models=["llama3.1", "mistral"], iterations=5):
-    print(f"Benchmarking models: {models} with {iterations} iterations...")
-    
-    tasks = [
-        "Explain the concept of recursion in programming.",
-        "Write a python function to reverse a string.",
-        "Summarize the benefits of using a linter."
-    ]
+TASKS = [
+    "Explain the concept of recursion in programming.",
+    "Write a python function to reverse a string.",
+    "Summarize the benefits of using a linter."
+]
 
-    results = {model: {"total_time": 0, "success_count": 0} for model in models}
+# Metric -> direction that counts as better, used by --compare
+COMPARED_METRICS = {
+    ("latency", "p50"): "lower",
+    ("latency", "p95"): "lower",
+    ("ttft", "p50"): "lower",
+    ("eval_tokens_per_sec", "p50"): "higher",
+    ("prompt_tokens_per_sec", "p50"): "higher",
+}
 
-    analyzer = OllamaAnalyzer()
 
+def percentiles(values):
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "mean": None}
+    arr = np.asarray(values, dtype=float)
+    return {
+        "p50": float(np.percentile(arr, 50)),
+        "p95": float(np.percentile(arr, 95)),
+        "p99": float(np.percentile(arr, 99)),
+        "mean": float(arr.mean())
+    }
+
+
+def timed_chat(client, model, prompt):
+    """Streams one chat completion and returns latency, time-to-first-token and Ollama's own counters."""
+    start = time.perf_counter()
+    ttft = None
+    final = None
+    for chunk in client.chat(model=model, messages=[{'role': 'user', 'content': prompt}], stream=True):
+        if ttft is None and chunk['message']['content']:
+            ttft = time.perf_counter() - start
+        if chunk['done']:
+            final = chunk
+    latency = time.perf_counter() - start
+    if final is None:
+        raise RuntimeError("stream ended without a final chunk")
+
+    sample = {"latency": latency, "ttft": ttft if ttft is not None else latency}
+    # Durations are reported in nanoseconds
+    if final.get('eval_count') and final.get('eval_duration'):
+        sample["eval_tokens_per_sec"] = final['eval_count'] / (final['eval_duration'] / 1e9)
+    if final.get('prompt_eval_count') and final.get('prompt_eval_duration'):
+        sample["prompt_tokens_per_sec"] = final['prompt_eval_count'] / (final['prompt_eval_duration'] / 1e9)
+    sample["eval_count"] = final.get('eval_count') or 0
+    sample["load_duration"] = (final.get('load_duration') or 0) / 1e9
+    return sample
+
+
+def run_concurrency_level(client, model, concurrency, requests_per_worker):
+    prompts = [TASKS[i % len(TASKS)] for i in range(concurrency * requests_per_worker)]
+    errors = 0
+    samples = []
+
+    def run(prompt):
+        try:
+            return timed_chat(client, model, prompt)
+        except Exception as e:
+            return e
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for result in pool.map(run, prompts):
+            if isinstance(result, Exception):
+                errors += 1
+            else:
+                samples.append(result)
+    wall = time.perf_counter() - start
+
+    return {
+        "requests": len(prompts),
+        "errors": errors,
+        "wall_time": wall,
+        "requests_per_sec": len(samples) / wall if wall > 0 else 0.0,
+        "eval_tokens_per_sec": sum(s["eval_count"] for s in samples) / wall if wall > 0 else 0.0,
+        "latency": percentiles([s["latency"] for s in samples])
+    }
+
+
+def benchmark_model(client, model, iterations, warmup, concurrency_levels):
+    print(f"\nTesting model: {model}")
+    for i in range(warmup):
+        try:
+            sample = timed_chat(client, model, TASKS[0])
+            print(f"  Warmup {i+1} - Time: {sample['latency']:.2f}s (load {sample['load_duration']:.2f}s)")
+        except Exception as e:
+            print(f"  Warmup {i+1} - Error: {e}")
+
+    samples = []
+    attempted = 0
+    for i in range(iterations):
+        for task in TASKS:
+            attempted += 1
+            try:
+                sample = timed_chat(client, model, task)
+                samples.append(sample)
+                print(f"  Iteration {i+1} Task '{task[:10]}...' - Time: {sample['latency']:.2f}s TTFT: {sample['ttft']:.2f}s")
+            except Exception as e:
+                print(f"  Iteration {i+1} Task '{task[:10]}...' - Error: {e}")
+
+    result = {
+        "attempted": attempted,
+        "succeeded": len(samples),
+        "success_rate": len(samples) / attempted if attempted else 0.0,
+        "latency": percentiles([s["latency"] for s in samples]),
+        "ttft": percentiles([s["ttft"] for s in samples]),
+        "eval_tokens_per_sec": percentiles([s["eval_tokens_per_sec"] for s in samples if "eval_tokens_per_sec" in s]),
+        "prompt_tokens_per_sec": percentiles([s["prompt_tokens_per_sec"] for s in samples if "prompt_tokens_per_sec" in s]),
+        "load_duration": percentiles([s["load_duration"] for s in samples]),
+        "concurrency": {}
+    }
+
+    for level in concurrency_levels:
+        print(f"  Concurrency {level}...")
+        result["concurrency"][str(level)] = run_concurrency_level(client, model, level, max(1, iterations))
+    return result
+
+
+def run_benchmark(models=["llama3.1", "mistral"], iterations=5, warmup=1, concurrency_levels=(1, 2, 4), host=None):
+    print(f"Benchmarking models: {models} with {iterations} iterations ({warmup} warmup)...")
+    analyzer = OllamaAnalyzer(host=host)
+
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": host or OLLAMA_HOST,
+        "iterations": iterations,
+        "warmup": warmup,
+        "models": {}
+    }
     for model in models:
-        print(f"\nTesting model: {model}")
-        analyzer.model = model
-        
-        for i in range(iterations):
-            for task in tasks:
-                start_time = time.time()
-                try:
-                    # We reuse the compare_models method or just direct chat
-                    response = analyzer.client.chat(model=model, messages=[{'role': 'user', 'content': task}])
-                    duration = time.time() - start_time
-                    
-                    if response and 'message' in response:
-                        results[model]["total_time"] += duration
-                        results[model]["success_count"] += 1
-                        print(f"  Iteration {i+1} Task '{task[:10]}...' - Time: {duration:.2f}s")
-                    else:
-                        print(f"  Iteration {i+1} Task '{task[:10]}...' - Failed")
-                except Exception as e:
-                    print(f"  Iteration {i+1} Task '{task[:10]}...' - Error: {e}")
+        results["models"][model] = benchmark_model(analyzer.client, model, iterations, warmup, concurrency_levels)
+    return results
+
+
+def _fmt(value, spec=".2f"):
+    return "n/a" if value is None else format(value, spec)
 
+
+def print_results(results):
     print("\n--- Benchmark Results ---")
-    print(f"{'Model':<15} | {'Avg Time (s)':<15} | {'Success Rate':<15}")
-    print("-" * 50)
-    
-    for model, metrics in results.items():
-        avg_time = metrics["total_time"] / (iterations * len(tasks)) if metrics["success_count"] > 0 else 0
-        success_rate = (metrics["success_count"] / (iterations * len(tasks))) * 100
-        print(f"{model:<15} | {avg_time:<15.2f} | {success_rate:<15.2f}%")
+    print(f"{'Model':<15} | {'p50 (s)':<8} | {'p95 (s)':<8} | {'p99 (s)':<8} | {'TTFT p50':<8} | {'eval tok/s':<10} | {'prompt tok/s':<12} | {'Success':<8}")
+    print("-" * 100)
+    for model, m in results["models"].items():
+        print(f"{model:<15} | {_fmt(m['latency']['p50']):<8} | {_fmt(m['latency']['p95']):<8} | {_fmt(m['latency']['p99']):<8} | "
+              f"{_fmt(m['ttft']['p50']):<8} | {_fmt(m['eval_tokens_per_sec']['p50'], '.1f'):<10} | "
+              f"{_fmt(m['prompt_tokens_per_sec']['p50'], '.1f'):<12} | {m['success_rate'] * 100:.0f}%")
+        for level, c in m["concurrency"].items():
+            print(f"    concurrency {level:>2}: {c['requests_per_sec']:.2f} req/s, {c['eval_tokens_per_sec']:.1f} eval tok/s, "
+                  f"p95 {_fmt(c['latency']['p95'])}s, errors {c['errors']}")
+
+
+def compare_results(current, baseline, threshold=0.10):
+    """Returns a list of regression descriptions, comparing each model present in both runs."""
+    regressions = []
+    for model, metrics in current["models"].items():
+        base = baseline.get("models", {}).get(model)
+        if not base:
+            continue
+        for (metric, stat), better in COMPARED_METRICS.items():
+            new_value = metrics.get(metric, {}).get(stat)
+            old_value = base.get(metric, {}).get(stat)
+            if new_value is None or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (better == "lower" and change > threshold) or (better == "higher" and change < -threshold):
+                regressions.append(f"{model} {metric} {stat}: {old_value:.3f} -> {new_value:.3f} ({change:+.1%})")
+    return regressions
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Benchmark LLM models.")
     parser.add_argument("--models", nargs="+", default=["llama3.1", "mistral"], help="List of models to benchmark")
     parser.add_argument("--iterations", type=int, default=3, help="Number of iterations per task")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup runs per model (absorbs model load time)")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4], help="Concurrency levels for throughput runs")
+    parser.add_argument("--host", default=None, help="Ollama host (defaults to OLLAMA_BASE_URL)")
+    parser.add_argument("--output", default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change that counts as a regression")
+    parser.add_argument("--mock", action="store_true", help="Run against a local mock Ollama server (no models needed)")
     args = parser.parse_args()
-    
-    run_benchmark(models=args.models, iterations=args.iterations)
+
+    mock = None
+    host = args.host
+    if args.mock:
+        from src.mock_ollama import MockOllamaServer
+        mock = MockOllamaServer().start()
+        host = mock.url
+        print(f"Using mock Ollama server at {host}")
+
+    try:
+        results = run_benchmark(models=args.models, iterations=args.iterations, warmup=args.warmup,
+                                concurrency_levels=args.concurrency, host=host)
+    finally:
+        if mock:
+            mock.stop()
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+        if regressions:
+            print("\n--- Regressions ---")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
@@ -0,0 +1,161 @@
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timezone
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+
+
+def _parse_date(value):
+    """GitHub ISO timestamp -> aware UTC datetime (the batch path also works in UTC)."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+class ActivityStats:
+    """Incremental version of TraditionalAnalyzer.get_user_stats.
+
+    Commits can be added one at a time or page by page while a crawl is
+    running, and accumulators for different repos or workers can be merged.
+    State is a few fixed-size counters plus one (start, end) run per streak
+    of consecutive commit days, so memory does not grow with the number of
+    commits.
+    """
+
+    def __init__(self):
+        self.total_commits = 0
+        self.hour_sum = 0
+        self.day_counts = Counter()
+        self.month_counts = Counter()
+        self.language_counts = Counter()
+        # Disjoint, sorted runs of consecutive commit days (date ordinals)
+        self._run_starts = []
+        self._run_ends = []
+        self.longest_streak = 0
+
+    def add_repo(self, metadata):
+        language = metadata.get("language", "Unknown")
+        if language is not None:
+            self.language_counts[language] += 1
+
+    def add_commit(self, date):
+        if isinstance(date, str):
+            date = _parse_date(date)
+        self.total_commits += 1
+        self.hour_sum += date.hour
+        self.day_counts[DAY_NAMES[date.weekday()]] += 1
+        self.month_counts[MONTH_NAMES[date.month - 1]] += 1
+        self._add_day(date.toordinal())
+
+    def add_commits(self, commits):
+        """Adds a page of commits as returned by the GitHub commits API. Returns the number added."""
+        added = 0
+        for commit in commits if isinstance(commits, list) else []:
+            author_date = commit.get("commit", {}).get("author", {}).get("date")
+            if author_date:
+                self.add_commit(author_date)
+                added += 1
+        return added
+
+    def _add_day(self, day):
+        starts, ends = self._run_starts, self._run_ends
+        i = bisect_right(starts, day)
+        if i > 0 and ends[i - 1] >= day:
+            return
+        joins_left = i > 0 and ends[i - 1] == day - 1
+        joins_right = i < len(starts) and starts[i] == day + 1
+        if joins_left and joins_right:
+            ends[i - 1] = ends[i]
+            del starts[i], ends[i]
+            i -= 1
+        elif joins_left:
+            ends[i - 1] = day
+            i -= 1
+        elif joins_right:
+            starts[i] = day
+        else:
+            starts.insert(i, day)
+            ends.insert(i, day)
+        self.longest_streak = max(self.longest_streak, ends[i] - starts[i] + 1)
+
+    def merge(self, other):
+        """Folds ``other`` into this accumulator (e.g. another repo's or worker's stats). Returns self."""
+        self.total_commits += other.total_commits
+        self.hour_sum += other.hour_sum
+        self.day_counts.update(other.day_counts)
+        self.month_counts.update(other.month_counts)
+        self.language_counts.update(other.language_counts)
+
+        runs = sorted(zip(self._run_starts + other._run_starts, self._run_ends + other._run_ends))
+        starts, ends = [], []
+        for start, end in runs:
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._run_starts, self._run_ends = starts, ends
+        self.longest_streak = max((e - s + 1 for s, e in zip(starts, ends)), default=0)
+        return self
+
+    def stats(self):
+        """Same keys and values as TraditionalAnalyzer.get_user_stats."""
+        stats = {
+            "top_language": "Unknown",
+            "longest_streak": self.longest_streak,
+            "most_productive_day": "Unknown",
+            "total_commits": self.total_commits,
+            "chronotype": "Day Walker",
+            "most_active_month": "Unknown"
+        }
+        if self.language_counts:
+            stats["top_language"] = max(self.language_counts, key=self.language_counts.get)
+        if self.total_commits:
+            # Ties go to the earliest day/month in calendar order, as in the batch path's calendar totals,
+            # which also keeps the answer independent of the order commits or partials arrive in
+            stats["most_productive_day"] = max(DAY_NAMES, key=self.day_counts.__getitem__)
+            stats["most_active_month"] = max(MONTH_NAMES, key=self.month_counts.__getitem__)
+            avg_hour = self.hour_sum / self.total_commits
+            if avg_hour < 10:
+                stats["chronotype"] = "🌅 Early Bird"
+            elif avg_hour >= 20 or avg_hour < 4:
+                stats["chronotype"] = "🦉 Night Owl"
+            else:
+                stats["chronotype"] = "☕ Day Walker"
+        return stats
+
+    def to_dict(self):
+        """Plain-data form for sending between processes or persisting."""
+        return {
+            "total_commits": self.total_commits,
+            "hour_sum": self.hour_sum,
+            "day_counts": dict(self.day_counts),
+            "month_counts": dict(self.month_counts),
+            "language_counts": dict(self.language_counts),
+            "runs": [[s, e] for s, e in zip(self._run_starts, self._run_ends)]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        acc = cls()
+        acc.total_commits = data["total_commits"]
+        acc.hour_sum = data["hour_sum"]
+        acc.day_counts = Counter(data["day_counts"])
+        acc.month_counts = Counter(data["month_counts"])
+        acc.language_counts = Counter(data["language_counts"])
+        acc._run_starts = [s for s, _ in data["runs"]]
+        acc._run_ends = [e for _, e in data["runs"]]
+        acc.longest_streak = max((e - s + 1 for s, e in data["runs"]), default=0)
+        return acc
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Builds the accumulator from a raw_data.json-shaped snapshot, repo by repo."""
+        acc = cls()
+        for item in data.get("repositories", []):
+            acc.add_repo(item.get("metadata", {}))
+            acc.add_commits(item.get("details", {}).get("recent_commits"))
+        return acc
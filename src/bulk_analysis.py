@@ -0,0 +1,182 @@
+import os
+import json
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BULK_TASKS = ("topic", "skills", "readme_checklist")
+
+
+def results_path_for(snapshot_path):
+    """Bulk results live next to the snapshot: data/raw_data.json -> data/raw_data.analysis.json"""
+    return os.path.splitext(snapshot_path)[0] + ".analysis.json"
+
+
+def readme_hash(readme, description=""):
+    # The description feeds topic classification, so a change there also invalidates the entry
+    return hashlib.sha256(f"{readme or ''}\0{description or ''}".encode("utf-8")).hexdigest()
+
+
+class BulkAnalysisRunner:
+    """Runs topic, skill and README checks for every repository in the background.
+
+    Results are written to disk after every finished task, so an interrupted
+    run resumes where it stopped, and repositories whose README hash is
+    unchanged since the last run are skipped.
+    """
+
+    def __init__(self, analyzer, snapshot_path="data/raw_data.json", results_path=None, max_workers=2):
+        self.analyzer = analyzer
+        self.snapshot_path = snapshot_path
+        self.results_path = results_path or results_path_for(snapshot_path)
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = None
+        self.results = self.load_results()
+        self.progress = {"status": "idle", "total": 0, "done": 0, "skipped": 0, "failed": 0, "current": None,
+                         "started_at": None, "finished_at": None}
+
+    def load_results(self):
+        if not os.path.exists(self.results_path):
+            return {}
+        try:
+            with open(self.results_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error reading bulk results {self.results_path}: {e}")
+            return {}
+
+    def _save_results(self):
+        # Called with self._lock held; write-then-rename so a crash never leaves half a file
+        os.makedirs(os.path.dirname(self.results_path) or ".", exist_ok=True)
+        tmp_path = f"{self.results_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, indent=4)
+        os.replace(tmp_path, self.results_path)
+
+    def plan(self, repos_df):
+        """Returns the repositories that still have work to do, as (name, hash, description, readme, tasks)."""
+        work = []
+        for repo in repos_df.to_dict('records'):
+            readme = repo.get("readme_content") or ""
+            description = repo.get("description") or ""
+            digest = readme_hash(readme, description)
+            entry = self.results.get(repo["name"], {})
+            if entry.get("readme_hash") == digest:
+                pending = [task for task in BULK_TASKS if task not in entry.get("results", {})]
+            else:
+                pending = list(BULK_TASKS)
+            if pending:
+                work.append((repo["name"], digest, description, readme, pending))
+        return work
+
+    def _run_task(self, task, description, readme):
+        if task == "topic":
+            return self.analyzer.classify_topic(description)
+        if not readme:
+            return ""
+        if task == "skills":
+            return self.analyzer.extract_skills(readme)
+        return self.analyzer.analyze_readme_quality(readme)
+
+    def _process_repo(self, name, digest, description, readme, pending):
+        with self._lock:
+            entry = self.results.get(name)
+            if entry is None or entry.get("readme_hash") != digest:
+                entry = {"readme_hash": digest, "results": {}}
+                self.results[name] = entry
+            self.progress["current"] = name
+
+        failed = False
+        for task in pending:
+            if self._cancel.is_set():
+                return
+            output = self._run_task(task, description, readme)
+            # Failed tasks (None, or an "Error: ..." message) are not stored, so the next run retries them
+            if output is None or (isinstance(output, str) and output.startswith("Error")):
+                failed = True
+                continue
+            with self._lock:
+                entry["results"][task] = output
+                entry["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                self._save_results()
+
+        with self._lock:
+            self.progress["failed" if failed else "done"] += 1
+
+    def _run(self, work):
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(self._process_repo, *item) for item in work]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Bulk analysis task failed: {e}")
+                        with self._lock:
+                            self.progress["failed"] += 1
+        finally:
+            with self._lock:
+                self.progress["status"] = "cancelled" if self._cancel.is_set() else "finished"
+                self.progress["current"] = None
+                self.progress["finished_at"] = time.time()
+
+    def start(self, repos_df):
+        """Starts a background run over ``repos_df``. Returns False if one is already running."""
+        if self.is_running():
+            return False
+        work = self.plan(repos_df)
+        self._cancel.clear()
+        with self._lock:
+            self.progress = {
+                "status": "running",
+                "total": len(repos_df),
+                "done": 0,
+                "skipped": len(repos_df) - len(work),
+                "failed": 0,
+                "current": None,
+                "started_at": time.time(),
+                "finished_at": None
+            }
+        self._thread = threading.Thread(target=self._run, args=(work,), daemon=True)
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_progress(self):
+        with self._lock:
+            progress = dict(self.progress)
+        finished = progress["done"] + progress["skipped"] + progress["failed"]
+        progress["fraction"] = finished / progress["total"] if progress["total"] else 0.0
+        return progress
+
+    def get_results(self):
+        with self._lock:
+            return {name: dict(entry.get("results", {})) for name, entry in self.results.items()}
+
+
+_runners = {}
+_runners_lock = threading.Lock()
+
+def get_runner(analyzer, snapshot_path="data/raw_data.json", max_workers=2):
+    """Returns the process-wide runner for a snapshot so a job survives Streamlit reruns."""
+    key = os.path.abspath(snapshot_path)
+    with _runners_lock:
+        runner = _runners.get(key)
+        if runner is None:
+            runner = BulkAnalysisRunner(analyzer, snapshot_path=snapshot_path, max_workers=max_workers)
+            _runners[key] = runner
+        elif not runner.is_running():
+            runner.analyzer = analyzer
+        return runner
@@ -0,0 +1,109 @@
+import os
+import json
+import pyarrow as pa
+import pandas as pd
+
+# Set COLUMNAR_CACHE=0 to always parse the JSON snapshot
+COLUMNAR_CACHE = os.getenv("COLUMNAR_CACHE", "1") != "0"
+COLUMNAR_VERSION = b"3"
+TABLES = ("repos", "commits", "languages")
+
+
+def table_paths(snapshot_path):
+    """Arrow IPC files kept next to a snapshot: ``<user>.repos.arrow``, ``<user>.commits.arrow``, ..."""
+    base, _ = os.path.splitext(snapshot_path)
+    return {name: f"{base}.{name}.arrow" for name in TABLES}
+
+
+def _source_key(snapshot_path):
+    try:
+        stat = os.stat(snapshot_path)
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+
+def write_tables(snapshot_path, frames, profile):
+    """Writes ``frames`` ({"repos": df, "commits": df, "languages": df}) as uncompressed Arrow IPC files.
+
+    Uncompressed so readers can memory-map the buffers directly. Each file
+    records the snapshot's mtime and size, so a re-fetched snapshot is not
+    served from stale tables.
+    """
+    key = _source_key(snapshot_path)
+    if key is None:
+        return None
+    paths = table_paths(snapshot_path)
+    for name in TABLES:
+        table = pa.Table.from_pandas(frames[name], preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"source_key": key, b"version": COLUMNAR_VERSION})
+        if name == "repos":
+            metadata[b"profile"] = json.dumps(profile).encode()
+        _write_table(paths[name], table.replace_schema_metadata(metadata))
+    return paths
+
+
+def _write_table(path, table):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    # Sessions still holding the old mapping keep reading the old (unlinked) file
+    os.replace(tmp_path, path)
+
+
+def read_tables(snapshot_path):
+    """Memory-maps the tables for a snapshot. Returns (profile, {name: DataFrame}), or None if missing or stale.
+
+    Columns are exposed as Arrow-backed pandas dtypes, so no data is copied:
+    every session and process mapping the same file shares the OS page cache.
+    """
+    key = _source_key(snapshot_path)
+    if key is None:
+        return None
+    frames = {}
+    profile = {}
+    for name, path in table_paths(snapshot_path).items():
+        if not os.path.exists(path):
+            return None
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        metadata = table.schema.metadata or {}
+        if metadata.get(b"source_key") != key or metadata.get(b"version") != COLUMNAR_VERSION:
+            return None
+        if name == "repos":
+            profile = json.loads(metadata.get(b"profile", b"{}"))
+        frames[name] = table.to_pandas(types_mapper=pd.ArrowDtype)
+    return profile, frames
+
+
+def write_sidecar(snapshot_path, name, frame, tag=""):
+    """Stores a table derived from a snapshot (e.g. fitted forecasts) as ``<user>.<name>.arrow``.
+
+    It is valid only for this version of the snapshot and for ``tag``, a
+    string describing the parameters it was computed with.
+    """
+    key = _source_key(snapshot_path)
+    if key is None:
+        return None
+    base, _ = os.path.splitext(snapshot_path)
+    path = f"{base}.{name}.arrow"
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({b"source_key": key, b"version": COLUMNAR_VERSION, b"tag": tag.encode()})
+    _write_table(path, table.replace_schema_metadata(metadata))
+    return path
+
+
+def read_sidecar(snapshot_path, name, tag=""):
+    """The table written by write_sidecar, or None if missing, stale or computed with another ``tag``."""
+    key = _source_key(snapshot_path)
+    base, _ = os.path.splitext(snapshot_path)
+    path = f"{base}.{name}.arrow"
+    if key is None or not os.path.exists(path):
+        return None
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    metadata = table.schema.metadata or {}
+    if (metadata.get(b"source_key"), metadata.get(b"version"), metadata.get(b"tag")) != (key, COLUMNAR_VERSION, tag.encode()):
+        return None
+    return table.to_pandas()
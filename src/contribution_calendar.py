@@ -0,0 +1,215 @@
+import threading
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+
+
+def day_numbers(dates):
+    """Timestamps (naive or aware, numpy or Arrow-backed) -> int64 days since 1970-01-01 in UTC."""
+    index = pd.DatetimeIndex(pd.to_datetime(dates, utc=True)).tz_convert(None)
+    return index.values.astype("datetime64[D]").astype(np.int64)  # datetime64 casts are unit-aware
+
+
+class ContributionCalendar:
+    """Commit counts per day in one dense array, indexed by days since ``origin``.
+
+    Binning is a single np.bincount; streaks, weekday and month totals and
+    the GitHub-style heatmap are all array reductions over the same counts.
+    ``update`` adds only the commits it has not seen yet, identified per
+    repo by SHA, so a refreshed snapshot adds its new commits however old
+    their author dates are (merged branches, rebases, webhook pushes).
+    """
+
+    def __init__(self):
+        self.origin = None  # day number of counts[0]
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._length = 0  # used part of _counts; the rest is spare capacity for new days
+        self._seen = {}  # repo -> identities (SHA) of the commits already counted
+
+    @classmethod
+    def from_commits(cls, commits_df):
+        calendar = cls()
+        calendar.update(commits_df)
+        return calendar
+
+    @property
+    def counts(self):
+        return self._counts[:self._length]
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def add_days(self, days):
+        """Adds one commit per entry in ``days`` (day numbers)."""
+        days = np.asarray(days, dtype=np.int64)
+        if len(days) == 0:
+            return
+        lo, hi = int(days.min()), int(days.max())
+        if self.origin is None:
+            self.origin = lo
+        if lo < self.origin:
+            # Rare (back-dated commits): shift the array right once
+            shift = self.origin - lo
+            self._counts = np.concatenate([np.zeros(shift, dtype=np.int64), self._counts])
+            self._length += shift
+            self.origin = lo
+        needed = hi - self.origin + 1
+        if needed > len(self._counts):
+            # Grow geometrically so repeated appends of new days stay amortised O(1)
+            grown = np.zeros(max(needed, 2 * len(self._counts)), dtype=np.int64)
+            grown[:self._length] = self.counts
+            self._counts = grown
+        self._length = max(self._length, needed)
+        offsets = days - self.origin
+        binned = np.bincount(offsets - offsets.min(), minlength=0)
+        self._counts[offsets.min():offsets.min() + len(binned)] += binned
+
+    def update(self, commits_df):
+        """Adds the commits not counted yet for their repo. Returns the number added.
+
+        Commits without a SHA (older snapshots) are told apart by author
+        timestamp and how many of the repo's commits share it.
+        """
+        if commits_df is None or commits_df.empty:
+            return 0
+        # Nanoseconds whatever unit the column was parsed with (pandas may pick us or s)
+        stamps = pd.DatetimeIndex(pd.to_datetime(commits_df["date"], utc=True)).as_unit("ns").asi8
+        repos = commits_df["repo_name"].astype(object).to_numpy() if "repo_name" in commits_df else np.full(len(stamps), None)
+        keys = commits_df["sha"].astype(object).to_numpy(copy=True) if "sha" in commits_df else np.full(len(stamps), None)
+        missing = pd.isna(keys)
+        if missing.any():
+            nth = pd.DataFrame({"repo": repos[missing], "stamp": stamps[missing]}).groupby(
+                ["repo", "stamp"], dropna=False, sort=False).cumcount().to_numpy()
+            keys[missing] = [f"{stamp}#{n}" for stamp, n in zip(stamps[missing], nth)]
+
+        new = np.zeros(len(stamps), dtype=bool)
+        for i, (repo, key) in enumerate(zip(repos, keys)):
+            seen = self._seen.setdefault(repo, set())
+            if key not in seen:
+                seen.add(key)
+                new[i] = True
+        if new.any():
+            self.add_days(stamps[new] // (86400 * 10**9))
+        return int(new.sum())
+
+    # --- Reductions ---
+    def series(self):
+        """Commits per day as a Series indexed by date (every day in range, zeros included)."""
+        if self.origin is None:
+            return pd.Series(dtype=np.int64)
+        dates = pd.to_datetime(np.arange(self.origin, self.origin + self._length), unit="D")
+        return pd.Series(self.counts, index=dates, name="commits")
+
+    def _runs(self):
+        """(start, end) offsets of each run of consecutive active days, end exclusive."""
+        active = np.concatenate([[0], (self.counts > 0).astype(np.int8), [0]])
+        edges = np.diff(active)
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    def longest_streak(self):
+        starts, ends = self._runs()
+        return int((ends - starts).max()) if len(starts) else 0
+
+    def current_streak(self, as_of=None):
+        """Consecutive active days ending on ``as_of`` (default: the last day in the calendar) or the day before."""
+        if self.origin is None:
+            return 0
+        last = self._length - 1 if as_of is None else int(day_numbers([as_of])[0]) - self.origin
+        starts, ends = self._runs()
+        for start, end in zip(starts, ends):
+            if start <= last <= end:
+                return int(min(end, last + 1) - start)
+        return 0
+
+    def active_days(self):
+        return int(np.count_nonzero(self.counts))
+
+    def weekday_totals(self):
+        """Commits per weekday, Monday first."""
+        if self.origin is None:
+            return pd.Series(0, index=DAY_NAMES)
+        # Day 0 (1970-01-01) was a Thursday, i.e. weekday 3 with Monday = 0
+        weekdays = (np.arange(self.origin, self.origin + self._length) + 3) % 7
+        return pd.Series(np.bincount(weekdays, weights=self.counts, minlength=7).astype(np.int64), index=DAY_NAMES)
+
+    def month_totals(self):
+        """Commits per calendar month (January first), across all years."""
+        if self.origin is None:
+            return pd.Series(0, index=MONTH_NAMES)
+        days = np.arange(self.origin, self.origin + self._length).astype("datetime64[D]")
+        months = days.astype("datetime64[M]").astype(np.int64) % 12
+        return pd.Series(np.bincount(months, weights=self.counts, minlength=12).astype(np.int64), index=MONTH_NAMES)
+
+    def busiest_day(self):
+        """(date, commits) of the single most active day."""
+        if self.origin is None or not self.counts.any():
+            return None, 0
+        i = int(self.counts.argmax())
+        return pd.Timestamp(self.origin + i, unit="D"), int(self.counts[i])
+
+    def heatmap(self, year):
+        """GitHub-style grid for one year: (z, dates), both 7 x weeks, rows Sunday..Saturday.
+
+        Cells outside the year are NaN in ``z`` and "" in ``dates``.
+        """
+        first = int(np.datetime64(f"{year}-01-01", "D").astype(np.int64))
+        last = int(np.datetime64(f"{year + 1}-01-01", "D").astype(np.int64))
+        days = np.arange(first, last)
+        values = np.zeros(len(days))
+        if self.origin is not None:
+            lo, hi = max(first, self.origin), min(last, self.origin + self._length)
+            if lo < hi:
+                values[lo - first:hi - first] = self.counts[lo - self.origin:hi - self.origin]
+
+        sunday_based = (days + 4) % 7  # 1970-01-01 was a Thursday: Sunday = 0
+        column = (days - first + sunday_based[0]) // 7
+        z = np.full((7, column[-1] + 1), np.nan)
+        z[sunday_based, column] = values
+        dates = np.full(z.shape, "", dtype=object)
+        dates[sunday_based, column] = np.datetime_as_string(days.astype("datetime64[D]"))
+        return z, dates
+
+    def years(self):
+        if self.origin is None:
+            return []
+        first = int(str(np.datetime64(self.origin, "D"))[:4])
+        last = int(str(np.datetime64(self.origin + self._length - 1, "D"))[:4])
+        return list(range(first, last + 1))
+
+
+def heatmap_figure(calendar, years):
+    """One GitHub-style heatmap row per year (newest first), sharing one colour scale."""
+    years = sorted(years, reverse=True)
+    fig = make_subplots(rows=len(years), cols=1, subplot_titles=[str(y) for y in years], vertical_spacing=0.08)
+    zmax = max(int(calendar.counts.max()) if calendar.total else 1, 1)
+    for row, year in enumerate(years, start=1):
+        z, dates = calendar.heatmap(year)
+        fig.add_trace(go.Heatmap(
+            z=z, customdata=dates, xgap=2, ygap=2, zmin=0, zmax=zmax, colorscale="Greens",
+            showscale=row == 1, hovertemplate="%{customdata}: %{z} commits<extra></extra>"
+        ), row=row, col=1)
+        fig.update_yaxes(tickvals=[1, 3, 5], ticktext=["Mon", "Wed", "Fri"], autorange="reversed", row=row, col=1)
+        fig.update_xaxes(showticklabels=False, row=row, col=1)
+    fig.update_layout(height=160 * len(years) + 40, margin=dict(t=40, b=10))
+    return fig
+
+
+_calendars = {}
+_calendars_lock = threading.Lock()
+
+def get_calendar(key, commits_df, version):
+    """Shared calendar per snapshot key. When ``version`` (e.g. the snapshot signature) changes, only new commits are added."""
+    with _calendars_lock:
+        entry = _calendars.get(key)
+        if entry is None:
+            entry = _calendars[key] = {"calendar": ContributionCalendar(), "version": None}
+        if entry["version"] != version:
+            entry["calendar"].update(commits_df)
+            entry["version"] = version
+        return entry["calendar"]
@@ -1,37 +1,54 @@
 import os
 import requests
-import json
 import time
 from datetime import datetime
 from dotenv import load_dotenv
+from src.tracing import get_tracer
+from src.snapshot_store import atomic_write_json
+from src.activity_stats import ActivityStats
 
 # Load environment variables
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_USERNAME = os.getenv("GITHUB_USERNAME")
+# One git-trees request per repo lists every path; set GITHUB_TREE_MODE=0 to list the root via the contents API
+GITHUB_TREE_MODE = os.getenv("GITHUB_TREE_MODE", "1") != "0"
 BASE_URL = "https://api.github.com"
 
+def is_readme_path(path):
+    """True for paths the readme endpoint looks at: README* in the root, .github/ or docs/."""
+    directory, _, name = path.rpartition("/")
+    return name.lower().startswith("readme") and directory.lower() in ("", ".github", "docs")
+
 class GitHubFetcher:
-    def __init__(self, username=None, token=None):
+    def __init__(self, username=None, token=None, tree_mode=GITHUB_TREE_MODE):
         self.username = username or GITHUB_USERNAME
         self.token = token or GITHUB_TOKEN
+        self.tree_mode = tree_mode
         self.headers = {
             "Accept": "application/vnd.github.v3+json"
         }
+        # Live user stats, updated as each repo's commits arrive during fetch_all_data
+        self.activity = ActivityStats()
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
         else:
             print("WARNING: No GitHub token provided. Rate limits will be low.")
 
-    def _get(self, endpoint, params=None):
+    def _get(self, endpoint, params=None, label=None):
         url = f"{BASE_URL}/{endpoint}"
         retries = 3
         backoff = 1
         
         for attempt in range(retries):
             try:
-                response = requests.get(url, headers=self.headers, params=params)
+                with get_tracer().span("github.request", endpoint=label or endpoint.split("/")[-1]) as span:
+                    response = requests.get(url, headers=self.headers, params=params)
+                    span["status"] = response.status_code
+                    span["bytes"] = len(response.content)
+                get_tracer().incr("github_requests_total", status=response.status_code)
+                get_tracer().incr("github_response_bytes_total", len(response.content))
                 if response.status_code == 200:
                     return response.json()
                 elif response.status_code == 403:
@@ -89,30 +106,60 @@ class GitHubFetcher:
             files = [item["name"] for item in data if "name" in item]
         return files
 
-    def fetch_repo_details(self, repo_name):
-        print(f"Fetching details for {repo_name}...")
-        languages = self._get(f"repos/{self.username}/{repo_name}/languages")
+    def fetch_repo_tree(self, repo_name, ref=None):
+        """Every path in the repo from one recursive git-trees request, or None if unavailable or truncated."""
+        data = self._get(f"repos/{self.username}/{repo_name}/git/trees/{ref or 'HEAD'}", params={"recursive": 1}, label="trees")
+        if not isinstance(data, dict) or "tree" not in data:
+            return None
+        if data.get("truncated"):
+            # Very large repos: GitHub caps the listing, so fall back to the exact root listing
+            print(f"Tree for {repo_name} is truncated; listing the root only.")
+            return None
+        return [item["path"] for item in data["tree"] if "path" in item]
+
+    def fetch_readme(self, repo_name):
+        """Decoded README text, or "" if the repo has none."""
         readme = self._get(f"repos/{self.username}/{repo_name}/readme")
-        
-        readme_content = ""
         if readme and "content" in readme:
             import base64
             try:
-                readme_content = base64.b64decode(readme["content"]).decode("utf-8")
+                return base64.b64decode(readme["content"]).decode("utf-8")
             except Exception as e:
                 print(f"Error decoding README for {repo_name}: {e}")
+        return ""
+
+    def fetch_repo_details(self, repo_name, default_branch=None):
+        print(f"Fetching details for {repo_name}...")
+        languages = self._get(f"repos/{self.username}/{repo_name}/languages")
+        tree = self.fetch_repo_tree(repo_name, default_branch) if self.tree_mode else None
+        if tree is not None:
+            files = sorted({path.split("/", 1)[0] for path in tree})
+            # Skip the readme call when no README exists where the endpoint looks
+            has_readme = any(is_readme_path(path) for path in tree)
+        else:
+            files = self.fetch_repo_files(repo_name)
+            has_readme = True
+        readme_content = self.fetch_readme(repo_name) if has_readme else ""
 
         commits = self._get(f"repos/{self.username}/{repo_name}/commits", params={"per_page": 5}) # Limit to 5 for speed
-        files = self.fetch_repo_files(repo_name)
-        
-        return {
+
+        details = {
             "languages": languages,
             "readme": readme_content,
             "recent_commits": commits,
             "files": files
         }
+        if tree is not None:
+            details["tree"] = tree
+        return details
 
-    def fetch_all_data(self, progress_callback=None):
+    def fetch_all_data(self, progress_callback=None, cancel_event=None):
+        with get_tracer().span("github.fetch_all", username=self.username) as span:
+            data = self._fetch_all_data(progress_callback, cancel_event)
+            span["repos"] = len(data["repositories"]) if data else 0
+            return data
+
+    def _fetch_all_data(self, progress_callback=None, cancel_event=None):
         profile = self.fetch_user_profile()
         if not profile:
             print("Failed to fetch user profile.")
@@ -127,12 +174,16 @@ class GitHubFetcher:
             "profile": profile,
             "repositories": []
         }
+        self.activity = ActivityStats()
 
         if repos:
             print(f"Found {len(repos)} repositories. Fetching details...")
             count = 0 
             total_repos = len(repos)
             for repo in repos:
+                if cancel_event is not None and cancel_event.is_set():
+                    print("Fetch cancelled.")
+                    return None
                 # Include ALL repositories, even forks
                 # if repo.get("fork", False):
                 #     continue 
@@ -141,8 +192,10 @@ class GitHubFetcher:
                 if progress_callback:
                     progress_callback(count, total_repos, repo_name)
 
-                details = self.fetch_repo_details(repo_name)
-                
+                details = self.fetch_repo_details(repo_name, default_branch=repo.get("default_branch"))
+                self.activity.add_repo(repo)
+                self.activity.add_commits(details.get("recent_commits"))
+
                 repo_data = {
                     "metadata": repo,
                     "details": details
@@ -156,9 +209,8 @@ class GitHubFetcher:
         return full_data
 
     def save_data(self, data, filename="data/raw_data.json"):
-        os.makedirs("data", exist_ok=True)
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        # Written to a temp file and renamed so readers never see a half-written snapshot
+        atomic_write_json(filename, data)
         print(f"Data saved to {filename}")
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Above this many points per trace the chart switches to WebGL (scattergl)
+WEBGL_THRESHOLD = 1000
+# Points sent to the browser per trace after downsampling
+MAX_CHART_POINTS = 1500
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling. Returns the indices of the points to keep.
+
+    ``x`` must be sorted and numeric (datetimes can be passed as int64).
+    First and last points are always kept; peaks and dips survive because
+    each bucket keeps the point forming the largest triangle with its
+    neighbours.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries for the n - 2 interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs((x[a] - avg_x) * (bucket_y - y[a]) - (x[a] - bucket_x) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample_frame(df, x, y, max_points=MAX_CHART_POINTS):
+    """Downsamples a frame with LTTB on column ``y``; other columns (e.g. confidence bands) follow the same rows."""
+    if df is None or len(df) <= max_points:
+        return df
+    df = df.sort_values(x)
+    x_values = df[x]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = x_values.astype("int64")
+    idx = lttb(x_values.to_numpy(), df[y].to_numpy(), max_points)
+    return df.iloc[idx]
+
+
+def line_figure(df, x, y, title=None, band=None, max_points=MAX_CHART_POINTS, webgl_threshold=WEBGL_THRESHOLD):
+    """Line chart with an optional (lower, upper) band, downsampled server-side and rendered with WebGL when large."""
+    data = downsample_frame(df, x, y, max_points=max_points)
+    trace = go.Scattergl if len(data) > webgl_threshold else go.Scatter
+
+    fig = go.Figure()
+    if band is not None:
+        lower, upper = band
+        fig.add_trace(trace(x=data[x], y=data[lower], mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+        fig.add_trace(trace(x=data[x], y=data[upper], fill='tonexty', mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(trace(x=data[x], y=data[y], mode='lines', name=y))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
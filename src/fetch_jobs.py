@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+import uuid
+from src.data_collection import GitHubFetcher
+from src.snapshot_history import get_history
+
+
+class FetchJob:
+    """A GitHub crawl running in a background thread, independent of any Streamlit session."""
+
+    def __init__(self, username, token, filename, history=None):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.username = username
+        self.token = token
+        self.filename = filename
+        self.history = history
+        self._fetcher = None
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._state = {
+            "status": "queued",
+            "count": 0,
+            "total": 0,
+            "current_repo": None,
+            "activity": None,
+            "error": None,
+            "started_at": None,
+            "finished_at": None
+        }
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _update(self, **changes):
+        with self._lock:
+            self._state.update(changes)
+
+    def _on_progress(self, count, total, repo_name):
+        # Called from the fetch thread, so reading the fetcher's accumulator here is safe
+        self._update(count=count, total=total, current_repo=repo_name, activity=self._fetcher.activity.stats())
+
+    def _run(self):
+        self._update(status="running", started_at=time.time())
+        try:
+            fetcher = self._fetcher = GitHubFetcher(username=self.username, token=self.token)
+            data = fetcher.fetch_all_data(progress_callback=self._on_progress, cancel_event=self.cancel_event)
+            if self.cancel_event.is_set():
+                self._update(status="cancelled")
+            elif data:
+                # save_data renames into place, so readers switch snapshots atomically
+                fetcher.save_data(data, filename=self.filename)
+                self._record_history(data)
+                total = len(data.get("repositories", []))
+                self._update(status="finished", count=total, total=total, activity=fetcher.activity.stats())
+            else:
+                self._update(status="failed", error="Fetch failed (check terminal for details, likely rate limit)")
+        except Exception as e:
+            print(f"Fetch job {self.job_id} failed: {e}")
+            self._update(status="failed", error=str(e))
+        finally:
+            self._update(finished_at=time.time(), current_repo=None)
+
+    def _record_history(self, data):
+        if self.history is None:
+            return
+        try:
+            self.history.record(data, username=self.username)
+        except Exception as e:
+            # The snapshot itself is saved; a missing history entry should not fail the fetch
+            print(f"Could not record snapshot history for {self.username}: {e}")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_active(self):
+        return self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+
+    @property
+    def state(self):
+        with self._lock:
+            state = dict(self._state)
+        state["job_id"] = self.job_id
+        state["username"] = self.username
+        state["fraction"] = state["count"] / state["total"] if state["total"] else 0.0
+        return state
+
+
+class FetchJobManager:
+    """Keeps track of fetch jobs by ID. Only one job runs per target snapshot file."""
+
+    def __init__(self, history=None):
+        self._lock = threading.Lock()
+        self._jobs = {}
+        # Completed fetches are also recorded here when set
+        self.history = history
+
+    def start(self, username, token=None, filename="data/raw_data.json"):
+        with self._lock:
+            active = self._active_for(filename)
+            if active is not None:
+                return active
+            job = FetchJob(username, token, filename, history=self.history)
+            self._jobs[job.job_id] = job
+        return job.start()
+
+    def _active_for(self, filename):
+        target = os.path.abspath(filename)
+        for job in self._jobs.values():
+            if job.is_active() and os.path.abspath(job.filename) == target:
+                return job
+        return None
+
+    def active_job_for(self, filename):
+        with self._lock:
+            return self._active_for(filename)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+
+_manager = FetchJobManager(history=get_history())
+
+def get_job_manager():
+    return _manager
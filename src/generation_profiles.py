@@ -0,0 +1,128 @@
+import json
+import os
+import re
+from src.readme_chunking import merge_skill_lists
+
+# One context size for every task: Ollama reloads the model whenever num_ctx changes between requests.
+# Prompts stay well inside it (READMEs are cut to 2000 chars or ~600-token chunks).
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "2048"))
+# Set OLLAMA_STRUCTURED_OUTPUT=0 for servers older than Ollama 0.5, which ignore JSON schemas in ``format``
+OLLAMA_STRUCTURED_OUTPUT = os.getenv("OLLAMA_STRUCTURED_OUTPUT", "1") != "0"
+
+SENTIMENTS = ["Positive", "Neutral", "Negative"]
+TOPICS = ["Web Development", "Data Science", "Machine Learning", "Mobile App", "DevOps", "Other"]
+
+
+def _object_schema(**properties):
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+def _string_list(max_items):
+    return {"type": "array", "items": {"type": "string"}, "maxItems": max_items}
+
+
+# Per task: output cap, sampling temperature, JSON schema for structured output and
+# stop sequences for plain-text mode (a schema already ends the answer at the closing brace).
+PROFILES = {
+    "sentiment": {
+        "num_predict": 16, "temperature": 0.0, "stop": ["\n"],
+        "format": _object_schema(sentiment={"type": "string", "enum": SENTIMENTS})
+    },
+    "topic": {
+        "num_predict": 24, "temperature": 0.0, "stop": ["\n"],
+        "format": _object_schema(topic={"type": "string", "enum": TOPICS})
+    },
+    "skills": {
+        "num_predict": 160, "temperature": 0.0, "stop": ["\n\n"],
+        "format": _object_schema(skills=_string_list(30))
+    },
+    "user_title": {
+        "num_predict": 24, "temperature": 0.8, "stop": ["\n"],
+        "format": _object_schema(title={"type": "string"})
+    },
+    "readme_quality": {
+        "num_predict": 320, "temperature": 0.2, "stop": [],
+        "format": _object_schema(improvements=_string_list(5))
+    },
+    "readme_quality_map": {
+        "num_predict": 120, "temperature": 0.0, "stop": [],
+        "format": _object_schema(sections=_string_list(10), problems=_string_list(5))
+    },
+    # Free-form prompts (model comparison); capped so a rambling model cannot run for minutes
+    "chat": {"num_predict": 512, "temperature": 0.7, "stop": [], "format": None}
+}
+# Map and reduce steps answer the same question as their single-call task
+BASE_TASKS = {"skills_map": "skills", "readme_quality_reduce": "readme_quality"}
+
+
+def get_profile(task):
+    return PROFILES.get(BASE_TASKS.get(task, task), PROFILES["chat"])
+
+
+def request_args(task, structured=OLLAMA_STRUCTURED_OUTPUT):
+    """Keyword arguments for ``client.chat``: ``options`` and, in structured mode, the JSON schema as ``format``."""
+    profile = get_profile(task)
+    options = {"num_predict": profile["num_predict"], "num_ctx": OLLAMA_NUM_CTX, "temperature": profile["temperature"]}
+    if structured and profile["format"]:
+        return {"options": options, "format": profile["format"]}
+    if profile["stop"]:
+        options["stop"] = profile["stop"]
+    return {"options": options}
+
+
+def _pick(text, choices, default):
+    """The choice named in ``text`` (case-insensitive, earliest mention wins), else ``default``."""
+    found = [(m.start(), c) for c in choices for m in [re.search(re.escape(c), text or "", re.IGNORECASE)] if m]
+    return min(found)[1] if found else default
+
+
+def _strings(value):
+    return [str(v).strip() for v in value if str(v).strip()] if isinstance(value, list) else []
+
+
+def _bullets(text):
+    return [line.strip().lstrip("-*•0123456789.) ").strip() for line in (text or "").splitlines() if line.strip()]
+
+
+def _unwrap(content):
+    """String values of a JSON answer that ``num_predict`` cut off, one per line; plain text is returned as is."""
+    if not (content or "").lstrip().startswith("{"):
+        return content
+    fields = {name for profile in PROFILES.values() if profile["format"] for name in profile["format"]["properties"]}
+    return "\n".join(v for v in re.findall(r'"([^"]*)"', content) if v not in fields)
+
+
+def parse_response(task, content):
+    """Parses a model answer into the task's typed result.
+
+    sentiment/topic -> one of SENTIMENTS/TOPICS, skills -> list of names,
+    user_title -> str, readme_quality -> list of improvements,
+    readme_quality_map -> {"sections": [...], "problems": [...]}, anything else -> the text.
+    JSON answers are read by field; plain text (or JSON cut off by ``num_predict``) is parsed leniently.
+    """
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        data = None
+        content = _unwrap(content)
+    profile = BASE_TASKS.get(task, task)
+
+    if profile == "sentiment":
+        return _pick(data.get("sentiment") if data else content, SENTIMENTS, "Neutral")
+    if profile == "topic":
+        return _pick(data.get("topic") if data else content, TOPICS, "Other")
+    if profile == "skills":
+        skills = _strings(data.get("skills")) if data else [content]
+        return [s for s in merge_skill_lists(skills).split(", ") if s]
+    if profile == "user_title":
+        title = str(data.get("title", "")) if data else (content or "").strip().split("\n")[0]
+        return title.replace('"', '').strip()
+    if profile == "readme_quality":
+        return _strings(data.get("improvements")) if data else _bullets(content)
+    if profile == "readme_quality_map":
+        if data:
+            return {"sections": _strings(data.get("sections")), "problems": _strings(data.get("problems"))}
+        return {"sections": [], "problems": _bullets(content)}
+    return content
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+LANGUAGE_COLUMNS = ["repo", "language", "bytes"]
+
+
+def language_records(repo_name, languages):
+    """Long-format rows for one repo's GitHub languages payload ({language: bytes})."""
+    if not isinstance(languages, dict):
+        return []
+    return [{"repo": repo_name, "language": lang, "bytes": int(n)} for lang, n in languages.items() if n]
+
+
+class LanguageMatrix:
+    """Sparse repo x language matrix of code bytes (CSR).
+
+    Shares, totals and group-bys are matrix reductions: summing columns gives
+    per-language totals, and multiplying by a sparse group-indicator matrix
+    aggregates rows by year, user or any other label.
+    """
+
+    def __init__(self, matrix, repos, languages):
+        self.matrix = sparse.csr_matrix(matrix, dtype=np.int64)
+        # pd.Index() would flatten a MultiIndex of (key, repo) rows
+        self.repos = repos if isinstance(repos, pd.Index) else pd.Index(repos)
+        self.languages = pd.Index(languages)
+
+    @classmethod
+    def from_long(cls, long_df, repos):
+        """Builds the matrix from (repo, language, bytes) rows; rows follow the order of ``repos``."""
+        repos = pd.Index(repos)
+        if long_df is None or long_df.empty:
+            return cls(sparse.csr_matrix((len(repos), 0), dtype=np.int64), repos, [])
+        row = repos.get_indexer(long_df["repo"])
+        col, languages = pd.factorize(long_df["language"], sort=True)
+        known = row >= 0
+        matrix = sparse.coo_matrix(
+            (np.asarray(long_df["bytes"], dtype=np.int64)[known], (row[known], col[known])),
+            shape=(len(repos), len(languages))
+        )
+        # Duplicate (repo, language) pairs are summed by the COO -> CSR conversion
+        return cls(matrix.tocsr(), repos, languages)
+
+    @property
+    def shape(self):
+        return self.matrix.shape
+
+    def totals(self):
+        """Bytes per language, largest first."""
+        totals = pd.Series(np.asarray(self.matrix.sum(axis=0)).ravel(), index=self.languages, name="bytes")
+        return totals.sort_values(ascending=False, kind="stable")
+
+    def share(self):
+        totals = self.totals()
+        total = totals.sum()
+        return totals / total if total else totals.astype(float)
+
+    def top_language(self):
+        totals = self.totals()
+        return totals.index[0] if len(totals) and totals.iloc[0] > 0 else "Unknown"
+
+    def aggregate(self, labels):
+        """Sums rows by label (one label per repo). Returns a DataFrame: labels x languages."""
+        codes, groups = pd.factorize(pd.Series(labels), sort=True)
+        keep = codes >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(keep.sum(), dtype=np.int64), (codes[keep], np.flatnonzero(keep))),
+            shape=(len(groups), self.shape[0])
+        )
+        grouped = indicator @ self.matrix
+        return pd.DataFrame(grouped.toarray(), index=groups, columns=self.languages)
+
+    @classmethod
+    def concat(cls, matrices):
+        """Stacks matrices ({key: LanguageMatrix}, e.g. one per user) over the union of their languages.
+
+        Rows are labelled (key, repo); ``aggregate(result.repos.get_level_values(0))`` gives per-key totals.
+        """
+        languages = pd.Index(sorted(set().union(*(m.languages for m in matrices.values())))) if matrices else pd.Index([])
+        blocks, rows = [], []
+        for key, m in matrices.items():
+            # Remap each block's columns into the shared language order
+            remap = sparse.csr_matrix(
+                (np.ones(len(m.languages), dtype=np.int64), (np.arange(len(m.languages)), languages.get_indexer(m.languages))),
+                shape=(len(m.languages), len(languages))
+            )
+            blocks.append(m.matrix @ remap)
+            rows.extend((key, repo) for repo in m.repos)
+        matrix = sparse.vstack(blocks).tocsr() if blocks else sparse.csr_matrix((0, len(languages)), dtype=np.int64)
+        return cls(matrix, pd.MultiIndex.from_tuples(rows, names=["key", "repo"]) if rows else [], languages)
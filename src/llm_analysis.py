@@ -2,34 +2,242 @@ import ollama
 import os
 from dotenv import load_dotenv
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.local_classifiers import LocalSentimentScorer, SkillMatcher, TopicClassifier
+from src.readme_chunking import chunk_readme, merge_skill_lists
+from src.tracing import get_tracer
+from src.generation_profiles import OLLAMA_NUM_CTX, OLLAMA_STRUCTURED_OUTPUT, parse_response, request_args
 
 load_dotenv()
 
 OLLAMA_HOST = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+FAST_PATH_THRESHOLD = float(os.getenv("FAST_PATH_THRESHOLD", "0.7"))
+# READMEs longer than this are processed with map-reduce instead of being truncated
+MAP_REDUCE_MIN_CHARS = 2000
+MAP_REDUCE_CONCURRENCY = int(os.getenv("MAP_REDUCE_CONCURRENCY", "4"))
+README_TOKEN_BUDGET = int(os.getenv("README_TOKEN_BUDGET", "6000"))
+# How long Ollama keeps a model in memory after a request ("5m", "1h", "-1" = forever)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+SKILLS_PROMPT = "Extract a list of technical skills, languages, and frameworks mentioned in the following README content. Return them as a comma-separated list.\n\nREADME:\n{chunk}"
+
+README_QUALITY_PROMPT = """Analyze the quality of this README file.
+        Provide a checklist of 3-5 improvements. Focus on missing standard sections (Installation, Usage, Contributing, License).
+        Keep it concise and actionable.
+        README Content (first 2000 chars):
+        {chunk}
+        """
+
+README_SECTION_PROMPT = """The following is one part of a longer README file.
+        List which standard sections it covers (Installation, Usage, Contributing, License, ...) and note any quality problems in it.
+        Be brief, at most 5 bullet points.
+        README part:
+        {chunk}
+        """
+
+README_REDUCE_PROMPT = """Below are notes on consecutive parts of one README file.
+        Based on all of them, provide a checklist of 3-5 improvements for the whole README.
+        Focus on missing standard sections (Installation, Usage, Contributing, License). A section covered in any part is not missing.
+        Keep it concise and actionable.
+        {notes}
+        """
+
+def parse_keep_alive(value):
+    """Ollama takes either a duration string ("30m") or a number of seconds; -1 keeps the model loaded forever."""
+    if isinstance(value, str):
+        try:
+            return float(value) if "." in value else int(value)
+        except ValueError:
+            return value
+    return value
 
 class OllamaAnalyzer:
-    def __init__(self, model_name="llama3.1"):
-        self.client = ollama.Client(host=OLLAMA_HOST)
+    def __init__(self, model_name="llama3.1", use_fast_path=True, confidence_threshold=FAST_PATH_THRESHOLD, host=None,
+                 client=None, keep_alive=None, structured_output=OLLAMA_STRUCTURED_OUTPUT):
+        self.client = client or ollama.Client(host=host or OLLAMA_HOST)
         self.model = model_name
+        self.keep_alive = parse_keep_alive(keep_alive or OLLAMA_KEEP_ALIVE)
+        self._timing_lock = threading.Lock()
+        self.timings = {"calls": 0, "load_seconds": 0.0, "inference_seconds": 0.0, "last_load_seconds": None}
+        self.use_fast_path = use_fast_path
+        self.confidence_threshold = confidence_threshold
+        self._sentiment_scorer = None
+        self._skill_matcher = None
+        self._topic_classifier = None
+        # task -> {"local": n, "llm": n}
+        self.tier_counts = {}
+        self.map_concurrency = MAP_REDUCE_CONCURRENCY
+        self.token_budget = README_TOKEN_BUDGET
+        # Ask for schema-constrained JSON (see src/generation_profiles.py) instead of free text
+        self.structured_output = structured_output
+        self._usage_lock = threading.Lock()
+        # task -> {"calls", "prompt_tokens", "eval_tokens", "truncated", "seconds"}
+        self.token_usage = {}
 
-    def analyze_sentiment(self, text):
-        prompt = f"Analyze the sentiment of the following commit message. Return only 'Positive', 'Neutral', or 'Negative'.\n\nCommit Message: {text}"
+    def _record_tier(self, task, tier):
+        counts = self.tier_counts.setdefault(task, {"local": 0, "llm": 0})
+        counts[tier] += 1
+        get_tracer().incr("ollama_fast_path_total", task=task, tier=tier)
+
+    def _classifier(self, attr, factory):
+        """Builds a local classifier on first use, so a disabled fast path never loads one."""
+        if getattr(self, attr) is None:
+            setattr(self, attr, factory())
+        return getattr(self, attr)
+
+    def _fast_path(self, task, classify):
+        """Runs a local classifier and returns its answer if it is confident enough, else None."""
+        if not self.use_fast_path:
+            self._record_tier(task, "llm")
+            return None
         try:
+            answer, confidence = classify()
+        except Exception as e:
+            print(f"Local {task} classifier failed: {e}")
+            answer, confidence = None, 0.0
+        if answer and confidence >= self.confidence_threshold:
+            self._record_tier(task, "local")
+            return answer
+        self._record_tier(task, "llm")
+        return None
+
+    def _record_timing(self, response):
+        # Ollama reports durations in nanoseconds; load_duration is non-zero only when the model had to be loaded
+        load = (response.get('load_duration') or 0) / 1e9
+        total = (response.get('total_duration') or 0) / 1e9
+        with self._timing_lock:
+            self.timings["calls"] += 1
+            self.timings["load_seconds"] += load
+            self.timings["inference_seconds"] += max(total - load, 0.0)
+            if load > 0.05:
+                self.timings["last_load_seconds"] = load
+
+    def _record_usage(self, task, response):
+        # done_reason "length" means the answer hit the profile's num_predict cap
+        truncated = response.get('done_reason') == "length"
+        with self._usage_lock:
+            usage = self.token_usage.setdefault(task, {"calls": 0, "prompt_tokens": 0, "eval_tokens": 0, "truncated": 0, "seconds": 0.0})
+            usage["calls"] += 1
+            usage["prompt_tokens"] += response.get('prompt_eval_count') or 0
+            usage["eval_tokens"] += response.get('eval_count') or 0
+            usage["truncated"] += int(truncated)
+            usage["seconds"] += (response.get('total_duration') or 0) / 1e9
+        if truncated:
+            get_tracer().incr("ollama_truncated_total", model=self.model, task=task)
+
+    def _chat(self, prompt, task="chat"):
+        """Sends one prompt with the task's generation profile (token cap, context size, schema or stop sequences)."""
+        tracer = get_tracer()
+        with tracer.span("ollama.chat", model=self.model, task=task) as span:
             response = self.client.chat(model=self.model, messages=[
                 {'role': 'user', 'content': prompt}
-            ])
-            return response['message']['content'].strip()
+            ], keep_alive=self.keep_alive, **request_args(task, self.structured_output))
+            span["prompt_tokens"] = response.get('prompt_eval_count') or 0
+            span["eval_tokens"] = response.get('eval_count') or 0
+            span["load_seconds"] = (response.get('load_duration') or 0) / 1e9
+        tracer.incr("ollama_requests_total", model=self.model, task=task)
+        tracer.incr("ollama_prompt_tokens_total", span["prompt_tokens"], model=self.model, task=task)
+        tracer.incr("ollama_eval_tokens_total", span["eval_tokens"], model=self.model, task=task)
+        self._record_timing(response)
+        self._record_usage(task, response)
+        return response['message']['content'].strip()
+
+    def _ask(self, prompt, task):
+        """``_chat`` plus parsing into the task's typed result (see ``parse_response``)."""
+        return parse_response(task, self._chat(prompt, task=task))
+
+    def preload(self):
+        """Loads the model into Ollama's memory with an empty request. Returns the load time in seconds."""
+        try:
+            # Same num_ctx as every later request, or the first real call would reload the model
+            response = self.client.generate(model=self.model, prompt="", keep_alive=self.keep_alive,
+                                            options={"num_ctx": OLLAMA_NUM_CTX})
+        except Exception as e:
+            print(f"Error preloading {self.model}: {e}")
+            return None
+        load = (response.get('load_duration') or 0) / 1e9
+        with self._timing_lock:
+            self.timings["last_load_seconds"] = load
+            self.timings["load_seconds"] += load
+        return load
+
+    def get_timing_report(self):
+        with self._timing_lock:
+            report = dict(self.timings)
+        report["avg_inference_seconds"] = report["inference_seconds"] / report["calls"] if report["calls"] else 0.0
+        return report
+
+    def get_token_report(self):
+        """Per task: calls, total and average prompt/output tokens, answers cut off at num_predict, seconds per call."""
+        with self._usage_lock:
+            usage = {task: dict(u) for task, u in self.token_usage.items()}
+        for u in usage.values():
+            u["avg_eval_tokens"] = u["eval_tokens"] / u["calls"]
+            u["avg_seconds"] = u["seconds"] / u["calls"]
+        return usage
+
+    def _map_chunks(self, prompt_template, chunks, task):
+        """Runs one prompt per chunk with bounded concurrency. Failed chunks are dropped; raises only if all fail."""
+        def run(chunk):
+            try:
+                return self._ask(prompt_template.format(chunk=chunk), task=task)
+            except Exception as e:
+                print(f"Error processing README chunk: {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.map_concurrency, len(chunks)))) as pool:
+            results = list(pool.map(run, chunks))
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        return [r for r in results if not isinstance(r, Exception)]
+
+    def _use_map_reduce(self, readme_content, map_reduce):
+        if map_reduce is None:
+            return len(readme_content or "") > MAP_REDUCE_MIN_CHARS
+        return map_reduce
+
+    def get_tier_report(self):
+        """Returns, per task, how many calls each tier handled and the fraction kept off the LLM."""
+        report = {}
+        for task, counts in self.tier_counts.items():
+            total = counts["local"] + counts["llm"]
+            report[task] = {
+                "local": counts["local"],
+                "llm": counts["llm"],
+                "total": total,
+                "local_fraction": counts["local"] / total if total else 0.0
+            }
+        return report
+
+    def analyze_sentiment(self, text):
+        answer = self._fast_path("sentiment", lambda: self._classifier("_sentiment_scorer", LocalSentimentScorer).score(text))
+        if answer:
+            return answer
+
+        prompt = f"Analyze the sentiment of the following commit message. Return only 'Positive', 'Neutral', or 'Negative'.\n\nCommit Message: {text}"
+        try:
+            return self._ask(prompt, task="sentiment")
         except Exception as e:
             print(f"Error in sentiment analysis: {e}")
             return "Error"
 
-    def extract_skills(self, readme_content):
-        prompt = f"Extract a list of technical skills, languages, and frameworks mentioned in the following README content. Return them as a comma-separated list.\n\nREADME:\n{readme_content[:2000]}" # Limit context
+    def extract_skills(self, readme_content, map_reduce=None):
+        def match_skills():
+            skills, confidence = self._classifier("_skill_matcher", SkillMatcher).match(readme_content)
+            return ", ".join(skills), confidence
+
+        answer = self._fast_path("skills", match_skills)
+        if answer:
+            return answer
+
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'user', 'content': prompt}
-            ])
-            return response['message']['content'].strip()
+            if self._use_map_reduce(readme_content, map_reduce):
+                chunks = chunk_readme(readme_content, token_budget=self.token_budget)
+                partials = self._map_chunks(SKILLS_PROMPT, chunks, task="skills_map")
+                return merge_skill_lists(", ".join(skills) for skills in partials)
+            return ", ".join(self._ask(SKILLS_PROMPT.format(chunk=readme_content[:MAP_REDUCE_MIN_CHARS]), task="skills"))
         except Exception as e:
             print(f"Error in skill extraction: {e}")
             if "connection" in str(e).lower() or "refused" in str(e).lower():
@@ -37,15 +245,17 @@ class OllamaAnalyzer:
             return f"Error: {str(e)}"
 
     def classify_topic(self, repo_description):
+        """Returns one of the topic names, or None if the LLM could not be reached, so callers can retry rather than store "Other"."""
+        answer = self._fast_path("topic", lambda: self._classifier("_topic_classifier", TopicClassifier).classify(repo_description))
+        if answer:
+            return answer
+
         prompt = f"Classify the following repository description into one of these topics: 'Web Development', 'Data Science', 'Machine Learning', 'Mobile App', 'DevOps', 'Other'. Return only the topic name.\n\nDescription: {repo_description}"
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'user', 'content': prompt}
-            ])
-            return response['message']['content'].strip()
+            return self._ask(prompt, task="topic")
         except Exception as e:
             print(f"Error in topic classification: {e}")
-            return "Other"
+            return None
 
     def compare_models(self, task_prompt, models=["llama3.1", "mistral"]):
         results = {}
@@ -54,11 +264,12 @@ class OllamaAnalyzer:
             try:
                 response = self.client.chat(model=model, messages=[
                     {'role': 'user', 'content': task_prompt}
-                ])
+                ], keep_alive=self.keep_alive, **request_args("chat", structured=False))
                 duration = time.time() - start_time
                 results[model] = {
                     "response": response['message']['content'],
-                    "time": duration
+                    "time": duration,
+                    "load_time": (response.get('load_duration') or 0) / 1e9
                 }
             except Exception as e:
                 results[model] = {"error": str(e)}
@@ -73,26 +284,23 @@ class OllamaAnalyzer:
         - Most Productive Day: {stats.get('most_productive_day')}
         """
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'user', 'content': prompt}
-            ])
-            return response['message']['content'].strip().replace('"', '')
+            return self._ask(prompt, task="user_title") or "The GitHub Wanderer"
         except Exception as e:
             print(f"Error generating title: {e}")
             return "The GitHub Wanderer"
 
-    def analyze_readme_quality(self, readme_content):
-        prompt = f"""Analyze the quality of this README file.
-        Provide a checklist of 3-5 improvements. Focus on missing standard sections (Installation, Usage, Contributing, License).
-        Keep it concise and actionable.
-        README Content (first 2000 chars):
-        {readme_content[:2000]}
-        """
+    def analyze_readme_quality(self, readme_content, map_reduce=None):
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'user', 'content': prompt}
-            ])
-            return response['message']['content'].strip()
+            if not self._use_map_reduce(readme_content, map_reduce):
+                improvements = self._ask(README_QUALITY_PROMPT.format(chunk=readme_content[:MAP_REDUCE_MIN_CHARS]), task="readme_quality")
+            else:
+                chunks = chunk_readme(readme_content, token_budget=self.token_budget)
+                notes = self._map_chunks(README_SECTION_PROMPT, chunks, task="readme_quality_map")
+                improvements = self._ask(README_REDUCE_PROMPT.format(notes="\n\n".join(
+                    f"Part {i + 1}:\nSections: {', '.join(note['sections']) or 'none'}\nProblems: {'; '.join(note['problems']) or 'none'}"
+                    for i, note in enumerate(notes)
+                )), task="readme_quality_reduce")
+            return "\n".join(f"- {item}" for item in improvements) or "No improvements suggested."
         except Exception as e:
             print(f"Error analyzing README: {e}")
             if "connection" in str(e).lower() or "refused" in str(e).lower():
@@ -100,6 +308,55 @@ class OllamaAnalyzer:
             return f"Error: {str(e)}"
 
 
+# --- Process-wide registry ---
+# Streamlit re-runs the dashboard script on every interaction; sharing clients and
+# analyzers here keeps HTTP connections and fast-path classifiers warm across reruns and sessions.
+_registry_lock = threading.Lock()
+_clients = {}
+_analyzers = {}
+_preloads = {}
+
+def get_client(host=None):
+    host = host or OLLAMA_HOST
+    with _registry_lock:
+        if host not in _clients:
+            _clients[host] = ollama.Client(host=host)
+        return _clients[host]
+
+def get_analyzer(model_name="llama3.1", host=None, use_fast_path=True, keep_alive=None):
+    """Returns the shared analyzer for this host/model/keep-alive, creating it on first use.
+
+    keep_alive is part of the key rather than set on a shared analyzer, so one
+    session's setting never changes how long another session's calls keep the model loaded.
+    """
+    host = host or OLLAMA_HOST
+    client = get_client(host)
+    keep_alive = parse_keep_alive(keep_alive or OLLAMA_KEEP_ALIVE)
+    key = (host, model_name, use_fast_path, keep_alive)
+    with _registry_lock:
+        analyzer = _analyzers.get(key)
+        if analyzer is None:
+            analyzer = OllamaAnalyzer(model_name=model_name, use_fast_path=use_fast_path, client=client, keep_alive=keep_alive)
+            # Analyzers for the same model share one timing record, since they hit the same loaded model
+            sibling = next((a for k, a in _analyzers.items() if k[:2] == (host, model_name)), None)
+            if sibling is not None:
+                analyzer.timings, analyzer._timing_lock = sibling.timings, sibling._timing_lock
+            _analyzers[key] = analyzer
+    return analyzer
+
+def preload_model(model_name="llama3.1", host=None, keep_alive=None):
+    """Starts loading a model in a background thread, once per process per host/model."""
+    host = host or OLLAMA_HOST
+    analyzer = get_analyzer(model_name, host=host, keep_alive=keep_alive)
+    with _registry_lock:
+        thread = _preloads.get((host, model_name))
+        if thread is None:
+            thread = threading.Thread(target=analyzer.preload, daemon=True)
+            _preloads[(host, model_name)] = thread
+            thread.start()
+    return thread
+
+
 if __name__ == "__main__":
     analyzer = OllamaAnalyzer()
     print("Testing connection...")
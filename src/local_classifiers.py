@@ -0,0 +1,243 @@
+import re
+import numpy as np
+
+try:
+    from textblob import TextBlob
+except ImportError:
+    TextBlob = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Seed descriptions used to build one centroid per topic
+TOPIC_SEEDS = {
+    "Web Development": [
+        "A responsive website built with React and Node.js",
+        "REST API backend server with Express, Django or Flask",
+        "Frontend web app using HTML, CSS, JavaScript and TypeScript",
+        "Full-stack web application with authentication and a database",
+    ],
+    "Data Science": [
+        "Exploratory data analysis and visualization with pandas and matplotlib",
+        "Jupyter notebooks analysing a dataset with statistics",
+        "Dashboard for data analytics, charts and reporting",
+        "Data cleaning, ETL pipeline and SQL queries",
+    ],
+    "Machine Learning": [
+        "Train a neural network model with PyTorch or TensorFlow",
+        "Deep learning image classification and computer vision",
+        "Natural language processing model, transformers and LLM fine-tuning",
+        "Machine learning prediction with scikit-learn regression and classification",
+    ],
+    "Mobile App": [
+        "Android app written in Kotlin or Java",
+        "iOS application built with Swift and SwiftUI",
+        "Cross-platform mobile app with Flutter or React Native",
+        "Mobile application for phones and tablets",
+    ],
+    "DevOps": [
+        "Docker and Kubernetes deployment configuration",
+        "CI/CD pipeline with GitHub Actions and Jenkins",
+        "Infrastructure as code with Terraform and Ansible",
+        "Monitoring, logging and cloud automation scripts for AWS",
+    ],
+}
+
+# Below this cosine similarity to the nearest topic centroid, a description is treated as out of domain
+# and left to the LLM (which can answer "Other"). TF-IDF similarities run lower than embedding ones.
+TOPIC_SIMILARITY_FLOOR = {"embedding": 0.35, "tfidf": 0.2}
+# With TF-IDF, a single shared word ("written", "kotlin") is too thin to trust on its own
+MIN_SHARED_TERMS = 2
+
+# Canonical skill name -> regex matched case-insensitively against the README.
+# Words that are also plain English ("react", "rust", "express", "node") only count in their
+# framework spelling, and tools every README mentions (git) are left out.
+SKILL_PATTERNS = {
+    "Python": r"\bpython\b",
+    "JavaScript": r"\bjavascript\b|\bES6\b",
+    "TypeScript": r"\btypescript\b",
+    "Java": r"\bjava\b(?!script)",
+    "Kotlin": r"\bkotlin\b",
+    "Swift": r"\bswift(?:ui)?\b",
+    "Go": r"\bgolang\b|\bgo\s+modules?\b",
+    "Rust": r"(?-i:\bRust\b)|\bcargo\b",
+    "C++": r"\bc\+\+|\bcpp\b",
+    "C#": r"\bc#|\.net\b",
+    "Ruby": r"\bruby\b",
+    "PHP": r"\bphp\b",
+    "HTML": r"\bhtml5?\b",
+    "CSS": r"\bcss3?\b|\btailwind(?:css)?\b",
+    "SQL": r"\bsql\b|\bpostgres(?:ql)?\b|\bmysql\b|\bsqlite\b",
+    "React": r"\breact\.?js\b|(?-i:\bReact\b)(?!\s+[Nn]ative)",
+    "React Native": r"\breact\s+native\b",
+    "Vue.js": r"\bvue(?:\.?js)?\b",
+    "Angular": r"\bangular\b",
+    "Next.js": r"\bnext\.?js\b",
+    "Node.js": r"\bnode\.?js\b|\bnpm\b",
+    "Express": r"\bexpress\.?js\b",
+    "Django": r"\bdjango\b",
+    "Flask": r"\bflask\b",
+    "FastAPI": r"\bfastapi\b",
+    "Streamlit": r"\bstreamlit\b",
+    "Flutter": r"\bflutter\b",
+    "Pandas": r"\bpandas\b",
+    "NumPy": r"\bnumpy\b",
+    "scikit-learn": r"\bscikit-learn\b|\bsklearn\b",
+    "TensorFlow": r"\btensorflow\b|\bkeras\b",
+    "PyTorch": r"\bpytorch\b|\bimport torch\b",
+    "MongoDB": r"\bmongo(?:db)?\b",
+    "Redis": r"\bredis\b",
+    "GraphQL": r"\bgraphql\b",
+    "Docker": r"\bdocker\b",
+    "Kubernetes": r"\bkubernetes\b|\bk8s\b",
+    "Terraform": r"\bterraform\b",
+    "AWS": r"\baws\b|\bamazon web services\b",
+}
+
+# Lines that state the stack rather than mention it in passing: badges, install commands and manifests
+EVIDENCE_LINE_RE = re.compile(
+    r"shields\.io|badge|\b(?:pip|pipx|npm|yarn|pnpm|gem|cargo|go|composer|brew|conda)\s+(?:install|add|get)\b|"
+    r"requirements\.txt|pyproject\.toml|setup\.py|package\.json|cargo\.toml|go\.mod|pom\.xml|build\.gradle|"
+    r"gemfile|composer\.json|dockerfile|docker-compose|docker\s+(?:run|build)",
+    re.IGNORECASE,
+)
+FENCE_INFO_RE = re.compile(r"^\s*(?:```|~~~)\s*([\w+#.-]+)", re.MULTILINE)
+# Distinct skills that need such evidence before the matcher's answer is trusted over the LLM
+MIN_EVIDENCE_HITS = 2
+
+# Commit messages that are neutral by construction and never need a model
+ROUTINE_COMMIT_RE = re.compile(
+    r"^\s*(initial commit|first commit|init|merge (branch|pull request|remote-tracking branch)\b.*|update [\w./-]+|"
+    r"add files via upload|bump version|wip|v?\d+(\.\d+)+)\s*$",
+    re.IGNORECASE,
+)
+
+POSITIVE_WORDS = {"add", "improve", "improved", "great", "awesome", "clean", "optimize", "faster", "nice", "better", "success", "finally", "love"}
+NEGATIVE_WORDS = {"broken", "bug", "crash", "hack", "ugly", "terrible", "fail", "failing", "revert", "wrong", "hate", "mess", "worse"}
+
+
+class LocalSentimentScorer:
+    """TextBlob polarity scorer with a tiny word lexicon fallback."""
+
+    def score(self, text):
+        text = (text or "").strip()
+        if not text or ROUTINE_COMMIT_RE.match(text.splitlines()[0]):
+            return "Neutral", 0.95
+
+        if TextBlob is not None:
+            sentiment = TextBlob(text).sentiment
+            polarity, subjectivity = sentiment.polarity, sentiment.subjectivity
+        else:
+            words = re.findall(r"[a-z]+", text.lower())
+            pos = sum(w in POSITIVE_WORDS for w in words)
+            neg = sum(w in NEGATIVE_WORDS for w in words)
+            polarity = (pos - neg) / max(pos + neg, 1)
+            subjectivity = (pos + neg) / max(len(words), 1)
+
+        if polarity >= 0.1:
+            return "Positive", min(1.0, 0.5 + abs(polarity))
+        if polarity <= -0.1:
+            return "Negative", min(1.0, 0.5 + abs(polarity))
+        # Objective text with no opinion words is safely neutral; mixed text is not
+        return "Neutral", 0.75 if subjectivity == 0 else 0.4
+
+
+class SkillMatcher:
+    """Regex matcher over a catalog of well-known languages and frameworks."""
+
+    def __init__(self, patterns=None):
+        patterns = patterns or SKILL_PATTERNS
+        self.patterns = {name: re.compile(rx, re.IGNORECASE) for name, rx in patterns.items()}
+
+    def match(self, readme_content):
+        """Returns (skills mentioned anywhere, confidence).
+
+        Confidence only comes from skills backed by a badge, an install or
+        manifest line, or a fenced code block's language tag; mentions in
+        prose are listed but do not count.
+        """
+        text = readme_content or ""
+        skills = [name for name, rx in self.patterns.items() if rx.search(text)]
+        evidence = "\n".join(line for line in text.splitlines() if EVIDENCE_LINE_RE.search(line))
+        evidence += "\n" + " ".join(FENCE_INFO_RE.findall(text))
+        backed = [name for name in skills if self.patterns[name].search(evidence)]
+        confidence = 0.3 * len(backed) if len(backed) < MIN_EVIDENCE_HITS else min(1.0, 0.5 + 0.15 * len(backed))
+        # Long READMEs usually mention more than the catalog knows about
+        if len(text) > 4000:
+            confidence *= 0.8
+        return skills, confidence
+
+
+class TopicClassifier:
+    """Nearest-centroid topic classifier over sentence embeddings.
+
+    Uses sentence-transformers when installed and falls back to TF-IDF
+    vectors fitted on the seed descriptions otherwise. There is no "Other"
+    centroid: descriptions too far from every topic get a low confidence,
+    so the caller asks the LLM instead.
+    """
+
+    def __init__(self, seeds=None, embedding_model="all-MiniLM-L6-v2", similarity_floor=None):
+        self.seeds = seeds or TOPIC_SEEDS
+        self.topics = list(self.seeds.keys())
+        self._encoder = None
+        self._vectorizer = None
+        if SentenceTransformer is not None:
+            try:
+                self._encoder = SentenceTransformer(embedding_model)
+            except Exception as e:
+                print(f"Could not load embedding model {embedding_model}: {e}")
+
+        if self._encoder is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            corpus = [text for texts in self.seeds.values() for text in texts]
+            # Stop words would otherwise let "for" or "with" count as overlap with a topic
+            self._vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True, stop_words="english").fit(corpus)
+            unigrams = np.array([" " not in term for term in self._vectorizer.get_feature_names_out()])
+            # Per topic: which single words appear in its seeds
+            self._topic_terms = np.vstack([
+                (self._vectorizer.transform(self.seeds[topic]).toarray().sum(axis=0) > 0) & unigrams for topic in self.topics
+            ])
+        backend = "embedding" if self._encoder is not None else "tfidf"
+        self.similarity_floor = similarity_floor if similarity_floor is not None else TOPIC_SIMILARITY_FLOOR[backend]
+
+        centroids = []
+        for topic in self.topics:
+            vectors = self._embed(self.seeds[topic])
+            centroids.append(vectors.mean(axis=0))
+        self.centroids = self._normalize(np.vstack(centroids))
+
+    def _embed(self, texts):
+        if self._encoder is not None:
+            return np.asarray(self._encoder.encode(texts))
+        return self._vectorizer.transform(texts).toarray()
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _shared_terms(self, vector, topic_index):
+        if self._encoder is not None:
+            return MIN_SHARED_TERMS
+        return int(np.count_nonzero((vector > 0) & self._topic_terms[topic_index]))
+
+    def classify(self, description):
+        if not description or not description.strip():
+            return "Other", 1.0
+        vector = self._normalize(self._embed([description]))[0]
+        sims = self.centroids @ vector
+        if not sims.any():
+            # No overlap with any seed vocabulary
+            return "Other", 0.0
+        order = np.argsort(sims)[::-1]
+        best, runner_up = sims[order[0]], sims[order[1]]
+        # Margin over the runner-up: 1.0 when no other topic matches at all
+        confidence = float((best - runner_up) / max(best, 1e-9))
+        if best < self.similarity_floor or self._shared_terms(vector, order[0]) < MIN_SHARED_TERMS:
+            # Nearest topic, but too little in common with it for the margin to mean anything
+            confidence = float(min(confidence, 0.5 * min(best / self.similarity_floor, 1.0)))
+        return self.topics[order[0]], confidence
@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockOllamaServer:
+    """Minimal stand-in for the Ollama HTTP API, for offline benchmarks and tests.
+
+    Implements ``/api/chat``, ``/api/generate`` (streaming and non-streaming),
+    ``/api/tags`` and ``/api/version``. Responses carry the same timing fields
+    as a real server (``load_duration``, ``prompt_eval_*``, ``eval_*``, in
+    nanoseconds). The first request per model pays ``load_time`` seconds to
+    simulate loading the weights, and models are "unloaded" again when a
+    request sets ``keep_alive`` to 0.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, tokens_per_second=200.0, prompt_tokens_per_second=2000.0,
+                 load_time=0.2, response_text="This is a mock response from the local Ollama stand-in."):
+        self.tokens_per_second = tokens_per_second
+        self.prompt_tokens_per_second = prompt_tokens_per_second
+        self.load_time = load_time
+        self.response_text = response_text
+        self.loaded_models = set()
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _load(self, model, keep_alive):
+        with self._lock:
+            self.request_count += 1
+            needs_load = model not in self.loaded_models
+            self.loaded_models.add(model)
+        if needs_load:
+            time.sleep(self.load_time)
+        if keep_alive in (0, "0", "0s"):
+            with self._lock:
+                self.loaded_models.discard(model)
+        return self.load_time if needs_load else 0.0
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, payload, status=200):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/api/tags":
+                    self._send_json({"models": [{"name": m, "model": m} for m in sorted(server.loaded_models)]})
+                elif self.path == "/api/version":
+                    self._send_json({"version": "0.0.0-mock"})
+                else:
+                    self._send_json({"error": "not found"}, status=404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if self.path not in ("/api/chat", "/api/generate"):
+                    self._send_json({"error": "not found"}, status=404)
+                    return
+                server._respond(self, request, chat=self.path == "/api/chat")
+
+        return Handler
+
+    def _respond(self, handler, request, chat):
+        model = request.get("model", "mock")
+        if chat:
+            prompt = " ".join(m.get("content", "") for m in request.get("messages", []))
+        else:
+            prompt = request.get("prompt", "")
+
+        load_seconds = self._load(model, request.get("keep_alive"))
+        # Empty generate requests only load the model, like the real server
+        words = self.response_text.split() if prompt else []
+        num_predict = (request.get("options") or {}).get("num_predict")
+        done_reason = "length" if num_predict and len(words) > num_predict else "stop"
+        if num_predict:
+            words = words[:num_predict]
+        prompt_tokens = max(1, len(prompt.split())) if prompt else 0
+        prompt_seconds = prompt_tokens / self.prompt_tokens_per_second
+        token_seconds = 1.0 / self.tokens_per_second
+        time.sleep(prompt_seconds)
+
+        def chunk(text, done, eval_seconds=0.0):
+            payload = {
+                "model": model,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "done": done,
+            }
+            if chat:
+                payload["message"] = {"role": "assistant", "content": text}
+            else:
+                payload["response"] = text
+            if done:
+                payload.update({
+                    "done_reason": done_reason,
+                    "total_duration": int((load_seconds + prompt_seconds + eval_seconds) * 1e9),
+                    "load_duration": int(load_seconds * 1e9),
+                    "prompt_eval_count": prompt_tokens,
+                    "prompt_eval_duration": int(prompt_seconds * 1e9),
+                    "eval_count": len(words),
+                    "eval_duration": int(eval_seconds * 1e9),
+                })
+            return payload
+
+        if request.get("stream", True):
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/x-ndjson")
+            handler.end_headers()
+            started = time.perf_counter()
+            for i, word in enumerate(words):
+                time.sleep(token_seconds)
+                text = word if i == 0 else " " + word
+                handler.wfile.write((json.dumps(chunk(text, False)) + "\n").encode("utf-8"))
+                handler.wfile.flush()
+            final = chunk("", True, time.perf_counter() - started)
+            handler.wfile.write((json.dumps(final) + "\n").encode("utf-8"))
+            handler.wfile.flush()
+        else:
+            time.sleep(token_seconds * len(words))
+            handler._send_json(chunk(" ".join(words), True, token_seconds * len(words)))
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a mock Ollama server.")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--tokens-per-second", type=float, default=200.0)
+    args = parser.parse_args()
+    mock = MockOllamaServer(port=args.port, tokens_per_second=args.tokens_per_second)
+    print(f"Mock Ollama listening on {mock.url}")
+    mock.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
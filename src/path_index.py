@@ -0,0 +1,55 @@
+from bisect import bisect_left
+
+# Directories whose files say nothing about the repo's own stack
+VENDORED_DIRS = ("node_modules/", "vendor/", "third_party/", "site-packages/")
+
+
+class PathIndex:
+    """Case-insensitive lookup over a repository's file paths.
+
+    Two sorted arrays answer the questions the health and stack rules ask
+    with a binary search each: is there a file at this exact path, which
+    paths have this file name at any depth, and is there anything under a
+    directory. A root-only file listing works too; it is just a tree
+    without subdirectories.
+    """
+
+    def __init__(self, paths):
+        self.paths = sorted({p.lower().strip("/") for p in paths if p})
+        # (basename, path) pairs, so a file name can be found at any depth
+        self._by_name = sorted((p.rsplit("/", 1)[-1], p) for p in self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def has(self, path):
+        path = path.lower().strip("/")
+        i = bisect_left(self.paths, path)
+        return i < len(self.paths) and self.paths[i] == path
+
+    def has_prefix(self, prefix):
+        prefix = prefix.lower()
+        i = bisect_left(self.paths, prefix)
+        return i < len(self.paths) and self.paths[i].startswith(prefix)
+
+    def find_name(self, name, max_depth=None, skip_vendored=True):
+        """Paths whose file name is ``name``. ``max_depth`` 0 means the root only."""
+        name = name.lower()
+        i = bisect_left(self._by_name, (name, ""))
+        found = []
+        while i < len(self._by_name) and self._by_name[i][0] == name:
+            path = self._by_name[i][1]
+            i += 1
+            if max_depth is not None and path.count("/") > max_depth:
+                continue
+            if skip_vendored and any(f"/{d}" in f"/{path}" for d in VENDORED_DIRS):
+                continue
+            found.append(path)
+        return found
+
+    def has_name(self, name, max_depth=None):
+        return bool(self.find_name(name, max_depth=max_depth))
+
+    def has_in_dirs(self, name, dirs=("",)):
+        """True if ``name`` exists directly inside any of ``dirs`` ("" is the root)."""
+        return any(self.has(f"{d.strip('/')}/{name}" if d else name) for d in dirs)
@@ -0,0 +1,91 @@
+import re
+
+# Rough heuristic for llama/mistral tokenizers on English markdown
+CHARS_PER_TOKEN = 4
+
+HEADING_RE = re.compile(r"^#{1,6}\s")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_markdown_sections(text):
+    """Splits markdown into sections, starting a new one at every ATX heading outside code fences."""
+    sections = []
+    current = []
+    in_fence = False
+    for line in (text or "").splitlines(keepends=True):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and HEADING_RE.match(line) and current:
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("".join(current))
+    return [s for s in sections if s.strip()]
+
+
+def _split_oversized(section, max_chars):
+    """Breaks a section that does not fit in one chunk on paragraphs, then hard-wraps."""
+    pieces = []
+    buffer = ""
+    for paragraph in re.split(r"(\n\s*\n)", section):
+        if len(buffer) + len(paragraph) <= max_chars:
+            buffer += paragraph
+            continue
+        if buffer.strip():
+            pieces.append(buffer)
+        buffer = paragraph
+        while len(buffer) > max_chars:
+            pieces.append(buffer[:max_chars])
+            buffer = buffer[max_chars:]
+    if buffer.strip():
+        pieces.append(buffer)
+    return pieces
+
+
+def chunk_readme(text, max_chunk_tokens=600, token_budget=6000):
+    """Packs markdown sections into chunks of at most ``max_chunk_tokens``.
+
+    Sections are kept whole where possible. Once the per-document
+    ``token_budget`` is spent the remaining sections are dropped, so a huge
+    README costs a bounded number of map calls.
+    """
+    max_chars = max_chunk_tokens * CHARS_PER_TOKEN
+    budget_chars = token_budget * CHARS_PER_TOKEN
+
+    chunks = []
+    current = ""
+    used = 0
+    for section in split_markdown_sections(text):
+        for piece in _split_oversized(section, max_chars):
+            if used + len(piece) > budget_chars:
+                piece = piece[:budget_chars - used]
+                if not piece.strip():
+                    break
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += piece
+            used += len(piece)
+            if used >= budget_chars:
+                break
+        if used >= budget_chars:
+            break
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def merge_skill_lists(partials):
+    """Merges comma-separated skill lists, de-duplicating case-insensitively and keeping first-seen order."""
+    seen = {}
+    for partial in partials:
+        for item in re.split(r"[,\n]", partial or ""):
+            skill = item.strip().strip("-*• ").strip()
+            if skill and skill.lower() not in seen and len(skill) <= 40:
+                seen[skill.lower()] = skill
+    return ", ".join(seen.values())
@@ -0,0 +1,141 @@
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+from src.tracing import get_tracer
+
+FORECAST_COLUMNS = ["repo_name", "ds", "y", "yhat", "yhat_lower", "yhat_upper", "is_forecast"]
+# A repo needs this many commits, in at least this many distinct periods, to be worth a model of its own
+MIN_COMMITS = 10
+MIN_ACTIVE_PERIODS = 4
+
+
+def repo_series(commits_df, freq="W", end=None):
+    """Commit counts per repo and period, as {repo: Series}.
+
+    Every series runs from the repo's first period to ``end`` (default: the
+    last period with a commit in any repo), zeros included, so a repo that
+    went quiet ends in a run of zeros rather than just stopping.
+    """
+    if commits_df is None or commits_df.empty:
+        return {}
+    dates = pd.DatetimeIndex(pd.to_datetime(commits_df["date"], utc=True)).tz_convert(None)
+    frame = pd.DataFrame({"repo_name": commits_df["repo_name"].astype(object).to_numpy(), "ds": dates})
+    counts = frame.groupby(["repo_name", pd.Grouper(key="ds", freq=freq)]).size()
+    last = counts.index.get_level_values("ds").max() if end is None else pd.Timestamp(end)
+    series = {}
+    for repo, group in counts.groupby(level="repo_name", sort=True):
+        group = group.droplevel("repo_name")
+        series[repo] = group.reindex(pd.date_range(group.index.min(), last, freq=freq), fill_value=0).rename("y")
+    return series
+
+
+def _fit_series(args):
+    """Fits one repo's series and predicts ``periods`` ahead. Runs inside worker processes, so it only takes and returns plain data."""
+    repo, ds, y, periods, freq = args
+    # cmdstanpy logs every fit at INFO, and installs its own INFO handler unless the logger already has one
+    logger = logging.getLogger("cmdstanpy")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.WARNING)
+    try:
+        history = pd.DataFrame({"ds": ds, "y": y})
+        span_days = (history["ds"].iloc[-1] - history["ds"].iloc[0]).days
+        # Weekly bins have no weekly or daily cycle; yearly seasonality needs two years to be identifiable
+        m = Prophet(yearly_seasonality=span_days >= 730, weekly_seasonality=False, daily_seasonality=False)
+        m.fit(history)
+        # Prophet samples the uncertainty interval from the global RNG. A fixed seed gives the same band
+        # whichever process runs the fit; the caller's RNG state is restored afterwards (the serial path runs in-process)
+        state = np.random.get_state()
+        np.random.seed(0)
+        try:
+            forecast = m.predict(m.make_future_dataframe(periods=periods, freq=freq))
+        finally:
+            np.random.set_state(state)
+    except Exception as e:
+        return {"repo_name": repo, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "repo_name": repo,
+        "ds": forecast["ds"].to_numpy(),
+        # Commit counts cannot go negative
+        "yhat": forecast["yhat"].clip(lower=0).to_numpy(),
+        "yhat_lower": forecast["yhat_lower"].clip(lower=0).to_numpy(),
+        "yhat_upper": forecast["yhat_upper"].clip(lower=0).to_numpy(),
+        "y": np.concatenate([y, np.full(len(forecast) - len(y), np.nan)])
+    }
+
+
+class RepoForecaster:
+    """One Prophet forecast per repository, fitted in a process pool.
+
+    Repos with too little history are skipped (listed in ``skipped``); the
+    rest are independent fits, so they split across cores with only the
+    small count arrays crossing process boundaries. ``forecast`` returns
+    one long frame (FORECAST_COLUMNS) covering every modelled repo.
+    """
+
+    def __init__(self, periods=12, freq="W", min_commits=MIN_COMMITS, min_active_periods=MIN_ACTIVE_PERIODS, max_workers=None):
+        self.periods = periods
+        self.freq = freq
+        self.min_commits = min_commits
+        self.min_active_periods = min_active_periods
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.skipped = {}
+        self.errors = {}
+
+    @property
+    def cache_tag(self):
+        """Identifies the parameters the results depend on, for per-snapshot caching."""
+        return f"{self.freq}:{self.periods}:{self.min_commits}:{self.min_active_periods}"
+
+    def sparse_reason(self, series):
+        if series.sum() < self.min_commits:
+            return f"{int(series.sum())} commits (< {self.min_commits})"
+        if (series > 0).sum() < self.min_active_periods:
+            return f"{int((series > 0).sum())} active periods (< {self.min_active_periods})"
+        return None
+
+    def forecast(self, commits_df):
+        series = repo_series(commits_df, freq=self.freq)
+        self.skipped = {repo: reason for repo, s in series.items() for reason in [self.sparse_reason(s)] if reason}
+        jobs = [(repo, s.index.to_numpy(), s.to_numpy(dtype=float), self.periods, self.freq)
+                for repo, s in series.items() if repo not in self.skipped]
+        workers = min(self.max_workers, len(jobs))
+        with get_tracer().span("analysis.repo_forecasts", repos=len(jobs), skipped=len(self.skipped), workers=workers):
+            if workers <= 1:
+                results = [_fit_series(job) for job in jobs]
+            else:
+                # Spawned, not forked, for the same reason as TeamAnalyzer: the dashboard server is multithreaded
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    results = list(pool.map(_fit_series, jobs))
+
+        self.errors = {r["repo_name"]: r["error"] for r in results if "error" in r}
+        for repo, error in self.errors.items():
+            print(f"Forecast skipped {repo}: {error}")
+        frames = [
+            pd.DataFrame({**{k: r[k] for k in ("ds", "y", "yhat", "yhat_lower", "yhat_upper")}, "repo_name": r["repo_name"]})
+            for r in results if "error" not in r
+        ]
+        if not frames:
+            return pd.DataFrame(columns=FORECAST_COLUMNS)
+        frame = pd.concat(frames, ignore_index=True)
+        frame["is_forecast"] = frame["y"].isna()
+        return frame[FORECAST_COLUMNS]
+
+    @staticmethod
+    def outlook(frame, periods=12):
+        """Per repo: mean commits per period over the last ``periods`` observed and the next ``periods`` forecast.
+
+        Sorted by change, so the repos expected to go quiet come first.
+        """
+        columns = ["repo_name", "recent", "forecast", "change"]
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+        recent = frame[~frame["is_forecast"]].groupby("repo_name")["y"].apply(lambda y: y.tail(periods).mean())
+        ahead = frame[frame["is_forecast"]].groupby("repo_name")["yhat"].apply(lambda y: y.head(periods).mean())
+        table = pd.DataFrame({"recent": recent, "forecast": ahead}).rename_axis("repo_name").reset_index()
+        table["change"] = table["forecast"] - table["recent"]
+        return table.sort_values("change", kind="stable").reset_index(drop=True)[columns]
@@ -0,0 +1,192 @@
+import os
+import json
+import hashlib
+import time
+from html import escape
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from src.traditional_ds import TraditionalAnalyzer
+from src.downsampling import line_figure
+
+BUNDLE_VERSION = 2
+# Tables written as JSON records (keeps list columns such as "stack" intact)
+BUNDLE_TABLES = ("health", "clusters", "forecast")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _json_default(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return str(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+
+def _write_json(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, default=_json_default)
+    os.replace(tmp_path, path)
+
+
+def _render_html(login, manifest, tables):
+    """Static, self-contained HTML report. plotly.js is inlined once, in the first figure."""
+    figures = []
+    langs = manifest["stats"].get("top_languages", {})
+    if langs:
+        figures.append(("Top Languages", px.pie(values=list(langs.values()), names=list(langs.keys()))))
+    forecast = tables.get("forecast")
+    if forecast is not None and not forecast.empty:
+        figures.append(("Predicted Commit Activity", line_figure(forecast, 'ds', 'yhat', band=('yhat_lower', 'yhat_upper'))))
+
+    parts = []
+    for i, (title, fig) in enumerate(figures):
+        parts.append(f"<h2>{title}</h2>")
+        parts.append(fig.to_html(full_html=False, include_plotlyjs="inline" if i == 0 else False))
+
+    stats = manifest["user_stats"]
+    # Login, persona and repo-derived titles come from GitHub or the LLM, so they are escaped; to_html escapes the table itself
+    timeline = "".join(f"<li>{e['date']} {e['icon']} {escape(str(e['title']))}</li>" for e in manifest["timeline"])
+    health = tables["health"].assign(
+        missing=tables["health"]["missing"].str.join(", "), stack=tables["health"]["stack"].str.join(", ")
+    ).drop(columns=["description"]).to_html(index=False, border=0)
+
+    login = escape(login)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>GitHub Report: {login}</title>
+<style>body {{ font-family: sans-serif; margin: 2em; }} table {{ border-collapse: collapse; }} td, th {{ padding: 4px 8px; border-bottom: 1px solid #ddd; }}</style>
+</head><body>
+<h1>{login}</h1>
+<h2>{escape(manifest.get('persona') or '')}</h2>
+<p>{stats.get('chronotype')} · {stats.get('total_commits')} commits · longest streak {stats.get('longest_streak')} days ·
+top language {escape(str(stats.get('top_language')))} · most productive on {stats.get('most_productive_day')}</p>
+<p>{manifest['stats'].get('total_repos')} repositories · {manifest['stats'].get('total_stars')} stars</p>
+{''.join(parts)}
+<h2>Repository Health</h2>
+{health}
+<h2>Journey</h2>
+<ul>{timeline}</ul>
+<p><small>Generated {manifest['generated_at']} from {os.path.basename(manifest['snapshot_path'])}</small></p>
+</body></html>
+"""
+
+
+def build_bundle(snapshot_path, out_dir="reports", model=None, forecast=True):
+    """Runs the full analysis pipeline for one snapshot and writes a bundle to ``out_dir/<login>/``.
+
+    ``model`` is the Ollama model used for the persona; pass None to skip LLM calls.
+    Returns the bundle directory.
+    """
+    started = time.time()
+    analyzer = TraditionalAnalyzer(data_path=snapshot_path)
+    if not analyzer.load_data():
+        raise FileNotFoundError(snapshot_path)
+
+    login = analyzer.profile_data.get("login") or os.path.splitext(os.path.basename(snapshot_path))[0]
+    bundle_dir = os.path.join(out_dir, login.lower())
+    os.makedirs(bundle_dir, exist_ok=True)
+
+    user_stats = analyzer.get_user_stats()
+    tables = {"health": analyzer.get_repo_health_table()}
+
+    clusters = None
+    if len(analyzer.repos_df) >= 3:
+        clusters = analyzer.perform_clustering(n_clusters=3)
+    tables["clusters"] = clusters if clusters is not None else pd.DataFrame(columns=["name", "cluster", "stars", "forks"])
+
+    tables["forecast"] = pd.DataFrame(columns=["ds", "yhat", "yhat_lower", "yhat_upper"])
+    if forecast:
+        try:
+            result = analyzer.forecast_activity()
+            if result is not None:
+                tables["forecast"] = result
+        except Exception as e:
+            print(f"Forecast failed for {login}: {e}")
+
+    persona = None
+    if model:
+        from src.llm_analysis import OllamaAnalyzer
+        persona = OllamaAnalyzer(model_name=model).generate_user_title(user_stats)
+
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "login": login,
+        "snapshot_path": os.path.abspath(snapshot_path),
+        "snapshot_sha256": file_sha256(snapshot_path),
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stats": analyzer.get_basic_stats(),
+        "user_stats": user_stats,
+        "timeline": analyzer.get_timeline_events(),
+        "persona": persona,
+        "tables": [f"{name}.json" for name in BUNDLE_TABLES]
+    }
+
+    for name in BUNDLE_TABLES:
+        records = json.loads(tables[name].to_json(orient="records", date_format="iso"))
+        _write_json(os.path.join(bundle_dir, f"{name}.json"), records)
+    with open(os.path.join(bundle_dir, "report.html"), "w", encoding="utf-8") as f:
+        f.write(_render_html(login, manifest, tables))
+    manifest["elapsed_seconds"] = round(time.time() - started, 3)
+    # Manifest last: a bundle without one is incomplete and ignored by load_bundle
+    _write_json(os.path.join(bundle_dir, "manifest.json"), manifest)
+    return bundle_dir
+
+
+def load_bundle(bundle_dir, snapshot_path=None):
+    """Loads a bundle as {"manifest": ..., "<table>": DataFrame}.
+
+    Returns None when the bundle is missing, or stale for ``snapshot_path``
+    (i.e. generated from different snapshot contents).
+    """
+    manifest_path = os.path.join(bundle_dir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != BUNDLE_VERSION:
+        return None
+    if snapshot_path is not None and manifest.get("snapshot_sha256") != file_sha256(snapshot_path):
+        return None
+
+    bundle = {"manifest": manifest}
+    for name in BUNDLE_TABLES:
+        with open(os.path.join(bundle_dir, f"{name}.json"), "r", encoding="utf-8") as f:
+            bundle[name] = pd.DataFrame(json.load(f))
+    if "ds" in bundle["forecast"]:
+        bundle["forecast"]["ds"] = pd.to_datetime(bundle["forecast"]["ds"])
+    return bundle
+
+
+def _build_one(args):
+    snapshot_path, out_dir, model, forecast = args
+    return build_bundle(snapshot_path, out_dir=out_dir, model=model, forecast=forecast)
+
+
+def generate_reports(snapshot_paths, out_dir="reports", model=None, forecast=True, max_workers=None):
+    """Builds bundles for many snapshots in a process pool. Returns {snapshot_path: bundle_dir or Exception}."""
+    results = {}
+    jobs = [(path, out_dir, model, forecast) for path in snapshot_paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_build_one, job): job[0] for job in jobs}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+                print(f"Report written: {results[path]}")
+            except Exception as e:
+                print(f"Report failed for {path}: {e}")
+                results[path] = e
+    return results
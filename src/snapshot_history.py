@@ -0,0 +1,158 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+from src.snapshot_store import FILE_MODE, USERNAME_RE, atomic_write_json
+
+HISTORY_ROOT = os.getenv("HISTORY_ROOT", "data/history")
+
+
+def content_hash(obj):
+    """SHA-256 of the canonical JSON encoding, so equal records hash equally regardless of key order."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SnapshotHistory:
+    """Versioned snapshots stored by content.
+
+    Layout under ``root``::
+
+        objects/ab/cdef....json.gz      one gzip'd JSON object per distinct repo record, README or profile
+        manifests/<username>/<id>.json  one small manifest per fetch, pointing at objects by hash
+
+    A repo that did not change between fetches is stored once, so storage grows
+    with what changed rather than with the number of snapshots kept.
+    """
+
+    def __init__(self, root=HISTORY_ROOT):
+        self.root = root
+
+    # --- Objects ---
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest[2:]}.json.gz")
+
+    def put_object(self, obj):
+        digest = content_hash(obj)
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mtime=0 keeps the compressed bytes deterministic
+                f.write(gzip.compress(payload, mtime=0))
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return digest
+
+    def get_object(self, digest):
+        with open(self._object_path(digest), "rb") as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    # --- Manifests ---
+    def _manifest_dir(self, username):
+        if not username or not USERNAME_RE.match(username):
+            raise ValueError(f"Invalid GitHub username: {username!r}")
+        return os.path.join(self.root, "manifests", username.lower())
+
+    def record(self, data, username=None, fetched_at=None):
+        """Stores a fetched snapshot. Returns the new snapshot ID."""
+        profile = data.get("profile", {})
+        username = username or profile.get("login")
+        manifest_dir = self._manifest_dir(username)
+        fetched_at = fetched_at or time.time()
+
+        repositories = []
+        for item in data.get("repositories", []):
+            details = dict(item.get("details", {}))
+            # READMEs are the bulk of a snapshot and change less often than stars, so they get their own objects
+            readme = details.pop("readme", "")
+            repo = {"metadata": item.get("metadata", {}), "details": details}
+            repositories.append({
+                "name": repo["metadata"].get("name"),
+                "record": self.put_object(repo),
+                "readme": self.put_object(readme)
+            })
+
+        snapshot_id = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(fetched_at))
+        os.makedirs(manifest_dir, exist_ok=True)
+        suffix = 1
+        base_id = snapshot_id
+        while os.path.exists(os.path.join(manifest_dir, f"{snapshot_id}.json")):
+            snapshot_id = f"{base_id}-{suffix}"
+            suffix += 1
+
+        manifest = {
+            "id": snapshot_id,
+            "username": username.lower(),
+            "fetched_at": fetched_at,
+            "profile": self.put_object(profile),
+            "repositories": repositories
+        }
+        atomic_write_json(os.path.join(manifest_dir, f"{snapshot_id}.json"), manifest, indent=None)
+        return snapshot_id
+
+    def list(self, username):
+        """Snapshots for a user, oldest first: [{"id", "fetched_at", "repos"}]."""
+        manifest_dir = self._manifest_dir(username)
+        if not os.path.isdir(manifest_dir):
+            return []
+        snapshots = []
+        for name in os.listdir(manifest_dir):
+            if not name.endswith(".json"):
+                continue
+            manifest = self.manifest(username, name[:-len(".json")])
+            snapshots.append({"id": manifest["id"], "fetched_at": manifest["fetched_at"], "repos": len(manifest["repositories"])})
+        return sorted(snapshots, key=lambda s: (s["fetched_at"], s["id"]))
+
+    def manifest(self, username, snapshot_id=None):
+        """Returns a manifest (the latest when ``snapshot_id`` is None), or None if there is none."""
+        if snapshot_id is None:
+            snapshots = self.list(username)
+            if not snapshots:
+                return None
+            snapshot_id = snapshots[-1]["id"]
+        path = os.path.join(self._manifest_dir(username), f"{os.path.basename(snapshot_id)}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def load(self, username, snapshot_id=None):
+        """Rebuilds a snapshot in the raw_data.json format, or returns None if it does not exist."""
+        manifest = self.manifest(username, snapshot_id)
+        if manifest is None:
+            return None
+        repositories = []
+        for entry in manifest["repositories"]:
+            repo = self.get_object(entry["record"])
+            repo["details"]["readme"] = self.get_object(entry["readme"])
+            repositories.append(repo)
+        return {"profile": self.get_object(manifest["profile"]), "repositories": repositories}
+
+    def storage_stats(self):
+        """Object count and on-disk bytes, to check deduplication is doing its job."""
+        objects, size = 0, 0
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, "objects")):
+            for name in filenames:
+                if name.endswith(".json.gz"):
+                    objects += 1
+                    size += os.path.getsize(os.path.join(dirpath, name))
+        return {"objects": objects, "bytes": size}
+
+
+_histories = {}
+
+def get_history(root=HISTORY_ROOT):
+    if root not in _histories:
+        _histories[root] = SnapshotHistory(root)
+    return _histories[root]
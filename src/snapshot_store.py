@@ -0,0 +1,95 @@
+import os
+import re
+import json
+import time
+import tempfile
+
+SNAPSHOT_ROOT = os.getenv("SNAPSHOT_ROOT", "data/snapshots")
+# GitHub logins: alphanumerics and single hyphens, at most 39 characters
+USERNAME_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+# mkstemp creates files 0600; renamed into place they should get the mode open() would have given them.
+# The umask can only be read by setting it, so it is read once here rather than racing other threads later.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+def atomic_write_json(path, data, indent=4):
+    """Writes JSON to a temp file in the same directory and renames it into place.
+
+    Readers either see the old file or the new one, never a partial write,
+    so they need no locks.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class SnapshotStore:
+    """One snapshot file per GitHub user under ``root``: ``<root>/<username>.json``."""
+
+    def __init__(self, root=SNAPSHOT_ROOT):
+        self.root = root
+
+    def path_for(self, username):
+        if not username or not USERNAME_RE.match(username):
+            raise ValueError(f"Invalid GitHub username: {username!r}")
+        return os.path.join(self.root, f"{username.lower()}.json")
+
+    def exists(self, username):
+        return os.path.exists(self.path_for(username))
+
+    def save(self, username, data):
+        path = self.path_for(username)
+        atomic_write_json(path, data)
+        return path
+
+    def load(self, username):
+        path = self.path_for(username)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def index(self):
+        """Lists stored snapshots, freshest first, with size and age in seconds."""
+        if not os.path.isdir(self.root):
+            return []
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.root):
+            stem, ext = os.path.splitext(name)
+            # Skip temp files and sidecars such as <user>.analysis.json
+            if ext != ".json" or "." in stem:
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # replaced or removed while listing
+            entries.append({
+                "username": stem,
+                "path": path,
+                "size": stat.st_size,
+                "modified": stat.st_mtime,
+                "age_seconds": now - stat.st_mtime
+            })
+        return sorted(entries, key=lambda e: e["age_seconds"])
+
+
+def format_age(seconds):
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 90 * 60:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 36 * 3600:
+        return f"{seconds / 3600:.0f}h"
+    return f"{seconds / 86400:.0f}d"
@@ -0,0 +1,141 @@
+import os
+import json
+import hashlib
+import numpy as np
+
+# Language -> (weight, root files typical for a repo in that language)
+LANGUAGES = {
+    "Python": (0.30, ["requirements.txt", "setup.py", "pyproject.toml", "Dockerfile"]),
+    "JavaScript": (0.20, ["package.json", "yarn.lock", "Dockerfile"]),
+    "TypeScript": (0.15, ["package.json", "tsconfig.json", "next.config.js"]),
+    "Go": (0.08, ["go.mod", "go.sum", "Dockerfile"]),
+    "Rust": (0.07, ["Cargo.toml", "Cargo.lock"]),
+    "Java": (0.07, ["pom.xml", "build.gradle"]),
+    "Jupyter Notebook": (0.05, ["requirements.txt", "environment.yml"]),
+    "C++": (0.04, ["CMakeLists.txt", "Makefile"]),
+    "HTML": (0.04, ["index.html"])
+}
+COMMON_FILES = ["README.md", "LICENSE", "CONTRIBUTING.md", ".gitignore", ".github"]
+TOPICS = ["machine-learning", "web", "cli", "api", "data-science", "devops", "game", "library", "dashboard", "bot"]
+COMMIT_MESSAGES = [
+    "Fix typo in README", "Add unit tests", "Refactor data loader", "Update dependencies", "Merge pull request #{n} from dev/feature",
+    "Improve error handling", "Add CLI option", "Bump version to 1.{n}.0", "Initial commit", "Fix flaky test", "Add docs"
+]
+README_SECTIONS = ["Installation", "Usage", "Configuration", "API", "Examples", "Contributing", "License", "FAQ"]
+WORDS = ("data model api fast simple library tool python server client cache query stream build deploy test "
+         "config plugin async parser report chart user token request response").split()
+
+# Hour-of-day weights: quiet nights, a working-hours peak and an evening bump
+HOUR_WEIGHTS = np.array([1, 0.5, 0.3, 0.2, 0.2, 0.3, 0.8, 1.5, 3, 4, 4.5, 4.5, 3, 4, 4.5, 4.5, 4, 3.5, 3, 3, 3.5, 3, 2.5, 1.5])
+# Monday..Sunday
+WEEKDAY_WEIGHTS = np.array([1.0, 1.05, 1.05, 1.0, 0.9, 0.45, 0.4])
+
+
+def _readme(rng, name, n_chars):
+    parts = [f"# {name}\n\n"]
+    size = len(parts[0])
+    while size < n_chars:
+        section = f"## {README_SECTIONS[rng.integers(len(README_SECTIONS))]}\n\n"
+        text = " ".join(rng.choice(WORDS, size=60)) + ".\n\n"
+        parts.append(section + text)
+        size += len(section) + len(text)
+    return "".join(parts)[:n_chars]
+
+
+def _commit_dates(rng, n, start, end):
+    """ISO timestamps between start and end, weighted by weekday and hour like real activity."""
+    days = np.arange(start, end, dtype="datetime64[D]")
+    if len(days) == 0:
+        days = np.array([start], dtype="datetime64[D]")
+    # 1970-01-01 was a Thursday, so Monday-based weekday is (days + 3) % 7
+    weekday = (days.astype(np.int64) + 3) % 7
+    day_weights = WEEKDAY_WEIGHTS[weekday]
+    picked_days = rng.choice(days, size=n, p=day_weights / day_weights.sum())
+    hours = rng.choice(24, size=n, p=HOUR_WEIGHTS / HOUR_WEIGHTS.sum())
+    seconds = rng.integers(0, 3600, size=n)
+    stamps = picked_days.astype("datetime64[s]") + (hours * 3600 + seconds).astype("timedelta64[s]")
+    return np.datetime_as_string(np.sort(stamps)[::-1], unit="s")
+
+
+def _split_counts(rng, total, n_repos):
+    if n_repos == 0:
+        return np.zeros(0, dtype=int)
+    weights = rng.pareto(1.2, n_repos) + 1e-3
+    return rng.multinomial(total, weights / weights.sum())
+
+
+def iter_repositories(n_repos=100, n_commits=5000, readme_chars=2000, seed=0, start="2015-01-01", end="2025-01-01"):
+    """Yields repository records shaped like GitHubFetcher output, one at a time.
+
+    Commits are spread over repos with a heavy tail (a few busy repos, many
+    quiet ones), as are stars and README sizes (``readme_chars`` is the mean).
+    """
+    rng = np.random.default_rng(seed)
+    names = list(LANGUAGES)
+    weights = np.array([LANGUAGES[l][0] for l in names])
+    languages = rng.choice(names, size=n_repos, p=weights / weights.sum())
+    commit_counts = _split_counts(rng, n_commits, n_repos)
+    stars = np.floor(rng.pareto(1.1, n_repos) * 3).astype(int)
+    span = np.datetime64(end, "D") - np.datetime64(start, "D")
+    created = np.datetime64(start, "D") + rng.integers(0, max(int(span.astype(int)) - 30, 1), n_repos).astype("timedelta64[D]")
+
+    for i in range(n_repos):
+        name = f"repo-{i:05d}"
+        language = str(languages[i])
+        updated = created[i] + np.timedelta64(int(rng.integers(30, 1500)), "D")
+        updated = min(updated, np.datetime64(end, "D"))
+        readme_len = int(rng.exponential(readme_chars)) if readme_chars else 0
+        files = [f for f in COMMON_FILES if rng.random() < 0.6] + [f for f in LANGUAGES[language][1] if rng.random() < 0.7]
+        dates = _commit_dates(rng, int(commit_counts[i]), created[i], updated + np.timedelta64(1, "D"))
+        messages = rng.integers(len(COMMIT_MESSAGES), size=len(dates))
+        yield {
+            "metadata": {
+                "name": name,
+                "description": " ".join(rng.choice(WORDS, size=6)).capitalize(),
+                "stargazers_count": int(stars[i]),
+                "forks_count": int(stars[i] // 4),
+                "language": language,
+                "size": int(rng.integers(10, 50000)),
+                "created_at": f"{created[i]}T00:00:00Z",
+                "updated_at": f"{updated}T00:00:00Z",
+                "topics": [str(t) for t in rng.choice(TOPICS, size=int(rng.integers(0, 4)), replace=False)]
+            },
+            "details": {
+                "languages": {language: int(rng.integers(1000, 500000))},
+                "readme": _readme(rng, name, readme_len),
+                "recent_commits": [
+                    {"sha": hashlib.sha1(f"{name}/{j}".encode()).hexdigest(),
+                     "commit": {"message": COMMIT_MESSAGES[m].format(n=j), "author": {"name": "synthetic", "date": f"{d}Z"}}}
+                    for j, (d, m) in enumerate(zip(dates, messages))
+                ],
+                "files": files
+            }
+        }
+
+
+def _profile(login, n_repos):
+    return {"login": login, "name": "Synthetic User", "created_at": "2014-06-01T00:00:00Z",
+            "public_repos": n_repos, "followers": 42, "following": 7}
+
+
+def generate_snapshot(n_repos=100, n_commits=5000, readme_chars=2000, seed=0, login="synthetic"):
+    """Builds a whole snapshot in memory. Use write_snapshot for large scales."""
+    return {
+        "profile": _profile(login, n_repos),
+        "repositories": list(iter_repositories(n_repos, n_commits, readme_chars, seed))
+    }
+
+
+def write_snapshot(path, n_repos=100, n_commits=5000, readme_chars=2000, seed=0, login="synthetic"):
+    """Streams a snapshot to ``path`` one repository at a time, so memory stays flat at any scale."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write('{"profile": ' + json.dumps(_profile(login, n_repos)) + ', "repositories": [')
+        for i, repo in enumerate(iter_repositories(n_repos, n_commits, readme_chars, seed)):
+            if i:
+                f.write(", ")
+            f.write(json.dumps(repo))
+        f.write("]}")
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,123 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from src.traditional_ds import TraditionalAnalyzer
+from src.language_matrix import LanguageMatrix
+from src.tracing import get_tracer
+
+GRADES = ("A", "B", "C", "D")
+TEAM_COLUMNS = [
+    "login", "repos", "stars", "total_commits", "longest_streak", "chronotype", "most_productive_day",
+    "most_active_month", "top_language", "health_score"
+] + [f"grade_{g}" for g in GRADES] + ["languages", "language_bytes", "snapshot_path"]
+
+
+def summarize_snapshot(snapshot_path):
+    """One comparison row for a single user snapshot. Runs inside worker processes, so it only returns plain data."""
+    analyzer = TraditionalAnalyzer(data_path=snapshot_path)
+    if not analyzer.load_data():
+        raise FileNotFoundError(snapshot_path)
+
+    stats = analyzer.get_user_stats()
+    health = analyzer.get_repo_health_table()
+    grade_counts = health["grade"].value_counts()
+    repos = analyzer.repos_df
+    row = {
+        "login": analyzer.profile_data.get("login") or os.path.splitext(os.path.basename(snapshot_path))[0],
+        "repos": len(repos),
+        "stars": int(repos["stars"].sum()) if not repos.empty else 0,
+        "total_commits": stats["total_commits"],
+        "longest_streak": stats["longest_streak"],
+        "chronotype": stats["chronotype"],
+        "most_productive_day": stats["most_productive_day"],
+        "most_active_month": stats["most_active_month"],
+        "top_language": stats["top_language"],
+        "health_score": float(health["score"].mean()) if not health.empty else 0.0,
+        # Repo count per primary language, expanded by language_mix()
+        "languages": repos["language"].fillna("Unknown").value_counts().to_dict() if not repos.empty else {},
+        # Bytes of code per language from the repo x language matrix
+        "language_bytes": {lang: int(n) for lang, n in analyzer.language_matrix.totals().items()},
+        "snapshot_path": snapshot_path
+    }
+    for grade in GRADES:
+        row[f"grade_{grade}"] = int(grade_counts.get(grade, 0))
+    return row
+
+
+def _summarize_or_error(snapshot_path):
+    try:
+        return summarize_snapshot(snapshot_path)
+    except Exception as e:
+        return {"snapshot_path": snapshot_path, "error": f"{type(e).__name__}: {e}"}
+
+
+class TeamAnalyzer:
+    """Compares many user snapshots at once: one row per user, computed in a process pool.
+
+    Each snapshot is loaded and analysed independently, so the work splits
+    cleanly across cores; only the small summary rows cross process
+    boundaries.
+    """
+
+    def __init__(self, snapshot_paths, max_workers=None):
+        self.snapshot_paths = list(snapshot_paths)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.errors = {}
+
+    def compute(self):
+        """Returns the comparison DataFrame (TEAM_COLUMNS). Failed snapshots are left out and listed in ``errors``."""
+        paths = self.snapshot_paths
+        workers = min(self.max_workers, len(paths))
+        with get_tracer().span("team.compute", snapshots=len(paths), workers=workers):
+            if workers <= 1:
+                rows = [_summarize_or_error(p) for p in paths]
+            else:
+                # Several snapshots per task keeps IPC overhead low with hundreds of small accounts
+                chunksize = max(1, len(paths) // (workers * 4))
+                # Spawned, not forked: forking the multithreaded Streamlit server can copy a lock held by another thread
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    rows = list(pool.map(_summarize_or_error, paths, chunksize=chunksize))
+
+        self.errors = {r["snapshot_path"]: r["error"] for r in rows if "error" in r}
+        for path, error in self.errors.items():
+            print(f"Team analysis skipped {path}: {error}")
+        table = pd.DataFrame([r for r in rows if "error" not in r], columns=TEAM_COLUMNS)
+        return table.sort_values("login", key=lambda s: s.str.lower(), kind="stable").reset_index(drop=True)
+
+    @staticmethod
+    def leaderboard(table, metric, n=10, ascending=False):
+        return table.nlargest(n, metric) if not ascending else table.nsmallest(n, metric)
+
+    @staticmethod
+    def distribution(table, column):
+        """Share of users per value of a categorical column (e.g. chronotype), largest first."""
+        counts = table[column].value_counts()
+        return pd.DataFrame({column: counts.index, "users": counts.values, "share": counts.values / max(len(table), 1)})
+
+    @staticmethod
+    def language_mix(table):
+        """Long format: one row per (login, language) with repo count and the language's share of that user's repos."""
+        rows = [
+            {"login": login, "language": language, "repos": count}
+            for login, languages in zip(table["login"], table["languages"])
+            for language, count in languages.items()
+        ]
+        mix = pd.DataFrame(rows, columns=["login", "language", "repos"])
+        mix["share"] = mix["repos"] / mix.groupby("login")["repos"].transform("sum")
+        return mix
+
+    @staticmethod
+    def language_bytes(table):
+        """Users x languages byte matrix, for org-wide shares and totals as sparse reductions."""
+        rows = [
+            {"repo": login, "language": language, "bytes": n}
+            for login, languages in zip(table["login"], table["language_bytes"])
+            for language, n in languages.items()
+        ]
+        return LanguageMatrix.from_long(pd.DataFrame(rows, columns=["repo", "language", "bytes"]), table["login"])
+
+    @staticmethod
+    def grade_distribution(table):
+        """Total repos per health grade across the team."""
+        return pd.Series({g: int(table[f"grade_{g}"].sum()) for g in GRADES}, name="repos")
@@ -0,0 +1,160 @@
+import os
+import re
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+import numpy as np
+
+# Recent spans kept in memory for percentiles and the JSON lines export
+MAX_SPANS = 10000
+
+
+def _metric_name(name):
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{_metric_name(k)}="{escape(v)}"' for k, v in sorted(labels.items())) + "}"
+
+
+class Tracer:
+    """Lightweight span timer and counter registry.
+
+    ``with tracer.span("github.request", endpoint=...) as span:`` times a
+    block; extra attributes (bytes, token counts, ...) can be set on the
+    yielded dict. Counters are cumulative and keyed by name plus labels.
+    """
+
+    def __init__(self, max_spans=MAX_SPANS):
+        self._lock = threading.Lock()
+        self._spans = deque(maxlen=max_spans)
+        self._totals = {}
+        self._counters = {}
+        self._exported = 0
+        self._span_seq = 0
+
+    @contextmanager
+    def span(self, name, **attrs):
+        record = dict(attrs)
+        start = time.perf_counter()
+        wall_start = time.time()
+        error = None
+        try:
+            yield record
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self._record(name, wall_start, duration, record, error)
+
+    def _record(self, name, wall_start, duration, attrs, error):
+        entry = {"name": name, "start": wall_start, "duration": duration, "attrs": attrs}
+        if error:
+            entry["error"] = error
+        with self._lock:
+            self._span_seq += 1
+            entry["seq"] = self._span_seq
+            self._spans.append(entry)
+            totals = self._totals.setdefault(name, {"count": 0, "sum": 0.0, "errors": 0})
+            totals["count"] += 1
+            totals["sum"] += duration
+            if error:
+                totals["errors"] += 1
+
+    def incr(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._totals.clear()
+            self._counters.clear()
+            self._exported = 0
+
+    def spans(self):
+        with self._lock:
+            return list(self._spans)
+
+    def counters(self):
+        with self._lock:
+            return [{"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self._counters.items())]
+
+    def summary(self):
+        """Per span name: count, total and mean seconds (all time) and p50/p95/max over recent spans."""
+        spans = self.spans()
+        with self._lock:
+            totals = {name: dict(t) for name, t in self._totals.items()}
+        durations = {}
+        for s in spans:
+            durations.setdefault(s["name"], []).append(s["duration"])
+
+        rows = []
+        for name, t in sorted(totals.items()):
+            recent = np.asarray(durations.get(name, [0.0]))
+            rows.append({
+                "span": name,
+                "count": t["count"],
+                "errors": t["errors"],
+                "total_s": t["sum"],
+                "mean_s": t["sum"] / t["count"] if t["count"] else 0.0,
+                "p50_s": float(np.percentile(recent, 50)),
+                "p95_s": float(np.percentile(recent, 95)),
+                "max_s": float(recent.max())
+            })
+        return rows
+
+    def to_prometheus(self):
+        lines = ["# HELP span_duration_seconds Time spent in traced stages.", "# TYPE span_duration_seconds summary"]
+        for row in self.summary():
+            labels = {"span": row["span"]}
+            for quantile, key in (("0.5", "p50_s"), ("0.95", "p95_s")):
+                lines.append(f"span_duration_seconds{_label_str({**labels, 'quantile': quantile})} {row[key]:.6f}")
+            lines.append(f"span_duration_seconds_sum{_label_str(labels)} {row['total_s']:.6f}")
+            lines.append(f"span_duration_seconds_count{_label_str(labels)} {row['count']}")
+
+        seen = set()
+        for counter in self.counters():
+            name = _metric_name(counter["name"])
+            if name not in seen:
+                lines.append(f"# TYPE {name} counter")
+                seen.add(name)
+            lines.append(f"{name}{_label_str(counter['labels'])} {counter['value']}")
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path):
+        """Writes the Prometheus text format atomically (suitable for node_exporter's textfile collector)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def export_jsonl(self, path):
+        """Appends spans recorded since the previous export, one JSON object per line. Returns the count written."""
+        with self._lock:
+            new = [s for s in self._spans if s["seq"] > self._exported]
+            if new:
+                self._exported = new[-1]["seq"]
+        if not new:
+            return 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for s in new:
+                f.write(json.dumps(s, default=str) + "\n")
+        return len(new)
+
+
+_tracer = Tracer()
+
+def get_tracer():
+    return _tracer
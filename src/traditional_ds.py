@@ -7,28 +7,87 @@ from prophet import Prophet
 import plotly.express as px
 import plotly.graph_objects as go
 import os
+from src.tracing import get_tracer
+from src.snapshot_history import get_history
+from src.path_index import PathIndex
+from src.language_matrix import LANGUAGE_COLUMNS, LanguageMatrix, language_records
+from src.columnar_cache import COLUMNAR_CACHE, read_sidecar, read_tables, write_sidecar, write_tables
+from src.contribution_calendar import ContributionCalendar
+from src.repo_forecasting import RepoForecaster
 
 class TraditionalAnalyzer:
-    def __init__(self, data_path="data/raw_data.json"):
+    def __init__(self, data_path="data/raw_data.json", columnar_cache=COLUMNAR_CACHE):
         self.data_path = data_path
+        # Load from memory-mapped Arrow tables next to the snapshot when they are up to date
+        self.columnar_cache = columnar_cache
         self.repos_df = None
         self.commits_df = None
+        # Long-format (repo, language, bytes) rows and the sparse repo x language matrix built from them
+        self.languages_df = None
+        self.language_matrix = None
         self.profile_data = {}
+        # The snapshot file the frames were read from; None when they came from history or were built in memory
+        self.loaded_from = None
 
     def load_data(self):
         if not os.path.exists(self.data_path):
             print(f"Data file not found at {self.data_path}")
             return False
 
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        tracer = get_tracer()
+        if self.columnar_cache:
+            with tracer.span("analysis.columnar_load") as span:
+                tables = read_tables(self.data_path)
+                span["hit"] = tables is not None
+            if tables is not None:
+                self.profile_data, frames = tables
+                self.repos_df, self.commits_df, self.languages_df = frames["repos"], frames["commits"], frames["languages"]
+                self._index_languages()
+                self.loaded_from = self.data_path
+                print("Data loaded successfully.")
+                return True
 
+        with tracer.span("analysis.json_load", bytes=os.path.getsize(self.data_path)):
+            with open(self.data_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        self._build_traced(data)
+        if self.columnar_cache:
+            try:
+                with tracer.span("analysis.columnar_write"):
+                    write_tables(self.data_path, {"repos": self.repos_df, "commits": self.commits_df, "languages": self.languages_df}, self.profile_data)
+            except Exception as e:
+                print(f"Could not write columnar tables for {self.data_path}: {e}")
+        self.loaded_from = self.data_path
+        print("Data loaded successfully.")
+        return True
+
+    def load_history(self, username, snapshot_id=None, history=None):
+        """Loads a snapshot from the versioned history instead of data_path (the latest when snapshot_id is None)."""
+        history = history or get_history()
+        with get_tracer().span("analysis.history_load", snapshot=snapshot_id or "latest"):
+            data = history.load(username, snapshot_id)
+        if data is None:
+            print(f"No snapshot {snapshot_id or '(latest)'} in history for {username}")
+            return False
+        self._build_traced(data)
+        return True
+
+    def _build_traced(self, data):
+        with get_tracer().span("analysis.dataframe_build") as span:
+            self._build_frames(data)
+            span["repos"] = len(self.repos_df)
+            span["commits"] = len(self.commits_df)
+
+    def _build_frames(self, data):
+        self.loaded_from = None
         self.profile_data = data.get("profile", {})
         repos = data.get("repositories", [])
 
         # Process Repositories
         repo_list = []
         all_commits = []
+        language_rows = []
 
         for item in repos:
             repo_meta = item.get("metadata", {})
@@ -36,18 +95,23 @@ class TraditionalAnalyzer:
             
             repo_list.append({
                 "name": repo_meta.get("name"),
+                "description": repo_meta.get("description") or "",
                 "stars": repo_meta.get("stargazers_count", 0),
                 "forks": repo_meta.get("forks_count", 0),
                 "language": repo_meta.get("language", "Unknown"),
                 "size": repo_meta.get("size", 0),
-                "created_at": pd.to_datetime(repo_meta.get("created_at"), errors='coerce'),
-                "updated_at": pd.to_datetime(repo_meta.get("updated_at"), errors='coerce'),
+                "created_at": repo_meta.get("created_at"),
+                "updated_at": repo_meta.get("updated_at"),
                 "topics": repo_meta.get("topics", []),
                 "readme_length": len(repo_details.get("readme", "")),
                 "readme_content": repo_details.get("readme", ""),
-                "files": repo_details.get("files", [])
+                "files": repo_details.get("files", []),
+                # Every path in the repo, when fetched with the recursive tree mode
+                "tree": repo_details.get("tree")
             })
 
+            language_rows.extend(language_records(repo_meta.get("name"), repo_details.get("languages")))
+
             # Process Commits
             commits = repo_details.get("recent_commits", [])
             if commits:
@@ -57,25 +121,51 @@ class TraditionalAnalyzer:
                     if author_date:
                         all_commits.append({
                             "repo_name": repo_meta.get("name"),
-                            "date": pd.to_datetime(author_date),
+                            "sha": commit.get("sha"),
+                            "date": author_date,
                             "message": c_meta.get("message"),
                             "author": c_meta.get("author", {}).get("name")
                         })
 
         self.repos_df = pd.DataFrame(repo_list)
         self.commits_df = pd.DataFrame(all_commits)
-        print("Data loaded successfully.")
-        return True
+        self.languages_df = pd.DataFrame(language_rows, columns=LANGUAGE_COLUMNS)
+        # One vectorised parse per column; parsing each timestamp separately dominated load time
+        for column in ("created_at", "updated_at"):
+            if column in self.repos_df:
+                self.repos_df[column] = pd.to_datetime(self.repos_df[column], errors='coerce', utc=True, format='ISO8601')
+        if not self.commits_df.empty:
+            self.commits_df["date"] = pd.to_datetime(self.commits_df["date"], utc=True, format='ISO8601')
+        self._index_languages()
+
+    def _index_languages(self):
+        repos = self.repos_df["name"] if "name" in self.repos_df else []
+        self.language_matrix = LanguageMatrix.from_long(self.languages_df, repos)
 
     def get_basic_stats(self):
         if self.repos_df is None: return {}
+        with get_tracer().span("analysis.basic_stats"):
+            return self._basic_stats()
+
+    def _basic_stats(self):
         return {
             "total_repos": len(self.repos_df),
             "total_stars": self.repos_df['stars'].sum(),
             "top_languages": self.repos_df['language'].value_counts().to_dict(),
+            # Bytes of code per language across all repos (not just each repo's primary language)
+            "language_bytes": self.language_matrix.totals().head(15).to_dict() if self.language_matrix is not None else {},
             "total_commits_tracked": len(self.commits_df) if self.commits_df is not None else 0
         }
 
+    def get_language_share(self):
+        """Fraction of all code bytes per language, largest first."""
+        return self.language_matrix.share()
+
+    def get_languages_over_time(self):
+        """Bytes per language summed by the year each repo was created (years x languages)."""
+        years = self.repos_df["created_at"].dt.year if "created_at" in self.repos_df else []
+        return self.language_matrix.aggregate(years)
+
     def perform_clustering(self, n_clusters=3):
         if self.repos_df is None or self.repos_df.empty:
             return None
@@ -83,17 +173,22 @@ class TraditionalAnalyzer:
         # Features for clustering: stars, forks, size, readme_length
         features = self.repos_df[['stars', 'forks', 'size', 'readme_length']].fillna(0)
         
-        scaler = StandardScaler()
-        scaled_features = scaler.fit_transform(features)
-        
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        clusters = kmeans.fit_predict(scaled_features)
+        with get_tracer().span("analysis.clustering", rows=len(features), n_clusters=n_clusters):
+            scaler = StandardScaler()
+            scaled_features = scaler.fit_transform(features)
+
+            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+            clusters = kmeans.fit_predict(scaled_features)
         
         self.repos_df['cluster'] = clusters
         return self.repos_df[['name', 'cluster', 'stars', 'forks']]
 
     def get_user_stats(self):
         """Calculates advanced user statistics for GitHub Replay."""
+        with get_tracer().span("analysis.user_stats"):
+            return self._user_stats()
+
+    def _user_stats(self):
         stats = {
             "top_language": "Unknown",
             "longest_streak": 0,
@@ -113,31 +208,13 @@ class TraditionalAnalyzer:
             stats["total_commits"] = len(self.commits_df)
 
             # 1. Longest Streak
-            # Group by date to get unique days with commits
-            dates = self.commits_df['date'].dt.date.sort_values().unique()
-            
-            longest_streak = 0
-            current_streak = 0
-            
-            if len(dates) > 0:
-                current_streak = 1
-                longest_streak = 1
-                for i in range(1, len(dates)):
-                    delta = dates[i] - dates[i-1]
-                    if delta.days == 1:
-                        current_streak += 1
-                    else:
-                        longest_streak = max(longest_streak, current_streak)
-                        current_streak = 1
-                longest_streak = max(longest_streak, current_streak)
-            
-            stats["longest_streak"] = longest_streak
+            # Runs of consecutive active days in the per-day commit counts
+            calendar = ContributionCalendar.from_commits(self.commits_df)
+            stats["longest_streak"] = calendar.longest_streak()
 
             # 2. Most Productive Day
-            # 0=Monday, 6=Sunday
-            day_counts = self.commits_df['date'].dt.day_name().value_counts()
-            if not day_counts.empty:
-                stats["most_productive_day"] = day_counts.idxmax()
+            # Same per-day counts as the streak, so every stat agrees on what day a commit fell on
+            stats["most_productive_day"] = calendar.weekday_totals().idxmax()
 
             # 3. Chronotype (Night Owl vs Early Bird)
             hours = self.commits_df['date'].dt.hour
@@ -150,27 +227,46 @@ class TraditionalAnalyzer:
                 stats["chronotype"] = "☕ Day Walker"
 
             # 4. Most Active Month
-            month_counts = self.commits_df['date'].dt.month_name().value_counts()
-            if not month_counts.empty:
-                stats["most_active_month"] = month_counts.idxmax()
+            stats["most_active_month"] = calendar.month_totals().idxmax()
 
         return stats
 
+    # Community files count where GitHub itself looks for them: the root, .github/ and docs/
+    HEALTH_CHECKS = {
+        "README.md": ("README", ("", ".github", "docs")),
+        "LICENSE": ("License", ("", "docs")),
+        "CONTRIBUTING.md": ("Contributing Guide", ("", ".github", "docs")),
+        ".gitignore": (".gitignore", ("",))
+    }
+    # Manifest file -> stack; matched at any depth so monorepo subfolders count
+    STACK_RULES = [
+        ("Node.js", ("package.json",)),
+        ("Python", ("requirements.txt", "pyproject.toml")),
+        ("Docker", ("Dockerfile",)),
+        ("Docker Compose", ("docker-compose.yml",)),
+        ("Java", ("pom.xml",)),
+        ("Go", ("go.mod",)),
+        ("Rust", ("Cargo.toml",)),
+        ("Ruby", ("Gemfile",))
+    ]
+
+    @staticmethod
+    def path_index(repo_data):
+        """PathIndex over the full tree when it was fetched, otherwise over the root listing."""
+        if "path_index" in repo_data:
+            return repo_data["path_index"]
+        details = repo_data.get("details", {})
+        tree = details.get("tree")
+        return PathIndex(tree if tree is not None else details.get("files") or [])
+
     def calculate_health_score(self, repo_data):
-        files = repo_data.get("details", {}).get("files", [])
+        index = self.path_index(repo_data)
         score = 0
         missing = []
-        
-        checks = {
-            "README.md": "README",
-            "LICENSE": "License",
-            "CONTRIBUTING.md": "Contributing Guide",
-            ".gitignore": ".gitignore"
-        }
-        
-        for file, name in checks.items():
+
+        for file, (name, dirs) in self.HEALTH_CHECKS.items():
             # Case insensitive check
-            if any(f.lower() == file.lower() for f in files):
+            if index.has_in_dirs(file, dirs):
                 score += 1
             else:
                 missing.append(name)
@@ -183,20 +279,87 @@ class TraditionalAnalyzer:
         return {"grade": grade, "missing": missing, "score": score}
 
     def detect_tech_stack(self, repo_data):
-        files = repo_data.get("details", {}).get("files", [])
-        stack = []
-        
-        # Simple file-based detection
-        if any(f == "package.json" for f in files): stack.append("Node.js")
-        if any(f == "requirements.txt" or f == "pyproject.toml" for f in files): stack.append("Python")
-        if any(f == "Dockerfile" for f in files): stack.append("Docker")
-        if any(f == "docker-compose.yml" for f in files): stack.append("Docker Compose")
-        if any(f == "pom.xml" for f in files): stack.append("Java")
-        if any(f == "go.mod" for f in files): stack.append("Go")
-        if any(f == "Cargo.toml" for f in files): stack.append("Rust")
-        if any(f == "Gemfile" for f in files): stack.append("Ruby")
-        
-        return stack
+        index = self.path_index(repo_data)
+        return [stack for stack, names in self.STACK_RULES if any(index.has_name(n) for n in names)]
+
+    def get_repo_health_table(self):
+        """One row per repository with its health grade and detected stack, for sorting and filtering."""
+        columns = ["name", "description", "language", "stars", "grade", "score", "missing", "stack"]
+        if self.repos_df is None or self.repos_df.empty:
+            return pd.DataFrame(columns=columns)
+
+        rows = []
+        for repo in self.repos_df.to_dict('records'):
+            repo_data = {"details": {"files": repo.get("files", []), "tree": repo.get("tree")}}
+            repo_data["path_index"] = self.path_index(repo_data)
+            health = self.calculate_health_score(repo_data)
+            rows.append({
+                "name": repo["name"],
+                "description": repo.get("description", ""),
+                # GitHub sends language: null for docs-only and empty repos, which the JSON path loads as NaN
+                "language": "Unknown" if pd.isna(repo.get("language")) else repo["language"],
+                "stars": repo.get("stars", 0),
+                "grade": health["grade"],
+                "score": health["score"],
+                "missing": health["missing"],
+                "stack": self.detect_tech_stack(repo_data)
+            })
+        return pd.DataFrame(rows, columns=columns)
+
+    @staticmethod
+    def query_repo_health(table, grades=None, stacks=None, languages=None, sort_by="name", ascending=True, page=1, page_size=25):
+        """Filters, sorts and slices a health table. Returns (page_df, total_matching_rows)."""
+        mask = pd.Series(True, index=table.index)
+        if grades:
+            mask &= table["grade"].isin(grades)
+        if languages:
+            mask &= table["language"].isin(languages)
+        if stacks:
+            wanted = set(stacks)
+            mask &= table["stack"].map(lambda s: bool(wanted.intersection(s)))
+        filtered = table[mask]
+        if sort_by in filtered.columns:
+            filtered = filtered.sort_values(sort_by, ascending=ascending, kind="stable")
+
+        total = len(filtered)
+        start = max(page - 1, 0) * page_size
+        return filtered.iloc[start:start + page_size], total
+
+    @staticmethod
+    def diff_snapshots(old, new):
+        """Compares two loaded analyzers repo by repo.
+
+        Returns one row per repository in either snapshot with its status
+        (added, removed, changed, unchanged) and the old/new stars, language
+        and health grade.
+        """
+        columns = ["name", "status", "stars_old", "stars_new", "stars_delta",
+                   "language_old", "language_new", "grade_old", "grade_new", "readme_changed"]
+        def side(analyzer):
+            health = analyzer.get_repo_health_table()
+            if health.empty:
+                return pd.DataFrame(columns=["name", "stars", "language", "grade", "readme"])
+            readmes = analyzer.repos_df[["name", "readme_content"]].rename(columns={"readme_content": "readme"})
+            return health[["name", "stars", "language", "grade"]].merge(readmes, on="name", how="left")
+
+        merged = side(old).merge(side(new), on="name", how="outer", suffixes=("_old", "_new"), indicator=True)
+        if merged.empty:
+            return pd.DataFrame(columns=columns)
+
+        def differs(column):
+            # NaN != NaN, so a value missing on both sides would otherwise always count as a change
+            a, b = merged[f"{column}_old"], merged[f"{column}_new"]
+            return ~(a.eq(b) | (a.isna() & b.isna()))
+
+        merged["readme_changed"] = (merged["_merge"] == "both") & differs("readme")
+        changed = merged["readme_changed"] | differs("stars") | differs("language") | differs("grade")
+        merged["status"] = np.select(
+            [merged["_merge"] == "left_only", merged["_merge"] == "right_only", changed],
+            ["removed", "added", "changed"],
+            "unchanged"
+        )
+        merged["stars_delta"] = merged["stars_new"].fillna(0) - merged["stars_old"].fillna(0)
+        return merged[columns].sort_values(["status", "name"], kind="stable").reset_index(drop=True)
 
     def get_timeline_events(self):
         events = []
@@ -249,14 +412,39 @@ class TraditionalAnalyzer:
         if len(daily_counts) < 2:
             return None
 
-        m = Prophet(yearly_seasonality=True)
-        m.fit(daily_counts)
-        
-        future = m.make_future_dataframe(periods=90) # Forecast 3 months
-        forecast = m.predict(future)
+        tracer = get_tracer()
+        with tracer.span("analysis.prophet_fit", days=len(daily_counts)):
+            m = Prophet(yearly_seasonality=True)
+            m.fit(daily_counts)
+
+        with tracer.span("analysis.prophet_predict"):
+            future = m.make_future_dataframe(periods=90) # Forecast 3 months
+            forecast = m.predict(future)
         
         return forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
 
+    def forecast_by_repo(self, forecaster=None, cache=True):
+        """Per-repository forecasts in long format (see RepoForecaster), cached next to the snapshot.
+
+        The cache follows ``columnar_cache`` and is only used when the frames were loaded from
+        ``data_path``; frames from history or memory would otherwise read or overwrite another snapshot's results.
+        """
+        forecaster = forecaster or RepoForecaster()
+        if self.commits_df is None or self.commits_df.empty:
+            return forecaster.forecast(None)
+        cache = cache and self.columnar_cache and self.loaded_from == self.data_path
+        if cache:
+            cached = read_sidecar(self.data_path, "repo_forecast", tag=forecaster.cache_tag)
+            if cached is not None:
+                return cached
+        forecast = forecaster.forecast(self.commits_df)
+        if cache:
+            try:
+                write_sidecar(self.data_path, "repo_forecast", forecast, tag=forecaster.cache_tag)
+            except OSError as e:
+                print(f"Could not cache repo forecasts for {self.data_path}: {e}")
+        return forecast
+
 if __name__ == "__main__":
     analyzer = TraditionalAnalyzer()
     if analyzer.load_data():
@@ -0,0 +1,359 @@
+import hashlib
+import hmac
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.data_collection import GitHubFetcher, is_readme_path
+from src.snapshot_store import SnapshotStore, USERNAME_RE
+from src.tracing import get_tracer
+
+# Shared secret configured on the GitHub webhook; when set, unsigned or mis-signed deliveries are rejected
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
+# Pushed commits kept per repo; a full fetch keeps only the latest 5
+WEBHOOK_MAX_COMMITS = int(os.getenv("WEBHOOK_MAX_COMMITS", "100"))
+# Repository fields the REST API and webhooks report as ISO strings, but push payloads as Unix timestamps
+TIMESTAMP_FIELDS = ("created_at", "updated_at", "pushed_at")
+
+
+def sign(body, secret):
+    """The X-Hub-Signature-256 header value GitHub sends for ``body``."""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body, secret, header):
+    return bool(header) and hmac.compare_digest(sign(body, secret), header)
+
+
+def iso_utc(value):
+    """ISO 8601 in UTC with a Z suffix, from an ISO string with any offset or a Unix timestamp."""
+    if isinstance(value, (int, float)):
+        moment = datetime.fromtimestamp(value, tz=timezone.utc)
+    else:
+        # fromisoformat only accepts a "Z" suffix from Python 3.11
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _metadata(repository):
+    repo = dict(repository)
+    for field in TIMESTAMP_FIELDS:
+        if repo.get(field) is not None:
+            repo[field] = iso_utc(repo[field])
+    return repo
+
+
+def _find_repo(snapshot, name):
+    return next((item for item in snapshot["repositories"] if item["metadata"].get("name") == name), None)
+
+
+def _commit_record(commit):
+    """A push-payload commit in the shape of the commits API, as stored under ``recent_commits``."""
+    author = commit.get("author") or {}
+    return {
+        "sha": commit["id"],
+        "html_url": commit.get("url"),
+        "commit": {
+            "message": commit.get("message", ""),
+            "author": {"name": author.get("name"), "email": author.get("email"), "date": iso_utc(commit["timestamp"])}
+        }
+    }
+
+
+def apply_push(snapshot, payload):
+    """Prepends new default-branch commits, keeps the file tree in sync and marks the README stale if it changed."""
+    repository = payload["repository"]
+    item = _find_repo(snapshot, repository["name"])
+    if item is None:
+        return []
+    metadata, details = item["metadata"], item["details"]
+    branch = metadata.get("default_branch") or repository.get("default_branch")
+    if payload.get("ref") != f"refs/heads/{branch}":
+        # The snapshot only holds default-branch history
+        return []
+
+    existing = details.get("recent_commits") or []
+    seen = {c.get("sha") for c in existing}
+    # Only commits not stored yet, so a redelivered push is a no-op
+    pushed = [c for c in payload.get("commits") or [] if c.get("id") not in seen and c.get("distinct", True)]
+    changes = []
+    if pushed:
+        # Push payloads list commits oldest first; the commits API (and the snapshot) newest first
+        new = [_commit_record(c) for c in reversed(pushed)]
+        details["recent_commits"] = (new + existing)[:WEBHOOK_MAX_COMMITS]
+        metadata["pushed_at"] = max(c["commit"]["author"]["date"] for c in new)
+        changes.append(f"{repository['name']}: {len(new)} new commit(s)")
+
+    tree = details.get("tree")
+    files = set(details.get("files") or [])
+    touched = set()
+    for commit in pushed:
+        added, removed = commit.get("added") or [], commit.get("removed") or []
+        touched.update(added, removed, commit.get("modified") or [])
+        if tree is not None:
+            tree = sorted((set(tree) | set(added)) - set(removed))
+        else:
+            # Root listing only: nested paths just tell us their top-level directory exists
+            files = (files | {p.split("/", 1)[0] for p in added}) - {p for p in removed if "/" not in p}
+    if tree is not None and tree != details["tree"]:
+        details["tree"] = tree
+        files = {p.split("/", 1)[0] for p in tree}
+    if sorted(files) != sorted(details.get("files") or []):
+        details["files"] = sorted(files)
+        changes.append(f"{repository['name']}: file list updated")
+    if any(is_readme_path(p) for p in touched) and not details.get("readme_stale"):
+        details["readme_stale"] = True
+        changes.append(f"{repository['name']}: README marked stale")
+    return changes
+
+
+def apply_repository(snapshot, payload):
+    """Adds, removes, renames or updates a repository's metadata."""
+    action = payload.get("action")
+    repository = payload["repository"]
+    name = repository["name"]
+    if action == "renamed":
+        name = payload.get("changes", {}).get("repository", {}).get("name", {}).get("from", name)
+    item = _find_repo(snapshot, name)
+
+    if action in ("deleted", "transferred"):
+        if item is None:
+            return []
+        snapshot["repositories"].remove(item)
+        return [f"{name}: removed ({action})"]
+    if item is None:
+        if action in ("created", "publicized"):
+            # Details need API calls; stale flags let refetch_stale fill them in
+            snapshot["repositories"].append({
+                "metadata": _metadata(repository),
+                "details": {"languages": {}, "readme": "", "recent_commits": [], "files": [],
+                            "readme_stale": True, "details_stale": True}
+            })
+            return [f"{repository['name']}: added"]
+        return []
+    metadata = _metadata(repository)
+    if all(item["metadata"].get(k) == v for k, v in metadata.items()):
+        return []
+    item["metadata"].update(metadata)
+    return [f"{repository['name']}: metadata updated ({action})"]
+
+
+def apply_star(snapshot, payload):
+    """Sets the star count from the payload, which carries the repository's current total."""
+    repository = payload["repository"]
+    item = _find_repo(snapshot, repository["name"])
+    if item is None or "stargazers_count" not in repository:
+        return []
+    metadata = item["metadata"]
+    if metadata.get("stargazers_count") == repository["stargazers_count"]:
+        return []
+    metadata["stargazers_count"] = repository["stargazers_count"]
+    metadata["watchers_count"] = repository.get("watchers_count", repository["stargazers_count"])
+    return [f"{repository['name']}: {repository['stargazers_count']} stars"]
+
+
+EVENT_HANDLERS = {
+    "push": apply_push,
+    "repository": apply_repository,
+    "star": apply_star
+}
+
+
+def apply_event(snapshot, event, payload):
+    """Applies one webhook delivery to a snapshot in place. Returns a list of change descriptions (empty if nothing changed)."""
+    handler = EVENT_HANDLERS.get(event)
+    if handler is None or not isinstance(payload.get("repository"), dict):
+        return []
+    return handler(snapshot, payload)
+
+
+def payload_owner(payload):
+    owner = (payload.get("repository") or {}).get("owner") or {}
+    # Push payloads carry both login and name for the owner; other events only login
+    return owner.get("login") or owner.get("name")
+
+
+class SnapshotUpdater:
+    """Applies webhook events to the stored per-user snapshots.
+
+    Each event is a load/apply/atomic-save cycle under a per-user lock, so
+    concurrent deliveries for one user never lose each other's changes.
+    Snapshots that do not exist yet are left alone: the first fetch
+    creates them.
+    """
+
+    def __init__(self, store=None, fetcher_factory=None):
+        self.store = store or SnapshotStore()
+        # username -> GitHubFetcher, used by refetch_stale; None disables refetching
+        self.fetcher_factory = fetcher_factory
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock_for(self, username):
+        with self._locks_lock:
+            return self._locks.setdefault(username.lower(), threading.Lock())
+
+    def handle(self, event, payload):
+        """Returns {"status": "applied" | "ignored", "username", "changes"}."""
+        username = payload_owner(payload)
+        result = {"status": "ignored", "username": username, "changes": []}
+        if not username or not USERNAME_RE.match(username) or event not in EVENT_HANDLERS:
+            return result
+        with get_tracer().span("webhook.apply", event=event), self._lock_for(username):
+            snapshot = self.store.load(username)
+            if snapshot is None:
+                return result
+            changes = apply_event(snapshot, event, payload)
+            if changes:
+                self.store.save(username, snapshot)
+        get_tracer().incr("webhook_events_total", event=event, applied=bool(changes))
+        result.update(status="applied" if changes else "ignored", changes=changes)
+        return result
+
+    def stale_repos(self, username, snapshot=None):
+        snapshot = snapshot or self.store.load(username) or {"repositories": []}
+        return [item["metadata"]["name"] for item in snapshot["repositories"]
+                if item["details"].get("readme_stale") or item["details"].get("details_stale")]
+
+    def refetch_stale(self, username):
+        """Fetches READMEs (or full details for new repos) flagged stale. Returns the number of repos refreshed."""
+        if self.fetcher_factory is None or not self.stale_repos(username):
+            return 0
+        fetcher = self.fetcher_factory(username)
+        # Network calls happen outside the lock; results are merged into the latest snapshot afterwards
+        fetched = {}
+        snapshot = self.store.load(username)
+        for name in self.stale_repos(username, snapshot):
+            item = _find_repo(snapshot, name)
+            if item["details"].get("details_stale"):
+                fetched[name] = fetcher.fetch_repo_details(name, default_branch=item["metadata"].get("default_branch"))
+            else:
+                fetched[name] = {"readme": fetcher.fetch_readme(name)}
+        with self._lock_for(username):
+            snapshot = self.store.load(username)
+            for name, details in fetched.items():
+                item = _find_repo(snapshot, name)
+                if item is not None:
+                    item["details"].update(details)
+                    item["details"].pop("readme_stale", None)
+                    item["details"].pop("details_stale", None)
+            self.store.save(username, snapshot)
+        return len(fetched)
+
+
+class WebhookServer:
+    """HTTP endpoint for GitHub webhook deliveries (``push``, ``repository``, ``star``; ``ping`` is acknowledged).
+
+    Verifies ``X-Hub-Signature-256`` when a secret is set, applies the event
+    through a SnapshotUpdater and answers with the changes as JSON. Stale
+    READMEs are refetched after the response is sent when the updater has a
+    fetcher. ``record_path`` appends every accepted delivery to a JSONL file
+    that replay_webhooks.py can post again later.
+    """
+
+    def __init__(self, updater=None, host="127.0.0.1", port=0, secret=GITHUB_WEBHOOK_SECRET, record_path=None):
+        self.updater = updater or SnapshotUpdater()
+        self.secret = secret
+        self.record_path = record_path
+        self._record_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _record(self, event, delivery, payload):
+        if not self.record_path:
+            return
+        with self._record_lock:
+            with open(self.record_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"event": event, "delivery": delivery, "payload": payload}) + "\n")
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, payload, status=200):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if server.secret and not verify_signature(body, server.secret, self.headers.get("X-Hub-Signature-256")):
+                    get_tracer().incr("webhook_rejected_total", reason="signature")
+                    self._send_json({"error": "invalid signature"}, status=401)
+                    return
+                event = self.headers.get("X-GitHub-Event", "")
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    self._send_json({"error": "invalid JSON"}, status=400)
+                    return
+                if event == "ping":
+                    self._send_json({"status": "pong"})
+                    return
+
+                server._record(event, self.headers.get("X-GitHub-Delivery"), payload)
+                try:
+                    result = server.updater.handle(event, payload)
+                except Exception as e:
+                    print(f"Error applying {event} event: {e}")
+                    self._send_json({"error": f"{type(e).__name__}: {e}"}, status=500)
+                    return
+                self._send_json(result, status=200 if result["status"] == "applied" else 202)
+                if result["status"] == "applied":
+                    try:
+                        server.updater.refetch_stale(result["username"])
+                    except Exception as e:
+                        print(f"Error refetching stale repos for {result['username']}: {e}")
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Receive GitHub webhooks and apply them to stored snapshots.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--record", default=None, help="Append received deliveries to this JSONL file")
+    parser.add_argument("--refetch", action="store_true", help="Refetch stale READMEs from GitHub (uses GITHUB_TOKEN)")
+    args = parser.parse_args()
+
+    factory = (lambda username: GitHubFetcher(username=username)) if args.refetch else None
+    receiver = WebhookServer(SnapshotUpdater(fetcher_factory=factory), host=args.host, port=args.port, record_path=args.record)
+    if not receiver.secret:
+        print("WARNING: GITHUB_WEBHOOK_SECRET is not set; deliveries are not verified.")
+    print(f"Webhook receiver listening on {receiver.url}")
+    receiver.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        receiver.stop()
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+from src.activity_stats import ActivityStats
+from src.data_collection import GitHubFetcher
+from src.synthetic_data import generate_snapshot
+from src.traditional_ds import TraditionalAnalyzer
+from test_traditional_ds import make_snapshot
+
+def batch_stats(data):
+    analyzer = TraditionalAnalyzer(columnar_cache=False)
+    analyzer._build_frames(data)
+    return analyzer.get_user_stats()
+
+class TestActivityStats(unittest.TestCase):
+    def test_matches_batch_stats(self):
+        for data in (make_snapshot(), generate_snapshot(n_repos=25, n_commits=2000, seed=3)):
+            self.assertEqual(ActivityStats.from_snapshot(data).stats(), batch_stats(data))
+
+    def test_ties_break_in_calendar_order(self):
+        data = make_snapshot()
+        # One commit on a Tuesday in February, seen first, and one on a Monday in January
+        data["repositories"][0]["details"]["recent_commits"] = [
+            {"commit": {"message": "Update", "author": {"name": "dev", "date": d}}} for d in ("2024-02-06T12:00:00Z", "2024-01-01T12:00:00Z")
+        ]
+        data["repositories"][1]["details"]["recent_commits"] = []
+        stats = ActivityStats.from_snapshot(data).stats()
+        self.assertEqual((stats["most_productive_day"], stats["most_active_month"]), ("Monday", "January"))
+        self.assertEqual(stats, batch_stats(data))
+        for seed in range(20):
+            small = generate_snapshot(n_repos=3, n_commits=12, seed=seed)
+            self.assertEqual(ActivityStats.from_snapshot(small).stats(), batch_stats(small), seed)
+
+    def test_merged_partials_match_whole(self):
+        data = generate_snapshot(n_repos=12, n_commits=600, seed=4)
+        parts = [ActivityStats.from_snapshot({"repositories": data["repositories"][i::3]}) for i in range(3)]
+        # Round-trip one part through plain data, as a worker process would
+        merged = ActivityStats.from_dict(parts[0].to_dict()).merge(parts[1]).merge(parts[2])
+        self.assertEqual(merged.stats(), batch_stats(data))
+
+    def test_streak_runs_join_out_of_order_days(self):
+        acc = ActivityStats()
+        for day in ("2024-03-01", "2024-03-03", "2024-03-05", "2024-03-04", "2024-03-02", "2024-03-02"):
+            acc.add_commit(f"{day}T12:00:00Z")
+        self.assertEqual(acc.longest_streak, 5)
+        self.assertEqual(acc.to_dict()["runs"], [[738946, 738950]])
+        self.assertEqual(acc.total_commits, 6)
+
+    def test_fetcher_feeds_accumulator_per_repo(self):
+        data = make_snapshot()
+        repos = [item["metadata"] for item in data["repositories"]]
+        details = {item["metadata"]["name"]: item["details"] for item in data["repositories"]}
+        fetcher = GitHubFetcher(username="dev", token="fake_token")
+        seen = []
+
+        with patch.object(GitHubFetcher, "fetch_user_profile", return_value=data["profile"]), \
+             patch.object(GitHubFetcher, "fetch_repositories", return_value=repos), \
+             patch.object(GitHubFetcher, "fetch_repo_details", side_effect=lambda name, **kwargs: details[name]), \
+             patch("src.data_collection.time.sleep"):
+            fetcher.fetch_all_data(progress_callback=lambda count, total, name: seen.append(fetcher.activity.total_commits))
+
+        self.assertEqual(seen, [0, 3, 4])
+        self.assertEqual(fetcher.activity.stats(), batch_stats(data))
+
+if __name__ == '__main__':
+    unittest.main()
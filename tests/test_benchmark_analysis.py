@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import benchmark_analysis
+from benchmark_analysis import run_analysis_benchmark, compare_results
+
+class TestAnalysisBenchmark(unittest.TestCase):
+    def test_runs_stages_and_caches_snapshot(self):
+        tiny = {"tiny": {"n_repos": 5, "n_commits": 50, "readme_chars": 100}}
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(benchmark_analysis.SCALES, tiny):
+            results = run_analysis_benchmark(scales=["tiny"], stages=["load_data", "load_columnar", "get_user_stats"], repeat=2, data_dir=tmp)
+            self.assertIn("tiny-seed0.json", os.listdir(tmp))
+
+        stages = results["scales"]["tiny"]["stages"]
+        self.assertEqual(set(stages), {"load_data", "load_columnar", "get_user_stats"})
+        self.assertEqual(stages["load_data"]["runs"], 2)
+        self.assertGreater(stages["load_data"]["peak_mb"], 0)
+
+    def test_compare_flags_slower_and_bigger_stages(self):
+        baseline = {"scales": {"small": {"stages": {"load_data": {"median_s": 1.0, "peak_mb": 10.0}}}}}
+        current = {"scales": {
+            "small": {"stages": {"load_data": {"median_s": 1.05, "peak_mb": 20.0}}},
+            "medium": {"stages": {"load_data": {"median_s": 9.0}}}
+        }}
+        regressions = compare_results(current, baseline, threshold=0.10)
+        self.assertEqual(regressions, ["small load_data peak_mb: 10.000 -> 20.000 (+100.0%)"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+from src.bulk_analysis import BulkAnalysisRunner, results_path_for
+
+def make_analyzer():
+    analyzer = MagicMock()
+    analyzer.classify_topic.return_value = "Web Development"
+    analyzer.extract_skills.return_value = "React"
+    analyzer.analyze_readme_quality.return_value = "- Add a License section"
+    return analyzer
+
+class TestBulkAnalysisRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self.tmp.name, "raw_data.json")
+        self.repos_df = pd.DataFrame([
+            {"name": "a", "description": "site", "readme_content": "# A\nReact app"},
+            {"name": "b", "description": "", "readme_content": ""},
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_are_persisted_next_to_snapshot(self):
+        runner = BulkAnalysisRunner(make_analyzer(), snapshot_path=self.snapshot)
+        runner.start(self.repos_df)
+        runner.wait(5)
+
+        self.assertEqual(runner.get_progress()["status"], "finished")
+        with open(results_path_for(self.snapshot), encoding="utf-8") as f:
+            stored = json.load(f)
+        self.assertEqual(stored["a"]["results"]["skills"], "React")
+        self.assertEqual(set(stored), {"a", "b"})
+
+    def test_unchanged_readmes_are_skipped_and_partial_runs_resume(self):
+        first = BulkAnalysisRunner(make_analyzer(), snapshot_path=self.snapshot)
+        first.start(self.repos_df)
+        first.wait(5)
+        # Simulate an interrupted run that never stored the checklist for "a"
+        del first.results["a"]["results"]["readme_checklist"]
+        first._save_results()
+
+        analyzer = make_analyzer()
+        second = BulkAnalysisRunner(analyzer, snapshot_path=self.snapshot)
+        self.assertEqual([(w[0], w[4]) for w in second.plan(self.repos_df)], [("a", ["readme_checklist"])])
+        second.start(self.repos_df)
+        second.wait(5)
+
+        self.assertEqual(second.get_progress()["skipped"], 1)
+        analyzer.classify_topic.assert_not_called()
+        analyzer.analyze_readme_quality.assert_called_once()
+
+    def test_failed_tasks_are_retried(self):
+        analyzer = make_analyzer()
+        # classify_topic returns None when Ollama is unreachable
+        analyzer.classify_topic.return_value = None
+        first = BulkAnalysisRunner(analyzer, snapshot_path=self.snapshot)
+        first.start(self.repos_df)
+        first.wait(5)
+        self.assertEqual(first.get_progress()["failed"], 2)
+        self.assertNotIn("topic", first.get_results()["a"])
+
+        second = BulkAnalysisRunner(make_analyzer(), snapshot_path=self.snapshot)
+        self.assertEqual([(w[0], w[4]) for w in second.plan(self.repos_df)], [("a", ["topic"]), ("b", ["topic"])])
+
+if __name__ == '__main__':
+    unittest.main()
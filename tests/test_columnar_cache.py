@@ -0,0 +1,39 @@
+import os
+import json
+import unittest
+import pandas as pd
+from src.columnar_cache import table_paths
+from src.traditional_ds import TraditionalAnalyzer
+from test_traditional_ds import TraditionalAnalyzerTestCase, make_snapshot
+
+class TestColumnarCache(TraditionalAnalyzerTestCase):
+    def test_second_load_is_memory_mapped(self):
+        self.assertTrue(all(os.path.exists(p) for p in table_paths(self.path).values()))
+
+        mapped = TraditionalAnalyzer(data_path=self.path)
+        self.assertTrue(mapped.load_data())
+        self.assertIsInstance(mapped.commits_df["date"].dtype, pd.ArrowDtype)
+        self.assertEqual(mapped.profile_data, self.analyzer.profile_data)
+        self.assertEqual(mapped.get_user_stats(), self.analyzer.get_user_stats())
+        self.assertEqual(mapped.get_timeline_events(), self.analyzer.get_timeline_events())
+        pd.testing.assert_frame_equal(mapped.get_repo_health_table().astype(str), self.analyzer.get_repo_health_table().astype(str))
+
+    def test_rewritten_snapshot_is_not_served_from_stale_tables(self):
+        data = make_snapshot()
+        data["repositories"].pop()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        reloaded = TraditionalAnalyzer(data_path=self.path)
+        self.assertTrue(reloaded.load_data())
+        self.assertEqual(len(reloaded.repos_df), 2)
+
+    def test_disabled_cache_writes_nothing(self):
+        for path in table_paths(self.path).values():
+            os.remove(path)
+        analyzer = TraditionalAnalyzer(data_path=self.path, columnar_cache=False)
+        self.assertTrue(analyzer.load_data())
+        self.assertFalse(any(os.path.exists(p) for p in table_paths(self.path).values()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.contribution_calendar import ContributionCalendar, get_calendar, heatmap_figure
+from src.synthetic_data import generate_snapshot
+from src.traditional_ds import TraditionalAnalyzer
+from test_traditional_ds import TraditionalAnalyzerTestCase
+
+def commits(rows):
+    return pd.DataFrame({"repo_name": [r for r, _ in rows], "date": pd.to_datetime([d for _, d in rows], utc=True)})
+
+class TestContributionCalendar(unittest.TestCase):
+    def test_counts_per_day(self):
+        calendar = ContributionCalendar.from_commits(commits([
+            ("a", "2024-03-01T10:00:00Z"), ("a", "2024-03-01T23:59:00Z"), ("b", "2024-03-03T00:00:00Z")
+        ]))
+        self.assertEqual(calendar.counts.tolist(), [2, 0, 1])
+        self.assertEqual(str(calendar.series().index[0].date()), "2024-03-01")
+        self.assertEqual(calendar.active_days(), 2)
+        self.assertEqual(calendar.busiest_day(), (pd.Timestamp("2024-03-01"), 2))
+
+    def test_matches_batch_stats(self):
+        analyzer = TraditionalAnalyzer(columnar_cache=False)
+        analyzer._build_frames(generate_snapshot(n_repos=20, n_commits=3000, seed=5))
+        calendar = ContributionCalendar.from_commits(analyzer.commits_df)
+        dates = analyzer.commits_df["date"]
+        self.assertEqual(calendar.total, len(dates))
+        self.assertEqual(calendar.weekday_totals().to_dict(), dates.dt.day_name().value_counts().to_dict())
+        self.assertEqual(calendar.month_totals()[lambda s: s > 0].to_dict(), dates.dt.month_name().value_counts().to_dict())
+
+    def test_streaks(self):
+        calendar = ContributionCalendar.from_commits(commits(
+            [("a", f"2024-03-0{d}T12:00:00Z") for d in (1, 2, 3, 5, 6)]
+        ))
+        self.assertEqual(calendar.longest_streak(), 3)
+        self.assertEqual(calendar.current_streak(), 2)
+        self.assertEqual(calendar.current_streak(as_of="2024-03-04"), 3)
+        self.assertEqual(calendar.current_streak(as_of="2024-03-10"), 0)
+
+    def test_update_adds_only_new_commits(self):
+        analyzer = TraditionalAnalyzer(columnar_cache=False)
+        analyzer._build_frames(generate_snapshot(n_repos=10, n_commits=800, seed=6))
+        full = analyzer.commits_df
+        calendar = ContributionCalendar.from_commits(full.sort_values("date").iloc[:500])
+        self.assertEqual(calendar.update(full), 300)
+        self.assertEqual(calendar.update(full), 0)
+        self.assertTrue(np.array_equal(calendar.counts, ContributionCalendar.from_commits(full).counts))
+
+    def test_update_keeps_days_that_left_the_snapshot(self):
+        calendar = ContributionCalendar.from_commits(commits([("a", "2024-01-01T00:00:00Z"), ("a", "2024-01-02T00:00:00Z")]))
+        # A refreshed snapshot only holds the latest commits per repo
+        calendar.update(commits([("a", "2024-01-02T00:00:00Z"), ("a", "2024-01-05T00:00:00Z")]))
+        self.assertEqual(calendar.total, 3)
+        self.assertEqual(calendar.longest_streak(), 2)
+
+    def test_update_adds_commits_older_than_the_latest(self):
+        def frame(rows):
+            return commits([(r, d) for r, d, _ in rows]).assign(sha=[sha for _, _, sha in rows])
+        first = [("a", "2024-03-01T12:00:00Z", "c1"), ("a", "2024-03-10T12:00:00Z", "c3")]
+        calendar = ContributionCalendar.from_commits(frame(first))
+        # A merged feature branch brings a commit authored before the repo's latest counted one
+        refreshed = frame(first + [("a", "2024-03-08T12:00:00Z", "c2")])
+        self.assertEqual(calendar.update(refreshed), 1)
+        self.assertEqual(calendar.update(refreshed), 0)
+        self.assertTrue(np.array_equal(calendar.counts, ContributionCalendar.from_commits(refreshed).counts))
+
+    def test_heatmap_grid(self):
+        calendar = ContributionCalendar.from_commits(commits([("a", "2016-01-01T12:00:00Z"), ("a", "2016-12-31T12:00:00Z")]))
+        z, dates = calendar.heatmap(2016)
+        self.assertEqual(z.shape, (7, 53))
+        # 2016-01-01 was a Friday: row 5 with Sunday as row 0
+        self.assertEqual(dates[5, 0], "2016-01-01")
+        self.assertEqual(z[5, 0], 1)
+        self.assertTrue(np.isnan(z[0, 0]))
+        self.assertEqual(np.nansum(z), 2)
+        self.assertEqual(np.count_nonzero(~np.isnan(z)), 366)
+        self.assertEqual(len(heatmap_figure(calendar, calendar.years()).data), 1)
+
+class TestSharedCalendar(TraditionalAnalyzerTestCase):
+    def test_registry_updates_on_new_version(self):
+        key = ("test", self.path)
+        calendar = get_calendar(key, self.analyzer.commits_df, 1)
+        self.assertEqual(calendar.total, 4)
+        self.assertIs(get_calendar(key, None, 1), calendar)
+        newer = commits([("beta", "2024-03-11T09:00:00Z")])
+        self.assertEqual(get_calendar(key, pd.concat([self.analyzer.commits_df, newer]), 2).total, 5)
+
+    def test_user_stats_come_from_the_calendar(self):
+        stats = self.analyzer.get_user_stats()
+        calendar = ContributionCalendar.from_commits(self.analyzer.commits_df)
+        self.assertEqual(stats["longest_streak"], 3)
+        self.assertEqual(stats["most_productive_day"], calendar.weekday_totals().idxmax())
+        self.assertEqual(stats["most_active_month"], calendar.month_totals().idxmax())
+
+if __name__ == '__main__':
+    unittest.main()
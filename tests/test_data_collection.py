@@ -2,6 +2,14 @@ import unittest
 from unittest.mock import patch, MagicMock
 from src.data_collection import GitHubFetcher
 
+def fake_github(responses):
+    """requests.get stand-in answering by URL suffix."""
+    def fake_get(url, headers=None, params=None):
+        response = MagicMock(status_code=200, content=b"{}")
+        response.json.return_value = next(v for k, v in responses.items() if url.endswith(k))
+        return response
+    return fake_get
+
 class TestGitHubFetcher(unittest.TestCase):
     @patch('src.data_collection.requests.get')
     def test_fetch_user_profile_success(self, mock_get):
@@ -29,5 +37,30 @@ class TestGitHubFetcher(unittest.TestCase):
         self.assertEqual(len(repos), 2)
         self.assertEqual(repos[0]["name"], "repo1")
 
+    @patch('src.data_collection.requests.get')
+    def test_tree_mode_lists_all_paths_in_one_request(self, mock_get):
+        tree = {"tree": [{"path": "apps"}, {"path": "apps/web/package.json"}, {"path": "docs/LICENSE"}], "truncated": False}
+        responses = {"languages": {"Python": 10}, "trees/main": tree, "commits": []}
+        mock_get.side_effect = fake_github(responses)
+
+        fetcher = GitHubFetcher(username="testuser", token="fake_token", tree_mode=True)
+        details = fetcher.fetch_repo_details("repo1", default_branch="main")
+
+        self.assertEqual(details["tree"], ["apps", "apps/web/package.json", "docs/LICENSE"])
+        self.assertEqual(details["files"], ["apps", "docs"])
+        # No README in the tree, so no readme request and no contents request
+        called = [c.args[0].split("/repo1/")[-1] for c in mock_get.call_args_list]
+        self.assertEqual(called, ["languages", "git/trees/main", "commits"])
+
+    @patch('src.data_collection.requests.get')
+    def test_truncated_tree_falls_back_to_root_listing(self, mock_get):
+        responses = {"git/trees/HEAD": {"tree": [], "truncated": True}, "contents": [{"name": "README.md"}],
+                     "readme": {}, "languages": {}, "commits": []}
+        mock_get.side_effect = fake_github(responses)
+
+        details = GitHubFetcher(username="testuser", token="fake_token", tree_mode=True).fetch_repo_details("repo1")
+        self.assertEqual(details["files"], ["README.md"])
+        self.assertNotIn("tree", details)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.downsampling import lttb, downsample_frame, line_figure
+
+class TestDownsampling(unittest.TestCase):
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        y = np.zeros(10_000)
+        y[4321] = 100.0
+        idx = lttb(np.arange(len(y)), y, 200)
+        self.assertEqual(len(idx), 200)
+        self.assertEqual((idx[0], idx[-1]), (0, 9999))
+        self.assertIn(4321, idx)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+
+    def test_frame_and_figure_stay_bounded(self):
+        df = pd.DataFrame({"ds": pd.date_range("2015-01-01", periods=5000, freq="D"), "yhat": np.random.rand(5000)})
+        df["yhat_lower"], df["yhat_upper"] = df["yhat"] - 1, df["yhat"] + 1
+        small = downsample_frame(df, "ds", "yhat", max_points=500)
+        self.assertEqual(len(small), 500)
+
+        fig = line_figure(df, "ds", "yhat", band=("yhat_lower", "yhat_upper"), max_points=1500, webgl_threshold=1000)
+        self.assertEqual(len(fig.data), 3)
+        self.assertTrue(all(trace.type == "scattergl" and len(trace.x) == 1500 for trace in fig.data))
+
+        short = line_figure(df.head(50), "ds", "yhat")
+        self.assertEqual(short.data[0].type, "scatter")
+
+if __name__ == '__main__':
+    unittest.main()
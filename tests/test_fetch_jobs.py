@@ -0,0 +1,55 @@
+import os
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from src.data_collection import GitHubFetcher
+from src.fetch_jobs import FetchJobManager
+
+class TestFetchJobs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "raw_data.json")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump({"profile": {"login": "old"}}, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch.object(GitHubFetcher, "fetch_all_data")
+    def test_finished_job_replaces_snapshot(self, mock_fetch):
+        mock_fetch.return_value = {"profile": {"login": "new"}, "repositories": [{}, {}]}
+        job = FetchJobManager().start("new", filename=self.filename)
+        job.wait(5)
+
+        self.assertEqual(job.state["status"], "finished")
+        self.assertEqual(job.state["total"], 2)
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["profile"]["login"], "new")
+        self.assertEqual(os.listdir(self.tmp.name), ["raw_data.json"])
+
+    @patch.object(GitHubFetcher, "fetch_all_data")
+    def test_cancelled_job_keeps_previous_snapshot(self, mock_fetch):
+        started = threading.Event()
+
+        def slow_fetch(progress_callback=None, cancel_event=None):
+            started.set()
+            cancel_event.wait(5)
+            return None
+
+        mock_fetch.side_effect = slow_fetch
+        manager = FetchJobManager()
+        job = manager.start("new", filename=self.filename)
+        started.wait(5)
+        # A second request for the same snapshot attaches to the running job
+        self.assertIs(manager.start("new", filename=self.filename), job)
+        manager.cancel(job.job_id)
+        job.wait(5)
+
+        self.assertEqual(job.state["status"], "cancelled")
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["profile"]["login"], "old")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from src.generation_profiles import OLLAMA_NUM_CTX, PROFILES, SENTIMENTS, get_profile, parse_response, request_args
+
+class TestGenerationProfiles(unittest.TestCase):
+    def test_request_args(self):
+        structured = request_args("sentiment", structured=True)
+        self.assertEqual(structured["format"]["properties"]["sentiment"]["enum"], SENTIMENTS)
+        self.assertNotIn("stop", structured["options"])
+        plain = request_args("sentiment", structured=False)
+        self.assertNotIn("format", plain)
+        self.assertEqual(plain["options"]["stop"], ["\n"])
+
+    def test_every_task_shares_one_context_size(self):
+        for task in list(PROFILES) + ["skills_map", "readme_quality_reduce", "unknown"]:
+            self.assertEqual(request_args(task)["options"]["num_ctx"], OLLAMA_NUM_CTX)
+        self.assertIs(get_profile("skills_map"), PROFILES["skills"])
+        self.assertIs(get_profile("unknown"), PROFILES["chat"])
+
+    def test_parse_json_answers(self):
+        self.assertEqual(parse_response("topic", '{"topic": "DevOps"}'), "DevOps")
+        self.assertEqual(parse_response("skills_map", '{"skills": ["Python", " python ", "Docker"]}'), ["Python", "Docker"])
+        self.assertEqual(parse_response("readme_quality_reduce", '{"improvements": ["Add a License section", ""]}'), ["Add a License section"])
+        self.assertEqual(parse_response("readme_quality_map", '{"sections": ["Usage"], "problems": []}'), {"sections": ["Usage"], "problems": []})
+
+    def test_parse_plain_text_answers(self):
+        self.assertEqual(parse_response("sentiment", "The sentiment is negative."), "Negative")
+        self.assertEqual(parse_response("topic", "Something else entirely"), "Other")
+        self.assertEqual(parse_response("user_title", '"The Rust Wizard"\nBecause...'), "The Rust Wizard")
+        self.assertEqual(parse_response("readme_quality", "1. Add usage\n- Add a license"), ["Add usage", "Add a license"])
+        self.assertEqual(parse_response("chat", "anything"), "anything")
+
+    def test_parse_json_cut_off_by_num_predict(self):
+        self.assertEqual(parse_response("skills", '{"skills": ["Python", "Django", "Rea'), ["Python", "Django"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import pandas as pd
+from src.language_matrix import LanguageMatrix, language_records
+from test_traditional_ds import TraditionalAnalyzerTestCase
+
+class TestLanguageMatrix(unittest.TestCase):
+    def setUp(self):
+        rows = language_records("web", {"JavaScript": 700, "CSS": 300}) + language_records("api", {"Python": 1000, "Shell": 0}) \
+            + language_records("ghost", {"Go": 5}) + language_records("broken", None)
+        self.matrix = LanguageMatrix.from_long(pd.DataFrame(rows), ["web", "api", "docs"])
+
+    def test_totals_share_and_top_language(self):
+        self.assertEqual(self.matrix.shape, (3, 4))
+        self.assertEqual(self.matrix.totals().to_dict(), {"Python": 1000, "JavaScript": 700, "CSS": 300, "Go": 0})
+        self.assertAlmostEqual(self.matrix.share()["CSS"], 0.15)
+        self.assertEqual(self.matrix.top_language(), "Python")
+        self.assertEqual(LanguageMatrix.from_long(None, ["x"]).top_language(), "Unknown")
+
+    def test_aggregate_and_concat(self):
+        by_group = self.matrix.aggregate(["frontend", "backend", "backend"])
+        self.assertEqual(by_group.loc["backend", "Python"], 1000)
+        self.assertEqual(by_group.loc["frontend", "JavaScript"], 700)
+
+        other = LanguageMatrix.from_long(pd.DataFrame(language_records("cli", {"Rust": 50, "Python": 10})), ["cli"])
+        org = LanguageMatrix.concat({"ada": self.matrix, "linus": other})
+        self.assertEqual(org.shape, (4, 5))
+        per_user = org.aggregate(org.repos.get_level_values(0))
+        self.assertEqual(per_user.loc["linus"].to_dict(), {"CSS": 0, "Go": 0, "JavaScript": 0, "Python": 10, "Rust": 50})
+        self.assertEqual(org.totals()["Python"], 1010)
+
+class TestAnalyzerLanguageMatrix(TraditionalAnalyzerTestCase):
+    def test_built_at_load_and_from_columnar_tables(self):
+        self.assertEqual(self.analyzer.get_basic_stats()["language_bytes"], {"Python": 200, "JavaScript": 100})
+        mapped = self.analyzer.__class__(data_path=self.path)
+        self.assertTrue(mapped.load_data())
+        self.assertEqual(mapped.get_language_share().round(3).to_dict(), {"Python": 0.667, "JavaScript": 0.333})
+        self.assertEqual(mapped.get_languages_over_time().loc[2023].to_dict(), {"JavaScript": 100, "Python": 200})
+
+if __name__ == '__main__':
+    unittest.main()
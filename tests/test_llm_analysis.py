@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import MagicMock
+from src.mock_ollama import MockOllamaServer
+from src.llm_analysis import OllamaAnalyzer, get_analyzer, get_client, parse_keep_alive
+
+def fake_client(*contents, done_reason="stop"):
+    client = MagicMock()
+    client.chat.side_effect = [
+        {"message": {"content": c}, "prompt_eval_count": 40, "eval_count": 7, "done_reason": done_reason, "total_duration": 2e8}
+        for c in contents
+    ]
+    return client
+
+class TestOllamaRegistry(unittest.TestCase):
+    def test_registry_reuses_clients_and_analyzers(self):
+        host = "http://registry-test:11434"
+        self.assertIs(get_client(host), get_client(host))
+        analyzer = get_analyzer("llama3.1", host=host)
+        self.assertIs(get_analyzer("llama3.1", host=host), analyzer)
+        # A different keep_alive gets its own analyzer and leaves the shared one alone
+        longer = get_analyzer("llama3.1", host=host, keep_alive="1h")
+        self.assertIsNot(longer, analyzer)
+        self.assertEqual(longer.keep_alive, "1h")
+        self.assertNotEqual(analyzer.keep_alive, "1h")
+        self.assertIs(longer.timings, analyzer.timings)
+        self.assertIs(get_analyzer("llama3.1", host=host, use_fast_path=False).client, analyzer.client)
+
+    def test_parse_keep_alive(self):
+        self.assertEqual(parse_keep_alive("-1"), -1)
+        self.assertEqual(parse_keep_alive("30m"), "30m")
+
+    def test_preload_separates_load_from_inference_time(self):
+        with MockOllamaServer(load_time=0.2, tokens_per_second=1000) as mock:
+            analyzer = get_analyzer("llama3.1", host=mock.url, use_fast_path=False)
+            load = analyzer.preload()
+            analyzer.analyze_sentiment("Refactored the parser")
+            report = analyzer.get_timing_report()
+        self.assertGreaterEqual(load, 0.2)
+        self.assertEqual(report["calls"], 1)
+        # The model was already warm, so the call itself paid no load time
+        self.assertAlmostEqual(report["load_seconds"], load, places=3)
+        self.assertGreater(report["inference_seconds"], 0)
+
+    def test_unreachable_llm_topic_is_none(self):
+        client = MagicMock()
+        client.chat.side_effect = ConnectionError("Connection refused")
+        analyzer = OllamaAnalyzer(client=client, use_fast_path=False)
+        self.assertIsNone(analyzer.classify_topic("A Django web app"))
+
+class TestGenerationProfiles(unittest.TestCase):
+    def test_structured_answers_are_parsed(self):
+        client = fake_client('{"sentiment": "Positive"}', '{"skills": ["Python", "Flask"]}', '{"improvements": ["Add a License"]}')
+        analyzer = OllamaAnalyzer(client=client, use_fast_path=False, structured_output=True)
+        self.assertEqual(analyzer.analyze_sentiment("Fix crash"), "Positive")
+        self.assertEqual(analyzer.extract_skills("# Tool", map_reduce=False), "Python, Flask")
+        self.assertEqual(analyzer.analyze_readme_quality("# Tool", map_reduce=False), "- Add a License")
+        kwargs = client.chat.call_args_list[0].kwargs
+        self.assertEqual(kwargs["options"]["num_predict"], 16)
+        self.assertEqual(kwargs["format"]["required"], ["sentiment"])
+
+    def test_token_usage_per_task(self):
+        analyzer = OllamaAnalyzer(client=fake_client("Neutral", "Neutral", '"Title"', done_reason="length"),
+                                  use_fast_path=False, structured_output=False)
+        analyzer.analyze_sentiment("a")
+        analyzer.analyze_sentiment("b")
+        analyzer.generate_user_title({})
+        report = analyzer.get_token_report()
+        self.assertEqual(report["sentiment"]["calls"], 2)
+        self.assertEqual(report["sentiment"]["eval_tokens"], 14)
+        self.assertEqual(report["sentiment"]["truncated"], 2)
+        self.assertAlmostEqual(report["user_title"]["avg_seconds"], 0.2)
+
+    def test_mock_server_respects_token_cap(self):
+        with MockOllamaServer(load_time=0, tokens_per_second=1000) as mock:
+            analyzer = OllamaAnalyzer(host=mock.url, use_fast_path=False, structured_output=False)
+            self.assertEqual(analyzer.analyze_sentiment("Refactored the parser"), "Neutral")
+        self.assertEqual(analyzer.get_token_report()["sentiment"]["eval_tokens"], 10)
+
+if __name__ == '__main__':
+    unittest.main()
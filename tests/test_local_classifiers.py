@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+from src.local_classifiers import LocalSentimentScorer, SkillMatcher, TopicClassifier
+from src.llm_analysis import OllamaAnalyzer
+
+class TestLocalClassifiers(unittest.TestCase):
+    def test_routine_commit_is_confidently_neutral(self):
+        label, confidence = LocalSentimentScorer().score("Initial commit")
+        self.assertEqual(label, "Neutral")
+        self.assertGreater(confidence, 0.9)
+
+    def test_skill_matcher_trusts_badges_and_install_lines(self):
+        readme = ("# Shop\n![Python](https://img.shields.io/badge/python-3.11-blue)\n![Django](https://img.shields.io/badge/django-5-green)\n"
+                  "```bash\ngit clone https://github.com/dev/shop\npip install -r requirements.txt\n```\nWe also use Redis.")
+        skills, confidence = SkillMatcher().match(readme)
+        self.assertEqual(skills, ["Python", "Django", "Redis"])
+        self.assertGreaterEqual(confidence, 0.7)
+
+    def test_skill_matcher_prose_mentions_are_not_confident(self):
+        skills, confidence = SkillMatcher().match("Built with React, Node.js and a sprinkle of Docker.\n\n    git clone repo")
+        self.assertEqual(skills, ["React", "Node.js", "Docker"])
+        self.assertLess(confidence, 0.7)
+        # Plain English words are not frameworks
+        self.assertEqual(SkillMatcher().match("How users react to rust on an express train")[0], [])
+
+    @patch('src.llm_analysis.LocalSentimentScorer')
+    @patch('src.llm_analysis.SkillMatcher')
+    @patch('src.llm_analysis.TopicClassifier')
+    @patch('src.llm_analysis.ollama.Client')
+    def test_disabled_fast_path_builds_no_classifiers(self, mock_client_cls, topic_cls, skill_cls, sentiment_cls):
+        analyzer = OllamaAnalyzer(use_fast_path=False)
+        analyzer.client.chat.return_value = {"message": {"content": "Other"}}
+        analyzer.analyze_sentiment("Fix")
+        analyzer.extract_skills("# readme", map_reduce=False)
+        analyzer.classify_topic("misc")
+        for cls in (topic_cls, skill_cls, sentiment_cls):
+            cls.assert_not_called()
+
+    def test_topic_classifier_picks_nearest_centroid(self):
+        topic, confidence = TopicClassifier().classify("Android app written in Kotlin")
+        self.assertEqual(topic, "Mobile App")
+        self.assertGreater(confidence, 0.5)
+
+    def test_topic_classifier_is_unsure_out_of_domain(self):
+        classifier = TopicClassifier()
+        # Each shares a single word with one topic's seeds, so that topic wins every margin
+        for description in ("Chess engine written in C", "Kotlin library for parsing JSON", "Compiler for a toy language"):
+            self.assertLess(classifier.classify(description)[1], 0.5, description)
+
+class TestFastPath(unittest.TestCase):
+    @patch('src.llm_analysis.ollama.Client')
+    def test_confident_local_answer_skips_llm(self, mock_client_cls):
+        analyzer = OllamaAnalyzer()
+        self.assertEqual(analyzer.analyze_sentiment("Initial commit"), "Neutral")
+        analyzer.client.chat.assert_not_called()
+        self.assertEqual(analyzer.get_tier_report()["sentiment"]["local_fraction"], 1.0)
+
+    @patch('src.llm_analysis.ollama.Client')
+    def test_low_confidence_falls_back_to_llm(self, mock_client_cls):
+        analyzer = OllamaAnalyzer()
+        analyzer.client.chat.return_value = {"message": {"content": " Data Science "}}
+        self.assertEqual(analyzer.classify_topic("misc things"), "Data Science")
+        analyzer.client.chat.assert_called_once()
+        report = analyzer.get_tier_report()["topic"]
+        self.assertEqual((report["local"], report["llm"]), (0, 1))
+
+    @patch('src.llm_analysis.ollama.Client')
+    def test_out_of_domain_topics_go_to_llm(self, mock_client_cls):
+        analyzer = OllamaAnalyzer()
+        analyzer.client.chat.return_value = {"message": {"content": "Other"}}
+        self.assertEqual(analyzer.classify_topic("Chess engine written in C"), "Other")
+        self.assertEqual(analyzer.classify_topic("Kotlin library for parsing JSON"), "Other")
+        self.assertEqual(analyzer.classify_topic("Flutter mobile app for tracking habits"), "Mobile App")
+        report = analyzer.get_tier_report()["topic"]
+        self.assertEqual((report["local"], report["llm"]), (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from src.path_index import PathIndex
+
+class TestPathIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PathIndex([
+            "README.md", ".github/CONTRIBUTING.md", "docs/LICENSE", "apps/web/package.json",
+            "node_modules/left-pad/package.json", "services/api/Dockerfile", ".github"
+        ])
+
+    def test_exact_and_prefix_lookups_ignore_case(self):
+        self.assertTrue(self.index.has("readme.MD"))
+        self.assertTrue(self.index.has_in_dirs("contributing.md", ("", ".github")))
+        self.assertFalse(self.index.has_in_dirs("LICENSE", ("",)))
+        self.assertTrue(self.index.has_prefix("apps/"))
+        self.assertFalse(self.index.has_prefix("lib/"))
+
+    def test_find_name_at_any_depth_skips_vendored(self):
+        self.assertEqual(self.index.find_name("package.json"), ["apps/web/package.json"])
+        self.assertEqual(self.index.find_name("package.json", skip_vendored=False),
+                         ["apps/web/package.json", "node_modules/left-pad/package.json"])
+        self.assertTrue(self.index.has_name("dockerfile"))
+        self.assertFalse(self.index.has_name("Dockerfile", max_depth=0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+from src.readme_chunking import split_markdown_sections, chunk_readme, merge_skill_lists, estimate_tokens
+from src.llm_analysis import OllamaAnalyzer
+
+README = """# Project
+Intro text.
+
+## Installation
+```bash
+# not a heading
+pip install project
+```
+
+## Usage
+Run it.
+"""
+
+class TestReadmeChunking(unittest.TestCase):
+    def test_split_on_headings_outside_code_fences(self):
+        sections = split_markdown_sections(README)
+        self.assertEqual(len(sections), 3)
+        self.assertTrue(sections[1].startswith("## Installation"))
+        self.assertIn("# not a heading", sections[1])
+
+    def test_chunks_respect_size_and_token_budget(self):
+        text = "".join(f"## Section {i}\n" + "word " * 400 + "\n" for i in range(50))
+        chunks = chunk_readme(text, max_chunk_tokens=300, token_budget=3000)
+        self.assertTrue(all(estimate_tokens(c) <= 300 for c in chunks))
+        self.assertLessEqual(sum(estimate_tokens(c) for c in chunks), 3000 + len(chunks))
+
+    def test_merge_skill_lists_deduplicates(self):
+        merged = merge_skill_lists(["Python, React", "react, Docker\n- Python"])
+        self.assertEqual(merged, "Python, React, Docker")
+
+class TestMapReduce(unittest.TestCase):
+    @patch('src.llm_analysis.ollama.Client')
+    def test_long_readme_is_mapped_per_chunk(self, mock_client_cls):
+        analyzer = OllamaAnalyzer(use_fast_path=False)
+        analyzer.client.chat.return_value = {"message": {"content": "Python, Flask"}}
+        long_readme = "".join(f"## Part {i}\n" + "text " * 500 + "\n" for i in range(6))
+
+        skills = analyzer.extract_skills(long_readme)
+
+        self.assertEqual(skills, "Python, Flask")
+        self.assertGreater(analyzer.client.chat.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from src.repo_forecasting import FORECAST_COLUMNS, RepoForecaster, repo_series
+from src.synthetic_data import write_snapshot
+from src.traditional_ds import TraditionalAnalyzer
+
+def weekly_commits(repo, weeks, per_week=2, start="2024-01-01"):
+    dates = [pd.Timestamp(start, tz="UTC") + pd.Timedelta(weeks=w, hours=h) for w in weeks for h in range(per_week)]
+    return pd.DataFrame({"repo_name": repo, "date": dates})
+
+class TestRepoSeries(unittest.TestCase):
+    def test_series_run_to_last_active_week(self):
+        commits = pd.concat([weekly_commits("busy", range(10)), weekly_commits("quiet", [0, 2])])
+        series = repo_series(commits)
+        self.assertEqual(list(series), ["busy", "quiet"])
+        self.assertEqual(len(series["busy"]), 10)
+        # "quiet" stopped after week 2 but runs to the same end, with zeros
+        self.assertEqual(series["quiet"].index[-1], series["busy"].index[-1])
+        self.assertEqual(series["quiet"].tolist(), [2, 0, 2] + [0] * 7)
+
+    def test_sparse_repos_are_skipped(self):
+        forecaster = RepoForecaster(min_commits=10, min_active_periods=4)
+        series = repo_series(pd.concat([weekly_commits("few", [0]), weekly_commits("bursty", [0, 1], per_week=6)]))
+        self.assertIn("commits", forecaster.sparse_reason(series["few"]))
+        self.assertIn("active periods", forecaster.sparse_reason(series["bursty"]))
+
+class TestRepoForecaster(unittest.TestCase):
+    def test_long_format_forecast(self):
+        fading = pd.concat([weekly_commits("fading", [w], per_week=20 - w) for w in range(20)])
+        commits = pd.concat([weekly_commits("busy", range(20), per_week=3), fading, weekly_commits("tiny", [0])])
+        forecaster = RepoForecaster(periods=4, max_workers=1)
+        frame = forecaster.forecast(commits)
+
+        self.assertEqual(list(frame.columns), FORECAST_COLUMNS)
+        self.assertEqual(sorted(frame["repo_name"].unique()), ["busy", "fading"])
+        self.assertEqual(list(forecaster.skipped), ["tiny"])
+        self.assertEqual(frame.groupby("repo_name")["is_forecast"].sum().tolist(), [4, 4])
+        self.assertTrue((frame["yhat_lower"] >= 0).all())
+
+        outlook = RepoForecaster.outlook(frame, periods=4)
+        self.assertEqual(outlook["repo_name"].iloc[0], "fading")
+
+    def test_process_pool_matches_serial(self):
+        commits = pd.concat([weekly_commits(f"r{i}", range(6 + i)) for i in range(3)])
+        serial = RepoForecaster(periods=2, max_workers=1).forecast(commits)
+        pooled = RepoForecaster(periods=2, max_workers=2).forecast(commits)
+        pd.testing.assert_frame_equal(serial, pooled)
+
+    def test_global_rng_is_left_alone(self):
+        np.random.seed(123)
+        expected = np.random.random()
+        np.random.seed(123)
+        RepoForecaster(periods=2, max_workers=1).forecast(weekly_commits("busy", range(8)))
+        self.assertEqual(np.random.random(), expected)
+
+    def test_empty(self):
+        self.assertEqual(list(RepoForecaster().forecast(None).columns), FORECAST_COLUMNS)
+        self.assertTrue(RepoForecaster.outlook(RepoForecaster().forecast(None)).empty)
+
+class TestForecastCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "dev.json")
+        write_snapshot(self.path, n_repos=3, n_commits=120, seed=1)
+        self.analyzer = TraditionalAnalyzer(data_path=self.path)
+        self.assertTrue(self.analyzer.load_data())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_cached_per_snapshot_and_parameters(self):
+        forecaster = RepoForecaster(periods=3, max_workers=1)
+        first = self.analyzer.forecast_by_repo(forecaster)
+        self.assertFalse(first.empty)
+        with patch.object(RepoForecaster, "forecast", side_effect=AssertionError("refit")):
+            pd.testing.assert_frame_equal(self.analyzer.forecast_by_repo(forecaster), first, check_dtype=False)
+        # Other parameters are not served from the cache
+        self.assertEqual(self.analyzer.forecast_by_repo(RepoForecaster(periods=5, max_workers=1))["is_forecast"].sum(),
+                         5 * first["repo_name"].nunique())
+
+    def test_cache_needs_columnar_cache_and_data_path_frames(self):
+        forecaster = RepoForecaster(periods=3, max_workers=1)
+        uncached = TraditionalAnalyzer(data_path=self.path, columnar_cache=False)
+        self.assertTrue(uncached.load_data())
+        # Frames built in memory (as load_history does) are not the data_path snapshot
+        built = TraditionalAnalyzer(data_path=self.path)
+        built._build_frames({"repositories": []})
+        built.commits_df = self.analyzer.commits_df
+        with patch("src.traditional_ds.read_sidecar") as read, patch("src.traditional_ds.write_sidecar") as write:
+            self.assertFalse(uncached.forecast_by_repo(forecaster).empty)
+            self.assertFalse(built.forecast_by_repo(forecaster).empty)
+        read.assert_not_called()
+        write.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import json
+import tempfile
+import unittest
+import pandas as pd
+from src.report_bundle import _render_html, build_bundle, load_bundle
+from test_traditional_ds import make_snapshot
+
+class TestReportBundle(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self.tmp.name, "raw_data.json")
+        with open(self.snapshot, "w", encoding="utf-8") as f:
+            json.dump(make_snapshot(), f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_bundle_round_trip(self):
+        bundle_dir = build_bundle(self.snapshot, out_dir=os.path.join(self.tmp.name, "reports"), forecast=False)
+
+        self.assertTrue(os.path.exists(os.path.join(bundle_dir, "report.html")))
+        bundle = load_bundle(bundle_dir, snapshot_path=self.snapshot)
+        self.assertEqual(bundle["manifest"]["user_stats"]["total_commits"], 4)
+        self.assertEqual(bundle["health"].set_index("name").loc["alpha", "stack"], ["Python"])
+        self.assertEqual(len(bundle["clusters"]), 3)
+
+    def test_stale_bundle_is_ignored(self):
+        bundle_dir = build_bundle(self.snapshot, out_dir=os.path.join(self.tmp.name, "reports"), forecast=False)
+        data = make_snapshot()
+        data["repositories"].pop()
+        with open(self.snapshot, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self.assertIsNone(load_bundle(bundle_dir, snapshot_path=self.snapshot))
+
+    def test_html_escapes_user_text(self):
+        manifest = {"stats": {}, "user_stats": {}, "persona": "<b>Night Owl</b>", "generated_at": "now",
+                    "snapshot_path": self.snapshot, "timeline": [{"date": "2024-01-01", "icon": "*", "title": "Created <script>x</script>"}]}
+        health = pd.DataFrame({"name": ["a"], "missing": [[]], "stack": [[]], "description": [""]})
+        html = _render_html("<img src=x>", manifest, {"health": health})
+        self.assertNotIn("<script>", html)
+        self.assertNotIn("<img", html)
+        self.assertNotIn("<b>Night", html)
+        self.assertIn("&lt;script&gt;", html)
+
+if __name__ == '__main__':
+    unittest.main()
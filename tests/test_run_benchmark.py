@@ -0,0 +1,23 @@
+import unittest
+import ollama
+from src.mock_ollama import MockOllamaServer
+from run_benchmark import timed_chat, compare_results, percentiles
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_timed_chat_against_mock_server(self):
+        with MockOllamaServer(load_time=0.0, tokens_per_second=1000) as mock:
+            sample = timed_chat(ollama.Client(host=mock.url), "mock", "hello there")
+        self.assertGreater(sample["eval_count"], 0)
+        self.assertGreater(sample["eval_tokens_per_sec"], 0)
+        self.assertLessEqual(sample["ttft"], sample["latency"])
+
+    def test_compare_flags_latency_and_throughput_regressions(self):
+        baseline = {"models": {"m": {"latency": percentiles([1.0]), "eval_tokens_per_sec": percentiles([100.0])}}}
+        current = {"models": {"m": {"latency": percentiles([1.5]), "eval_tokens_per_sec": percentiles([80.0])}}}
+        regressions = compare_results(current, baseline, threshold=0.10)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(any("eval_tokens_per_sec" in r for r in regressions))
+        self.assertTrue(regressions[0].startswith("m latency p50"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import copy
+import tempfile
+import unittest
+from src.snapshot_history import SnapshotHistory
+from src.traditional_ds import TraditionalAnalyzer
+from test_traditional_ds import make_snapshot
+
+class TestSnapshotHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = SnapshotHistory(root=self.tmp.name)
+        self.first = make_snapshot()
+        self.second = copy.deepcopy(self.first)
+        self.second["repositories"][0]["metadata"]["stargazers_count"] = 9
+        self.second["repositories"][1]["details"]["readme"] = "# beta, rewritten"
+        del self.second["repositories"][2]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_listing(self):
+        first_id = self.history.record(self.first, fetched_at=1000)
+        second_id = self.history.record(self.second, fetched_at=2000)
+
+        self.assertEqual([s["id"] for s in self.history.list("dev")], [first_id, second_id])
+        self.assertEqual(self.history.load("dev", first_id), self.first)
+        self.assertEqual(self.history.load("dev"), self.second)
+        self.assertIsNone(self.history.load("dev", "19700101T000000Z"))
+        self.assertIsNone(self.history.load("nobody"))
+
+    def test_unchanged_records_are_stored_once(self):
+        self.history.record(self.first, fetched_at=1000)
+        # 3 repo records, 1 shared README, 1 profile
+        self.assertEqual(self.history.storage_stats()["objects"], 5)
+
+        second_id = self.history.record(copy.deepcopy(self.first), fetched_at=1000)
+        self.assertEqual(self.history.storage_stats()["objects"], 5)
+        self.assertTrue(second_id.endswith("-1"))
+
+        # Only the repo whose stars changed and the new README are added
+        self.history.record(self.second, fetched_at=2000)
+        self.assertEqual(self.history.storage_stats()["objects"], 7)
+
+    def test_analyzer_loads_and_diffs_history(self):
+        first_id = self.history.record(self.first, fetched_at=1000)
+        self.history.record(self.second, fetched_at=2000)
+
+        old, new = TraditionalAnalyzer(), TraditionalAnalyzer()
+        self.assertTrue(old.load_history("dev", first_id, history=self.history))
+        self.assertTrue(new.load_history("dev", history=self.history))
+        self.assertEqual(len(old.repos_df), 3)
+
+        diff = TraditionalAnalyzer.diff_snapshots(old, new).set_index("name")
+        self.assertEqual(diff["status"].to_dict(), {"alpha": "changed", "beta": "changed", "gamma": "removed"})
+        self.assertEqual(diff.loc["alpha", "stars_delta"], 4)
+        self.assertTrue(diff.loc["beta", "readme_changed"])
+
+    def test_identical_snapshots_with_missing_values_are_unchanged(self):
+        snapshot = make_snapshot()
+        snapshot["repositories"][2]["metadata"].update(language=None, stargazers_count=None)
+        first_id = self.history.record(snapshot, fetched_at=1000)
+        second_id = self.history.record(copy.deepcopy(snapshot), fetched_at=2000)
+
+        old, new = TraditionalAnalyzer(), TraditionalAnalyzer()
+        self.assertTrue(old.load_history("dev", first_id, history=self.history))
+        self.assertTrue(new.load_history("dev", second_id, history=self.history))
+        self.assertTrue(old.repos_df["stars"].isna().any())
+        diff = TraditionalAnalyzer.diff_snapshots(old, new)
+        self.assertEqual(diff["status"].tolist(), ["unchanged"] * 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.snapshot_store import FILE_MODE, SnapshotStore, atomic_write_json, format_age
+
+class TestSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(root=os.path.join(self.tmp.name, "snapshots"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_and_load_per_user(self):
+        path = self.store.save("Octocat", {"profile": {"login": "Octocat"}})
+        self.store.save("hubot", {"profile": {"login": "hubot"}})
+
+        self.assertEqual(os.path.basename(path), "octocat.json")
+        self.assertEqual(self.store.load("octocat")["profile"]["login"], "Octocat")
+        self.assertEqual(self.store.load("hubot")["profile"]["login"], "hubot")
+        self.assertIsNone(self.store.load("nobody"))
+
+    def test_invalid_username_is_rejected(self):
+        for username in ("", "../etc/passwd", "a/b", "-leading", "x" * 40):
+            with self.assertRaises(ValueError):
+                self.store.path_for(username)
+
+    def test_failed_write_keeps_previous_file(self):
+        path = self.store.save("octocat", {"version": 1})
+        with patch("src.snapshot_store.json.dump", side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                atomic_write_json(path, {"version": 2})
+
+        self.assertEqual(self.store.load("octocat"), {"version": 1})
+        self.assertEqual(os.listdir(self.store.root), ["octocat.json"])
+
+    def test_written_files_follow_umask(self):
+        path = self.store.save("octocat", {"version": 1})
+        # Not mkstemp's 0600: other users (e.g. a separate dashboard account) can read snapshots when the umask allows
+        self.assertEqual(os.stat(path).st_mode & 0o777, FILE_MODE)
+
+    def test_index_lists_snapshots_freshest_first(self):
+        old = self.store.save("old", {})
+        self.store.save("new", {})
+        os.utime(old, (1, 1))
+        # Sidecars and temp files are not snapshots
+        with open(os.path.join(self.store.root, "new.analysis.json"), "w") as f:
+            json.dump({}, f)
+        open(os.path.join(self.store.root, "tmpabc.tmp"), "w").close()
+
+        index = self.store.index()
+        self.assertEqual([e["username"] for e in index], ["new", "old"])
+        self.assertGreater(index[1]["age_seconds"], index[0]["age_seconds"])
+
+    def test_format_age(self):
+        self.assertEqual(format_age(30), "30s")
+        self.assertEqual(format_age(600), "10m")
+        self.assertEqual(format_age(7200), "2h")
+        self.assertEqual(format_age(3 * 86400), "3d")
+
+if __name__ == '__main__':
+    unittest.main()
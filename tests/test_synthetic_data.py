@@ -0,0 +1,31 @@
+import os
+import json
+import tempfile
+import unittest
+from src.synthetic_data import generate_snapshot, write_snapshot
+from src.traditional_ds import TraditionalAnalyzer
+
+class TestSyntheticData(unittest.TestCase):
+    def test_snapshot_shape_and_scale(self):
+        data = generate_snapshot(n_repos=20, n_commits=500, readme_chars=300, seed=1)
+        repos = data["repositories"]
+        self.assertEqual(len(repos), 20)
+        self.assertEqual(sum(len(r["details"]["recent_commits"]) for r in repos), 500)
+        self.assertEqual(data["profile"]["login"], "synthetic")
+        for key in ("name", "stargazers_count", "language", "created_at", "updated_at"):
+            self.assertIn(key, repos[0]["metadata"])
+        self.assertEqual(generate_snapshot(n_repos=20, n_commits=500, readme_chars=300, seed=1), data)
+
+    def test_streamed_file_matches_in_memory_snapshot_and_loads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_snapshot(os.path.join(tmp, "bench", "s.json"), n_repos=10, n_commits=200, seed=2)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), generate_snapshot(n_repos=10, n_commits=200, seed=2))
+
+            analyzer = TraditionalAnalyzer(data_path=path)
+            self.assertTrue(analyzer.load_data())
+            self.assertEqual(len(analyzer.commits_df), 200)
+            self.assertEqual(analyzer.get_user_stats()["total_commits"], 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import copy
+import json
+import tempfile
+import unittest
+from src.team_analysis import TeamAnalyzer
+from test_traditional_ds import make_snapshot
+
+class TestTeamAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for login, extra_stars in (("dev", 0), ("Ada", 100)):
+            data = copy.deepcopy(make_snapshot())
+            data["profile"]["login"] = login
+            data["repositories"][0]["metadata"]["stargazers_count"] += extra_stars
+            path = os.path.join(self.tmp.name, f"{login.lower()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_compute_in_process_pool(self):
+        missing = os.path.join(self.tmp.name, "missing.json")
+        analyzer = TeamAnalyzer(self.paths + [missing], max_workers=2)
+        team = analyzer.compute()
+
+        self.assertEqual(team["login"].tolist(), ["Ada", "dev"])
+        self.assertEqual(list(analyzer.errors), [missing])
+        ada = team.iloc[0]
+        self.assertEqual(ada["stars"], 106)
+        self.assertEqual(ada["longest_streak"], 3)
+        self.assertEqual((ada["grade_A"], ada["grade_D"]), (1, 2))
+        self.assertEqual(ada["languages"], {"Python": 2, "JavaScript": 1})
+
+    def test_leaderboard_and_distributions(self):
+        team = TeamAnalyzer(self.paths, max_workers=1).compute()
+        self.assertEqual(TeamAnalyzer.leaderboard(team, "stars", n=1)["login"].tolist(), ["Ada"])
+
+        chronotypes = TeamAnalyzer.distribution(team, "chronotype")
+        self.assertEqual(chronotypes["users"].sum(), 2)
+
+        mix = TeamAnalyzer.language_mix(team)
+        self.assertAlmostEqual(mix[(mix.login == "dev") & (mix.language == "Python")]["share"].iloc[0], 2 / 3)
+        self.assertEqual(TeamAnalyzer.grade_distribution(team).to_dict(), {"A": 2, "B": 0, "C": 0, "D": 4})
+        self.assertEqual(TeamAnalyzer.language_bytes(team).aggregate(["org", "org"]).loc["org"].to_dict(),
+                         {"JavaScript": 200, "Python": 400})
+
+if __name__ == '__main__':
+    unittest.main()
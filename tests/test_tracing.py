@@ -0,0 +1,35 @@
+import os
+import json
+import tempfile
+import unittest
+from src.tracing import Tracer
+
+class TestTracer(unittest.TestCase):
+    def test_spans_counters_and_exports(self):
+        tracer = Tracer()
+        with tracer.span("github.request", endpoint="repos") as span:
+            span["bytes"] = 512
+        with self.assertRaises(ValueError):
+            with tracer.span("github.request", endpoint="readme"):
+                raise ValueError("boom")
+        tracer.incr("github_requests_total", status=200)
+        tracer.incr("github_requests_total", status=200)
+
+        row = tracer.summary()[0]
+        self.assertEqual((row["span"], row["count"], row["errors"]), ("github.request", 2, 1))
+
+        text = tracer.to_prometheus()
+        self.assertIn('span_duration_seconds_count{span="github.request"} 2', text)
+        self.assertIn('github_requests_total{status="200"} 2', text)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spans.jsonl")
+            self.assertEqual(tracer.export_jsonl(path), 2)
+            # Only new spans are appended on the next export
+            self.assertEqual(tracer.export_jsonl(path), 0)
+            with open(path, encoding="utf-8") as f:
+                first = json.loads(f.readline())
+            self.assertEqual(first["attrs"], {"endpoint": "repos", "bytes": 512})
+
+if __name__ == '__main__':
+    unittest.main()
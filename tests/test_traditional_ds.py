@@ -0,0 +1,81 @@
+import os
+import json
+import tempfile
+import unittest
+from src.traditional_ds import TraditionalAnalyzer
+
+def make_snapshot():
+    def repo(name, language, files, stars=0, dates=()):
+        return {
+            "metadata": {"name": name, "language": language, "stargazers_count": stars, "forks_count": 0, "size": 10,
+                         "created_at": "2023-01-01T00:00:00Z", "updated_at": "2024-01-01T00:00:00Z", "description": f"{name} repo"},
+            "details": {"readme": "# readme", "files": files, "languages": {language: 100},
+                        "recent_commits": [{"commit": {"message": "Update", "author": {"name": "dev", "date": d}}} for d in dates]}
+        }
+    return {
+        "profile": {"login": "dev", "created_at": "2020-01-01T00:00:00Z"},
+        "repositories": [
+            repo("alpha", "Python", ["README.md", "LICENSE", "CONTRIBUTING.md", ".gitignore", "requirements.txt"], 5,
+                 ["2024-03-01T10:00:00Z", "2024-03-02T11:00:00Z", "2024-03-03T12:00:00Z"]),
+            repo("beta", "JavaScript", ["README.md", "package.json", "Dockerfile"], 1, ["2024-03-10T22:00:00Z"]),
+            repo("gamma", "Python", [], 0),
+        ]
+    }
+
+class TraditionalAnalyzerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "raw_data.json")
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(make_snapshot(), f)
+        self.analyzer = TraditionalAnalyzer(data_path=self.path)
+        self.assertTrue(self.analyzer.load_data())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+class TestTraditionalAnalyzer(TraditionalAnalyzerTestCase):
+    def test_user_stats(self):
+        stats = self.analyzer.get_user_stats()
+        self.assertEqual(stats["total_commits"], 4)
+        self.assertEqual(stats["longest_streak"], 3)
+        self.assertEqual(stats["top_language"], "Python")
+
+    def test_repo_health_query_filters_sorts_and_pages(self):
+        table = self.analyzer.get_repo_health_table()
+        self.assertEqual(dict(zip(table["name"], table["grade"])), {"alpha": "A", "beta": "D", "gamma": "D"})
+
+        page, total = TraditionalAnalyzer.query_repo_health(table, grades=["D"], sort_by="stars", ascending=False, page=1, page_size=1)
+        self.assertEqual(total, 2)
+        self.assertEqual(page["name"].tolist(), ["beta"])
+
+        page, total = TraditionalAnalyzer.query_repo_health(table, stacks=["Docker"], languages=["JavaScript"])
+        self.assertEqual(page["name"].tolist(), ["beta"])
+
+    def test_null_language_is_unknown_on_both_load_paths(self):
+        data = make_snapshot()
+        data["repositories"][2]["metadata"]["language"] = None
+        data["repositories"][2]["details"]["languages"] = {}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        # The first load parses the JSON and writes the Arrow tables, the second reads them back
+        for _ in range(2):
+            analyzer = TraditionalAnalyzer(data_path=self.path)
+            self.assertTrue(analyzer.load_data())
+            table = analyzer.get_repo_health_table()
+            self.assertEqual(table["language"].tolist(), ["Python", "JavaScript", "Unknown"])
+            self.assertEqual(sorted(table["language"].unique()), ["JavaScript", "Python", "Unknown"])
+
+    def test_full_tree_finds_nested_community_files_and_manifests(self):
+        repo_data = {"details": {"files": ["README.md", ".github", "docs", "apps"], "tree": [
+            "README.md", ".gitignore", ".github/CONTRIBUTING.md", "docs/LICENSE", "apps/web/package.json", "apps/api/Dockerfile"
+        ]}}
+        self.assertEqual(self.analyzer.calculate_health_score(repo_data), {"grade": "A", "missing": [], "score": 4})
+        self.assertEqual(self.analyzer.detect_tech_stack(repo_data), ["Node.js", "Docker"])
+
+        # Without a tree only the root listing counts
+        del repo_data["details"]["tree"]
+        self.assertEqual(self.analyzer.calculate_health_score(repo_data)["score"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
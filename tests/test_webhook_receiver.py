@@ -0,0 +1,116 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import requests
+from replay_webhooks import load_deliveries, replay, sample_deliveries
+from src.snapshot_store import SnapshotStore
+from src.traditional_ds import TraditionalAnalyzer
+from src.webhook_receiver import SnapshotUpdater, WebhookServer, apply_event, sign, verify_signature
+from test_traditional_ds import make_snapshot
+
+def push(repo="alpha", ref="refs/heads/main", commits=()):
+    return {"ref": ref, "repository": {"name": repo, "owner": {"login": "dev", "name": "dev"}, "default_branch": "main",
+                                       "pushed_at": 1710150000}, "commits": list(commits)}
+
+def commit(sha, timestamp, added=(), removed=(), modified=()):
+    return {"id": sha, "message": f"commit {sha}", "timestamp": timestamp, "author": {"name": "dev"},
+            "added": list(added), "removed": list(removed), "modified": list(modified)}
+
+class TestApplyEvent(unittest.TestCase):
+    def test_push_prepends_new_commits_once(self):
+        snapshot = make_snapshot()
+        payload = push(commits=[commit("c1", "2024-03-11T09:00:00-05:00"), commit("c2", "2024-03-11T10:00:00-05:00")])
+        self.assertEqual(apply_event(snapshot, "push", payload), ["alpha: 2 new commit(s)"])
+        alpha = snapshot["repositories"][0]
+        self.assertEqual([c.get("sha") for c in alpha["details"]["recent_commits"][:2]], ["c2", "c1"])
+        self.assertEqual(alpha["details"]["recent_commits"][0]["commit"]["author"]["date"], "2024-03-11T15:00:00Z")
+        self.assertEqual(alpha["metadata"]["pushed_at"], "2024-03-11T15:00:00Z")
+        # Redelivery changes nothing
+        self.assertEqual(apply_event(snapshot, "push", payload), [])
+
+    def test_push_to_other_branch_is_ignored(self):
+        snapshot = make_snapshot()
+        self.assertEqual(apply_event(snapshot, "push", push(ref="refs/heads/feature", commits=[commit("c1", "2024-03-11T09:00:00Z")])), [])
+
+    def test_push_updates_files_and_marks_readme_stale(self):
+        snapshot = make_snapshot()
+        beta = snapshot["repositories"][1]
+        beta["details"]["tree"] = ["README.md", "Dockerfile", "package.json"]
+        changes = apply_event(snapshot, "push", push("beta", commits=[
+            commit("c1", "2024-03-11T09:00:00Z", added=["docs/LICENSE"], removed=["Dockerfile"], modified=["README.md"])
+        ]))
+        self.assertIn("beta: README marked stale", changes)
+        self.assertEqual(beta["details"]["tree"], ["README.md", "docs/LICENSE", "package.json"])
+        self.assertEqual(beta["details"]["files"], ["README.md", "docs", "package.json"])
+        self.assertTrue(beta["details"]["readme_stale"])
+
+    def test_repository_events(self):
+        snapshot = make_snapshot()
+        owner = {"login": "dev"}
+        apply_event(snapshot, "repository", {"action": "renamed", "changes": {"repository": {"name": {"from": "beta"}}},
+                                             "repository": {"name": "beta2", "owner": owner}})
+        apply_event(snapshot, "repository", {"action": "deleted", "repository": {"name": "gamma", "owner": owner}})
+        apply_event(snapshot, "repository", {"action": "created", "repository": {"name": "delta", "owner": owner,
+                                                                                 "created_at": 1710150000}})
+        self.assertEqual([r["metadata"]["name"] for r in snapshot["repositories"]], ["alpha", "beta2", "delta"])
+        self.assertEqual(snapshot["repositories"][2]["metadata"]["created_at"], "2024-03-11T09:40:00Z")
+        self.assertTrue(snapshot["repositories"][2]["details"]["details_stale"])
+
+    def test_star_sets_current_count(self):
+        snapshot = make_snapshot()
+        payload = {"action": "created", "repository": {"name": "alpha", "owner": {"login": "dev"}, "stargazers_count": 6}}
+        self.assertEqual(apply_event(snapshot, "star", payload), ["alpha: 6 stars"])
+        self.assertEqual(apply_event(snapshot, "star", payload), [])
+        self.assertEqual(snapshot["repositories"][0]["metadata"]["stargazers_count"], 6)
+
+    def test_signature(self):
+        self.assertTrue(verify_signature(b"{}", "s3cret", sign(b"{}", "s3cret")))
+        self.assertFalse(verify_signature(b"{}", "s3cret", sign(b"{}", "other")))
+        self.assertFalse(verify_signature(b"{}", "s3cret", None))
+
+class TestWebhookServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(root=os.path.join(self.tmp.name, "snapshots"))
+        self.store.save("dev", make_snapshot())
+        self.fetcher = MagicMock()
+        self.fetcher.fetch_readme.return_value = "# alpha v2"
+        self.updater = SnapshotUpdater(store=self.store, fetcher_factory=lambda username: self.fetcher)
+        self.record = os.path.join(self.tmp.name, "deliveries.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_replayed_samples_update_snapshot(self):
+        with WebhookServer(self.updater, secret="s3cret", record_path=self.record) as server:
+            results = replay(sample_deliveries("dev", "alpha"), server.url, secret="s3cret")
+            # Recorded deliveries replay to the same state: nothing left to change
+            again = replay(load_deliveries(self.record), server.url, secret="s3cret")
+        self.assertEqual([status for status, _ in results], [200, 200, 200])
+        self.assertEqual([status for status, _ in again], [202, 202, 202])
+
+        alpha = self.store.load("dev")["repositories"][0]
+        self.assertEqual(alpha["metadata"]["stargazers_count"], 1)
+        self.assertEqual(alpha["details"]["readme"], "# alpha v2")
+        self.assertNotIn("readme_stale", alpha["details"])
+        self.fetcher.fetch_readme.assert_called_once_with("alpha")
+
+        analyzer = TraditionalAnalyzer(data_path=self.store.path_for("dev"))
+        self.assertTrue(analyzer.load_data())
+        self.assertEqual(len(analyzer.commits_df), 5)
+
+    def test_bad_signature_and_unknown_user(self):
+        with WebhookServer(self.updater, secret="s3cret") as server:
+            rejected = replay(sample_deliveries("dev", "alpha")[:1], server.url, secret="wrong")
+            unknown = replay(sample_deliveries("someone", "alpha")[:1], server.url, secret="s3cret")
+            pong = requests.post(server.url, data=json.dumps({"zen": "hi"}),
+                                 headers={"X-GitHub-Event": "ping", "X-Hub-Signature-256": sign(b'{"zen": "hi"}', "s3cret")})
+        self.assertEqual(rejected[0][0], 401)
+        self.assertEqual(unknown[0], (202, {"status": "ignored", "username": "someone", "changes": []}))
+        self.assertEqual(pong.json(), {"status": "pong"})
+        self.assertEqual(len(self.store.load("dev")["repositories"][0]["details"]["recent_commits"]), 3)
+
+if __name__ == '__main__':
+    unittest.main()